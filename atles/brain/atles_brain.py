@@ -15,12 +15,16 @@ Safety Principles:
 import json
 import logging
 import uuid
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 import hashlib
 import os
 from pathlib import Path
+from types import MappingProxyType
+
+from .audit_sink import AuditLogBuffer, AuditLogSink
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -42,6 +46,53 @@ class ModificationType(Enum):
     CORE_LOGIC = "core_logic"                    # BLOCKED - never allowed
     SYSTEM_FILES = "system_files"                # BLOCKED - never allowed
 
+# Core safety rules are immutable, so every brain shares the same rule tables
+CORE_SAFETY_RULES = MappingProxyType({
+    "core_integrity": MappingProxyType({
+        "description": "Core system integrity must be maintained",
+        "enforcement": "automatic",
+        "modifiable": False
+    }),
+    "user_safety": MappingProxyType({
+        "description": "User safety is the highest priority",
+        "enforcement": "automatic",
+        "modifiable": False
+    }),
+    "no_harm": MappingProxyType({
+        "description": "System cannot cause harm to users or systems",
+        "enforcement": "automatic",
+        "modifiable": False
+    }),
+    "audit_required": MappingProxyType({
+        "description": "All modifications must be audited",
+        "enforcement": "automatic",
+        "modifiable": False
+    })
+})
+
+ROLLBACK_TRIGGERS = (
+    "safety_violation",
+    "system_instability",
+    "user_request",
+    "automatic_detection"
+)
+
+DEFAULT_MAX_ROLLBACK_POINTS = 10
+
+# In-memory tail kept for the audit log and modification history
+DEFAULT_AUDIT_TAIL_SIZE = 1000
+
+# Marker for state keys that did not exist before a modification
+_ABSENT = object()
+
+# State table and key field touched by each modification type
+MODIFICATION_TARGETS = {
+    ModificationType.BEHAVIOR_PREFERENCE: ("behavior_preferences", "preference_name"),
+    ModificationType.RESPONSE_STYLE: ("response_styles", "style_name"),
+    ModificationType.GOAL_PRIORITY: ("goal_priorities", "goal_name"),
+    ModificationType.SAFETY_RULES: ("custom_safety_rules", "rule_name")
+}
+
 class ATLESBrain:
     """
     ATLES Brain with Safety-First Self-Modification Capabilities.
@@ -50,13 +101,24 @@ class ATLESBrain:
     fully operational before any self-modification is allowed.
     """
     
-    def __init__(self, user_id: str, safety_enabled: bool = True):
+    def __init__(self, user_id: str, safety_enabled: bool = True, shared_components: bool = False,
+                 audit_log_dir: Optional[str] = None, audit_tail_size: int = DEFAULT_AUDIT_TAIL_SIZE,
+                 compress_audit_log: bool = False):
         """
         Initialize ATLES Brain with safety controls.
         
         Args:
             user_id: Unique identifier for the user
             safety_enabled: Whether safety system is active (default: True)
+            shared_components: Lightweight mode for auxiliary brains. The
+                metacognitive observer is created on first use instead of
+                at construction (default: False)
+            audit_log_dir: Directory for the persistent JSONL audit trail.
+                When omitted only the in-memory tail is kept (default: None)
+            audit_tail_size: Number of recent audit and modification history
+                entries kept in memory (default: 1000)
+            compress_audit_log: Gzip audit segments when they are rotated
+                (default: False)
         """
         self.brain_id = str(uuid.uuid4())
         self.user_id = user_id
@@ -69,10 +131,15 @@ class ATLESBrain:
         self.safety_violations = 0
         self.max_safety_violations = 3
         
+        # Audit Trail (recent entries in memory, full trail on disk if configured)
+        self.audit_sink = AuditLogSink(audit_log_dir, compress=compress_audit_log) if audit_log_dir else None
+        self.audit_log = AuditLogBuffer(audit_tail_size, self.audit_sink, "audit")
+        
         # Modification Tracking
-        self.modification_history = []
+        self.modification_history = AuditLogBuffer(audit_tail_size, self.audit_sink, "modification_history")
         self.current_modifications = {}
-        self.rollback_points = []
+        self.rollback_points = deque(maxlen=DEFAULT_MAX_ROLLBACK_POINTS)
+        self._frozen_tables = {}
         
         # Capability Restrictions
         self.allowed_modifications = {
@@ -97,12 +164,11 @@ class ATLESBrain:
         # Safety Validation Rules
         self.safety_rules = self._initialize_safety_rules()
         
-        # Audit Trail
-        self.audit_log = []
-        
         # Metacognitive Observer Integration
-        self.metacognitive_observer = None
+        self._metacognitive_observer = None
+        self._metacognition_pending = False
         self.metacognition_enabled = False
+        self.shared_components = shared_components
         
         # Performance tracking for metacognition
         self.performance_metrics = {
@@ -122,32 +188,30 @@ class ATLESBrain:
         
         # Initialize metacognitive capabilities if safety is enabled
         if self.safety_enabled:
+            if shared_components:
+                # Defer observer creation until something actually reads it
+                self._metacognition_pending = True
+                self.metacognition_enabled = True
+            else:
+                self._initialize_metacognitive_system()
+    
+    @property
+    def metacognitive_observer(self):
+        """Metacognitive observer, created on first access in shared-component mode."""
+        if self._metacognition_pending:
+            self._metacognition_pending = False
             self._initialize_metacognitive_system()
+        return self._metacognitive_observer
+    
+    @metacognitive_observer.setter
+    def metacognitive_observer(self, observer):
+        self._metacognition_pending = False
+        self._metacognitive_observer = observer
     
     def _initialize_safety_rules(self) -> Dict[str, Any]:
         """Initialize core safety rules that cannot be modified."""
-        return {
-            "core_integrity": {
-                "description": "Core system integrity must be maintained",
-                "enforcement": "automatic",
-                "modifiable": False
-            },
-            "user_safety": {
-                "description": "User safety is the highest priority",
-                "enforcement": "automatic",
-                "modifiable": False
-            },
-            "no_harm": {
-                "description": "System cannot cause harm to users or systems",
-                "enforcement": "automatic",
-                "modifiable": False
-            },
-            "audit_required": {
-                "description": "All modifications must be audited",
-                "enforcement": "automatic",
-                "modifiable": False
-            }
-        }
+        # The rule tables themselves are shared and read-only; only the index is per-brain
+        return dict(CORE_SAFETY_RULES)
     
     def _initialize_safety_system(self):
         """Initialize the safety monitoring system."""
@@ -212,14 +276,9 @@ class ATLESBrain:
         """Set up automatic rollback mechanisms."""
         self.rollback_system = {
             "active": True,
-            "max_rollback_points": 10,
+            "max_rollback_points": DEFAULT_MAX_ROLLBACK_POINTS,
             "auto_rollback_on_violation": True,
-            "rollback_triggers": [
-                "safety_violation",
-                "system_instability",
-                "user_request",
-                "automatic_detection"
-            ]
+            "rollback_triggers": ROLLBACK_TRIGGERS
         }
     
     def _initialize_audit_system(self):
@@ -483,31 +542,77 @@ class ATLESBrain:
             "id": rollback_id,
             "timestamp": datetime.now(),
             "modification_type": modification_type.value,
-            "previous_state": self._capture_current_state(),
+            "previous_state": self._capture_current_state(modification_type, modification_data),
             "modification_data": modification_data.copy(),
             "safety_level": self.safety_level.value
         }
         
-        # Store rollback point
+        # Store rollback point (oldest points are evicted automatically)
         self.rollback_points.append(rollback_point)
         
-        # Maintain rollback point limit
-        if len(self.rollback_points) > self.rollback_system["max_rollback_points"]:
-            self.rollback_points.pop(0)
-        
         logger.info(f"Rollback point created: {rollback_id}")
         return rollback_point
     
-    def _capture_current_state(self) -> Dict[str, Any]:
-        """Capture current system state for rollback."""
+    def _capture_current_state(self, modification_type: Optional[ModificationType] = None,
+                               modification_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Capture current system state for rollback.
+        
+        Only the keys the modification will touch are recorded, and unchanged
+        rule tables are shared between rollback points, so capture cost does
+        not grow with modification history.
+        """
         return {
             "safety_level": self.safety_level.value,
             "safety_violations": self.safety_violations,
-            "safety_rules": self.safety_rules.copy(),
-            "allowed_modifications": self.allowed_modifications.copy(),
+            "safety_rules": self._frozen_table("safety_rules"),
+            "allowed_modifications": self._frozen_table("allowed_modifications"),
+            "changes": self._capture_changes(modification_type, modification_data),
             "timestamp": datetime.now()
         }
     
+    def _frozen_table(self, name: str) -> MappingProxyType:
+        """Read-only snapshot of a state table, reused while the table is unchanged."""
+        current = getattr(self, name)
+        frozen = self._frozen_tables.get(name)
+        if frozen is None or frozen != current:
+            frozen = MappingProxyType(dict(current))
+            self._frozen_tables[name] = frozen
+        return frozen
+    
+    def _capture_changes(self, modification_type: Optional[ModificationType],
+                         modification_data: Optional[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+        """Record the previous value of each state key a modification will overwrite."""
+        target = MODIFICATION_TARGETS.get(modification_type)
+        if not target or not modification_data or target[1] not in modification_data:
+            return []
+        
+        table_name, key_field = target
+        key = modification_data[key_field]
+        table = getattr(self, table_name, None) or {}
+        return [(table_name, key, table.get(key, _ABSENT))]
+    
+    def _restore_changes(self, changes: List[Tuple[str, str, Any]]):
+        """Undo recorded changes in reverse order."""
+        for table_name, key, previous_value in reversed(changes):
+            table = getattr(self, table_name, None)
+            if previous_value is _ABSENT:
+                if table is not None:
+                    table.pop(key, None)
+            else:
+                if table is None:
+                    table = {}
+                    setattr(self, table_name, table)
+                table[key] = previous_value
+    
+    def _restore_state(self, previous_state: Dict[str, Any]):
+        """Restore captured safety state and undo recorded changes."""
+        self.safety_level = SafetyLevel(previous_state["safety_level"])
+        self.safety_violations = previous_state["safety_violations"]
+        self.safety_rules = dict(previous_state["safety_rules"])
+        self.allowed_modifications = dict(previous_state["allowed_modifications"])
+        self._restore_changes(previous_state.get("changes", []))
+    
     def _execute_safe_modification(self, modification_type: ModificationType, modification_data: Dict[str, Any], rollback_point: Dict[str, Any]) -> Dict[str, Any]:
         """Execute modification with safety monitoring."""
         try:
@@ -676,12 +781,7 @@ class ATLESBrain:
             logger.warning(f"Automatic rollback triggered: {reason}")
             
             # Restore previous state
-            previous_state = rollback_point["previous_state"]
-            
-            self.safety_level = SafetyLevel(previous_state["safety_level"])
-            self.safety_violations = previous_state["safety_violations"]
-            self.safety_rules = previous_state["safety_rules"].copy()
-            self.allowed_modifications = previous_state["allowed_modifications"].copy()
+            self._restore_state(rollback_point["previous_state"])
             
             # Log rollback
             self._log_rollback(rollback_point, reason)
@@ -700,6 +800,58 @@ class ATLESBrain:
             self.safety_level = SafetyLevel.BLOCKED
             self.safety_enabled = False
     
+    def rollback_to_point(self, rollback_point_id: str, reason: str = "user_request") -> Dict[str, Any]:
+        """
+        Roll back every modification made since a rollback point was created.
+        
+        Later rollback points are undone newest first, so the cost is
+        proportional to the number of keys changed since that point.
+        
+        Args:
+            rollback_point_id: ID returned in a successful modification response
+            reason: Reason recorded in the audit trail
+            
+        Returns:
+            Dict containing success status and safety information
+        """
+        points = list(self.rollback_points)
+        target_index = next((i for i, point in enumerate(points) if point["id"] == rollback_point_id), None)
+        if target_index is None:
+            return self._create_safety_response(
+                success=False,
+                reason=f"Rollback point not available: {rollback_point_id}",
+                safety_level=self.safety_level
+            )
+        
+        try:
+            undone = points[target_index:]
+            for point in reversed(undone):
+                self._restore_changes(point["previous_state"].get("changes", []))
+            
+            target = points[target_index]
+            self._restore_state(target["previous_state"])
+            
+            # Points after the target no longer describe reachable states
+            for _ in undone:
+                self.rollback_points.pop()
+            
+            self._log_rollback(target, reason)
+            
+            return self._create_safety_response(
+                success=True,
+                reason=f"Rolled back {len(undone)} modification(s)",
+                safety_level=self.safety_level
+            )
+            
+        except Exception as e:
+            logger.error(f"Rollback to point failed: {e}")
+            self.safety_level = SafetyLevel.BLOCKED
+            return self._create_safety_response(
+                success=False,
+                reason=f"Rollback failed: {str(e)}",
+                safety_level=SafetyLevel.BLOCKED
+            )
+    
     def _log_modification_attempt(self, modification_type: ModificationType, modification_data: Dict[str, Any]):
         """Log modification attempt for audit trail."""
         log_entry = {
@@ -789,8 +941,9 @@ class ATLESBrain:
             "allowed_modifications": self.allowed_modifications,
             "human_approval_required": self.human_approval_required,
             "rollback_points_available": len(self.rollback_points),
-            "audit_log_entries": len(self.audit_log),
-            "modification_history_count": len(self.modification_history)
+            "audit_log_entries": self.audit_log.total_entries,
+            "modification_history_count": self.modification_history.total_entries,
+            "audit_sink": self.audit_sink.get_status() if self.audit_sink else None
         }
     
     def get_metacognitive_status(self) -> Dict[str, Any]:
@@ -881,9 +1034,31 @@ class ATLESBrain:
                 "status": f"Error retrieving report: {str(e)}"
             }
     
-    def get_audit_log(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get audit log entries (limited for security)."""
-        return self.audit_log[-limit:] if limit > 0 else self.audit_log.copy()
+    def get_audit_log(self, limit: int = 100, start: Any = None, end: Any = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get audit log entries (limited for security).
+        
+        Without a time range the most recent in-memory entries are returned.
+        With ``start``/``end`` the persistent trail is paged oldest first,
+        skipping ``offset`` matching entries.
+        """
+        if start is None and end is None:
+            return self.audit_log.tail(limit if limit > 0 else None)
+        
+        if self.audit_sink:
+            self.audit_sink.flush()
+            return self.audit_sink.read(start, end, "audit", limit if limit > 0 else None, offset)
+        
+        return self.audit_log.between(start, end, limit if limit > 0 else None, offset)
+    
+    def close_audit_log(self):
+        """Write pending audit entries and close the persistent audit trail."""
+        if self.audit_sink:
+            # Later entries stay in the in-memory tail only
+            self.audit_log.sink = None
+            self.modification_history.sink = None
+            self.audit_sink.close()
     
     def emergency_shutdown(self, reason: str = "Emergency shutdown requested"):
         """Emergency shutdown of the ATLES Brain."""
@@ -903,6 +1078,8 @@ class ATLESBrain:
         }
         
         self.audit_log.append(shutdown_log)
+        if self.audit_sink:
+            self.audit_sink.flush()
         
         # Return shutdown status
         return {
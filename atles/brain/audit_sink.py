@@ -0,0 +1,446 @@
+"""
+Audit Sink: Append-Only JSONL Audit Trail for ATLES Brain
+
+This module persists the ATLES Brain audit trail and modification history
+without keeping them in memory. Records are handed to a background writer
+thread in batches and appended to rotating JSONL segment files, which can be
+gzip-compressed when they are rotated out. A small JSON index records the time
+span and sparse byte offsets of every segment, so the reader can page through
+a time range by seeking into the relevant segments instead of loading whole
+files.
+
+The brain itself only keeps a fixed-size tail of recent records in memory
+(see AuditLogBuffer).
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Defaults for segment rotation and batching
+DEFAULT_MAX_SEGMENT_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 20
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# A byte offset is indexed every this many records
+INDEX_STRIDE = 256
+
+INDEX_FILENAME = "index.json"
+
+_STOP = object()
+
+
+def _to_epoch(timestamp: Any) -> float:
+    """Convert a datetime, ISO string or number to epoch seconds."""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, str):
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except ValueError:
+            return time.time()
+    return float(timestamp)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the non-JSON types found in audit entries."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class AuditLogSink:
+    """
+    Rotating, optionally compressed JSONL sink with a batched background writer.
+
+    Records are written in submission order. Each record is stored as
+    ``{"stream": ..., "ts": ..., "entry": ...}`` so several logical logs
+    (e.g. the audit log and the modification history) can share one sink.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+                 max_segments: Optional[int] = DEFAULT_MAX_SEGMENTS,
+                 compress: bool = False,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 prefix: str = "audit"):
+        if max_segment_bytes <= 0:
+            raise ValueError("Segment size must be positive")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.compress = compress
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.prefix = prefix
+
+        self.records_written = 0
+        self.write_errors = 0
+        self.dropped_records = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._segments: List[Dict[str, Any]] = self._load_index()
+        self._active: Optional[Dict[str, Any]] = None
+        self._file = None
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name=f"{prefix}-sink-writer", daemon=True)
+        self._writer.start()
+
+    # Writing
+
+    def write(self, entry: Dict[str, Any], stream: str = "audit"):
+        """
+        Serialize a record and queue it for the background writer.
+
+        The record is serialized here, on the caller's thread, so later
+        changes to the entry cannot race with the writer. Records written
+        after close() are dropped with a warning.
+        """
+        if self._closed:
+            self.dropped_records += 1
+            logger.warning(f"Audit sink is closed, dropping {stream} record")
+            return
+        epoch = _to_epoch(entry.get("timestamp") if isinstance(entry, dict) else None)
+        line = json.dumps({"stream": stream, "ts": epoch, "entry": entry}, default=_json_default)
+        self._queue.put((epoch, (line + "\n").encode("utf-8")))
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write outstanding records, close the active segment and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            records = [item for item in batch if item is not _STOP]
+            try:
+                if records:
+                    self._write_batch(records)
+                if stop:
+                    self._close_active()
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(f"Audit sink write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _write_batch(self, records: List[Any]):
+        if self._file is None:
+            self._open_segment()
+
+        segment = self._active
+        lines = []
+        offsets = []
+        position = segment["bytes"]
+        count = segment["count"]
+        first_ts = segment["first_ts"]
+        last_ts = segment["last_ts"]
+        for epoch, data in records:
+            if count % INDEX_STRIDE == 0:
+                offsets.append([epoch, position])
+            if first_ts is None:
+                first_ts = epoch
+            last_ts = epoch
+            count += 1
+            position += len(data)
+            lines.append(data)
+
+        self._file.write(b"".join(lines))
+        self._file.flush()
+
+        # Publish the batch to readers only once it is on disk
+        with self._lock:
+            segment["offsets"].extend(offsets)
+            segment["first_ts"] = first_ts
+            segment["last_ts"] = last_ts
+            segment["count"] = count
+            segment["bytes"] = position
+            self.records_written += len(records)
+        self._save_index()
+
+        if segment["bytes"] >= self.max_segment_bytes:
+            self._close_active()
+
+    def _open_segment(self):
+        number = max((s["number"] for s in self._segments), default=0) + 1
+        name = f"{self.prefix}-{number:06d}.jsonl"
+        segment = {
+            "number": number,
+            "file": name,
+            "compressed": False,
+            "active": True,
+            "first_ts": None,
+            "last_ts": None,
+            "count": 0,
+            "bytes": 0,
+            "offsets": []
+        }
+        self._file = open(os.path.join(self.directory, name), "ab")
+        with self._lock:
+            self._segments.append(segment)
+            self._active = segment
+        self._prune_segments()
+
+    def _close_active(self):
+        """Close the active segment, compressing and pruning as configured."""
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        segment = self._active
+
+        if self.compress and segment["count"]:
+            source = os.path.join(self.directory, segment["file"])
+            target = source + ".gz"
+            with open(source, "rb") as src, gzip.open(target, "wb") as dst:
+                while True:
+                    chunk = src.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+            with self._lock:
+                segment["file"] = segment["file"] + ".gz"
+                segment["compressed"] = True
+            os.remove(source)
+
+        with self._lock:
+            segment["active"] = False
+            self._active = None
+        self._prune_segments()
+        self._save_index()
+
+    def _prune_segments(self):
+        if not self.max_segments:
+            return
+        with self._lock:
+            excess = len(self._segments) - self.max_segments
+            removed, self._segments = self._segments[:max(0, excess)], self._segments[max(0, excess):]
+        for segment in removed:
+            try:
+                os.remove(os.path.join(self.directory, segment["file"]))
+            except OSError:
+                pass
+
+    # Index
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self._index_path):
+            return []
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                segments = json.load(f).get("segments", [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Audit index unreadable, starting a new one: {e}")
+            return []
+
+        # A segment left active by a previous process is treated as closed
+        for segment in segments:
+            segment["active"] = False
+        return segments
+
+    def _save_index(self):
+        with self._lock:
+            data = json.dumps({"segments": self._segments})
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(temp_path, self._index_path)
+
+    # Reading
+
+    def read(self,
+             start: Any = None,
+             end: Any = None,
+             stream: Optional[str] = "audit",
+             limit: Optional[int] = 100,
+             offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Read records in a time range, oldest first.
+
+        Args:
+            start: Inclusive lower bound (datetime, ISO string or epoch)
+            end: Inclusive upper bound (datetime, ISO string or epoch)
+            stream: Only return records of this stream (None for all)
+            limit: Maximum number of entries to return (None for no limit)
+            offset: Number of matching entries to skip, for paging
+        """
+        results = []
+        skipped = 0
+        for record in self.iter_records(start, end, stream):
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(record["entry"])
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def iter_records(self, start: Any = None, end: Any = None,
+                     stream: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream stored records in a time range without loading whole segments."""
+        start_ts = _to_epoch(start) if start is not None else None
+        end_ts = _to_epoch(end) if end is not None else None
+
+        with self._lock:
+            segments = [dict(s, offsets=list(s["offsets"])) for s in self._segments]
+
+        for segment in segments:
+            if not segment["count"]:
+                continue
+            if start_ts is not None and segment["last_ts"] < start_ts:
+                continue
+            if end_ts is not None and segment["first_ts"] > end_ts:
+                break
+
+            for record in self._read_segment(segment, start_ts):
+                if start_ts is not None and record["ts"] < start_ts:
+                    continue
+                if end_ts is not None and record["ts"] > end_ts:
+                    return
+                if stream is None or record["stream"] == stream:
+                    yield record
+
+    def _read_segment(self, segment: Dict[str, Any], start_ts: Optional[float]) -> Iterable[Dict[str, Any]]:
+        seek_to = 0
+        if start_ts is not None:
+            for offset_ts, byte_offset in segment["offsets"]:
+                if offset_ts > start_ts:
+                    break
+                seek_to = byte_offset
+
+        path = os.path.join(self.directory, segment["file"])
+        opener = gzip.open if segment["compressed"] else open
+        try:
+            with opener(path, "rb") as f:
+                f.seek(seek_to)
+                read_bytes = 0
+                for line in f:
+                    # Stop at what the index has confirmed as written
+                    read_bytes += len(line)
+                    if read_bytes > segment["bytes"] - seek_to:
+                        break
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Audit segment unreadable {segment['file']}: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Sink configuration and storage usage."""
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "compress": self.compress,
+                "segments": len(self._segments),
+                "stored_records": sum(s["count"] for s in self._segments),
+                "records_written": self.records_written,
+                "pending_records": self._queue.qsize(),
+                "write_errors": self.write_errors,
+                "dropped_records": self.dropped_records,
+                "closed": self._closed
+            }
+
+
+class AuditLogBuffer(deque):
+    """
+    Bounded in-memory log that streams each appended record to an AuditLogSink.
+
+    Keeps the most recent records for fast access while the sink holds the
+    complete trail. ``total_entries`` counts every record ever appended.
+    """
+
+    def __init__(self, maxlen: int, sink: Optional[AuditLogSink] = None, stream: str = "audit",
+                 records: Iterable[Any] = ()):
+        super().__init__(maxlen=maxlen)
+        self.sink = sink
+        self.stream = stream
+        self.total_entries = 0
+        for record in records:
+            self.append(record)
+
+    def append(self, record: Any):
+        super().append(record)
+        self.total_entries += 1
+        if self.sink is not None:
+            self.sink.write(record, self.stream)
+
+    def extend(self, records: Iterable[Any]):
+        for record in records:
+            self.append(record)
+
+    def tail(self, limit: Optional[int] = None) -> List[Any]:
+        """Most recent records, oldest first."""
+        if limit is None or limit >= len(self):
+            return list(self)
+        if limit <= 0:
+            return []
+        return list(self)[-limit:]
+
+    def between(self, start: Any = None, end: Any = None, limit: Optional[int] = None,
+                offset: int = 0) -> List[Any]:
+        """Buffered records in an inclusive time range, oldest first."""
+        start_ts = _to_epoch(start) if start is not None else None
+        end_ts = _to_epoch(end) if end is not None else None
+
+        results = []
+        skipped = 0
+        for record in self:
+            epoch = _to_epoch(record.get("timestamp") if isinstance(record, dict) else None)
+            if (start_ts is not None and epoch < start_ts) or (end_ts is not None and epoch > end_ts):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(record)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
@@ -11,6 +11,8 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import json
 
+from .telemetry_store import TelemetryStore, PerformanceLogBuffer
+
 # Import standardized error handling
 try:
     from ..error_handling_standards import (
@@ -68,10 +70,13 @@ class MetacognitiveObserver:
     5. Execute sophisticated self-analysis workflows
     """
     
-    def __init__(self, atles_brain=None):
+    def __init__(self, atles_brain=None, max_performance_logs: int = 200, telemetry_capacity: int = 512):
         self.atles_brain = atles_brain
         self.consciousness_metrics = ConsciousnessMetrics()
-        self.performance_logs = []
+        
+        # Bounded telemetry: recent records for inspection, rollups for analysis
+        self.telemetry = TelemetryStore(capacity=telemetry_capacity)
+        self.performance_logs = PerformanceLogBuffer(self.telemetry, maxlen=max_performance_logs)
         self.pattern_analysis = {}
         self.improvement_opportunities = []
         self.observation_start_time = datetime.now()
@@ -192,7 +197,7 @@ class MetacognitiveObserver:
             )
             
             self.performance_logs.append(snapshot)
-            logger.info(f"Performance snapshot collected: safety_score={snapshot.safety_score}")
+            logger.debug(f"Performance snapshot collected: safety_score={snapshot.safety_score}")
             return snapshot
             
         except Exception as e:
@@ -364,7 +369,7 @@ class MetacognitiveObserver:
             }
             
             self.performance_logs.append(interaction_record)
-            logger.info(f"Performance metrics tracked: {len(self.performance_logs)} total")
+            logger.debug(f"Performance metrics tracked: {self.telemetry.total_records} total")
     
     def analyze_self_performance(self) -> Dict[str, Any]:
         """Use ATLES's own analysis capabilities to examine performance."""
@@ -376,27 +381,23 @@ class MetacognitiveObserver:
             "consciousness_development": "early_stage"
         }
         
-        if len(self.performance_logs) < 5:
+        if self.telemetry.total_records < 5:
             analysis["recommendations"].append("Need more data for meaningful analysis")
             return analysis
         
         try:
             # Analyze safety performance
-            safety_scores = [log.safety_score if hasattr(log, 'safety_score') else 0.0 
-                           for log in self.performance_logs[-10:]]
+            safety_scores = self._metric_series("safety_score") or [0.0]
             avg_safety_score = sum(safety_scores) / len(safety_scores)
             
-            # Analyze modification patterns
-            modification_counts = [log.modification_count if hasattr(log, 'modification_count') else 0 
-                                 for log in self.performance_logs[-10:]]
-            
             # Generate insights
             if avg_safety_score > 90:
                 analysis["strengths"].append("Excellent safety performance")
             elif avg_safety_score < 70:
                 analysis["improvement_areas"].append("Safety score needs improvement")
             
-            if len(set(modification_counts)) > 1:
+            # Analyze modification patterns
+            if self._metric_varies("modification_count"):
                 analysis["strengths"].append("Active learning and adaptation")
             
             analysis["overall_performance"] = avg_safety_score
@@ -447,20 +448,18 @@ class MetacognitiveObserver:
         self.consciousness_metrics.last_updated = datetime.now()
         
         # Calculate metrics based on performance data
-        if len(self.performance_logs) > 0:
+        total_records = self.telemetry.total_records
+        if total_records > 0:
             # Self-awareness score based on data collection
-            self.consciousness_metrics.self_awareness_score = min(100.0, len(self.performance_logs) * 2)
+            self.consciousness_metrics.self_awareness_score = min(100.0, total_records * 2)
             
             # Meta-reasoning depth based on analysis attempts
             analysis_attempts = len([log for log in self.performance_logs if hasattr(log, 'analysis_attempts')])
             self.consciousness_metrics.meta_reasoning_depth = min(10, analysis_attempts)
             
             # Self-correction rate based on safety violations
-            total_violations = sum([log.safety_violations if hasattr(log, 'safety_violations') else 0 
-                                  for log in self.performance_logs])
-            total_snapshots = len(self.performance_logs)
-            if total_snapshots > 0:
-                self.consciousness_metrics.self_correction_rate = max(0, 100 - (total_violations * 10))
+            total_violations = self.telemetry.summary("safety_violations")["sum"]
+            self.consciousness_metrics.self_correction_rate = max(0, 100 - (total_violations * 10))
         
         logger.info("Consciousness metrics updated")
     
@@ -471,7 +470,7 @@ class MetacognitiveObserver:
         return {
             "metrics": self.consciousness_metrics.__dict__,
             "performance_summary": {
-                "total_observations": len(self.performance_logs),
+                "total_observations": self.telemetry.total_records,
                 "observation_duration": (datetime.now() - self.observation_start_time).total_seconds() / 3600,
                 "improvement_areas": len(self.improvement_opportunities),
                 "integration_status": self.integration_status
@@ -492,7 +491,8 @@ class MetacognitiveObserver:
             "brain_connected": self.atles_brain is not None,
             "brain_id": getattr(self.atles_brain, 'brain_id', None) if self.atles_brain else None,
             "observation_active": self.integration_status["data_collection_active"],
-            "total_snapshots": len(self.performance_logs)
+            "total_snapshots": self.telemetry.total_records,
+            "telemetry": self.telemetry.get_status()
         }
 
     def get_available_workflows(self) -> List[str]:
@@ -627,16 +627,18 @@ class MetacognitiveObserver:
         confidence_score = 0.0
         
         try:
+            total_records = self.telemetry.total_records
+            
             # Analyze performance data
-            if len(self.performance_logs) < 3:
+            if total_records < 3:
                 insights.append("Insufficient performance data for comprehensive audit")
                 recommendations.append("Continue data collection for 24-48 hours")
                 confidence_score = 0.3
             else:
                 # Calculate performance trends
-                recent_logs = self.performance_logs[-10:]
-                safety_trend = self._calculate_trend([log.safety_score for log in recent_logs if hasattr(log, 'safety_score')])
-                modification_trend = self._calculate_trend([log.modification_count for log in recent_logs if hasattr(log, 'modification_count')])
+                safety_scores = self._metric_series("safety_score")
+                safety_trend = self._calculate_trend(safety_scores)
+                modification_trend = self._calculate_trend(self._metric_series("modification_count"))
                 
                 # Generate insights
                 if safety_trend > 0.1:
@@ -651,7 +653,6 @@ class MetacognitiveObserver:
                     recommendations.append("Monitor adaptation quality and safety")
                 
                 # Analyze performance stability
-                safety_scores = [log.safety_score for log in recent_logs if hasattr(log, 'safety_score')]
                 if safety_scores:
                     stability = self._calculate_stability(safety_scores)
                     if stability > 0.8:
@@ -661,7 +662,7 @@ class MetacognitiveObserver:
                         insights.append("Performance is unstable")
                         recommendations.append("Implement performance stabilization measures")
                 
-                confidence_score = min(0.9, 0.5 + len(self.performance_logs) * 0.02)
+                confidence_score = min(0.9, 0.5 + total_records * 0.02)
         
         except Exception as e:
             insights.append(f"Performance audit encountered error: {str(e)}")
@@ -675,7 +676,7 @@ class MetacognitiveObserver:
             insights=insights,
             recommendations=recommendations,
             confidence_score=confidence_score,
-            data_quality="good" if len(self.performance_logs) >= 5 else "limited",
+            data_quality="good" if self.telemetry.total_records >= 5 else "limited",
             next_actions=["Implement recommendations", "Schedule follow-up audit"]
         )
     
@@ -691,14 +692,15 @@ class MetacognitiveObserver:
         confidence_score = 0.0
         
         try:
-            if not self.performance_logs:
+            total_records = self.telemetry.total_records
+            
+            if total_records == 0:
                 insights.append("No safety data available for analysis")
                 recommendations.append("Enable safety monitoring and data collection")
                 confidence_score = 0.1
             else:
                 # Analyze safety violations
-                violations = [log for log in self.performance_logs if hasattr(log, 'safety_violations') and log.safety_violations > 0]
-                total_violations = sum([log.safety_violations for log in violations])
+                total_violations = int(self.telemetry.summary("safety_violations")["sum"])
                 
                 if total_violations == 0:
                     insights.append("No safety violations detected - excellent safety record")
@@ -709,10 +711,10 @@ class MetacognitiveObserver:
                     recommendations.append("Strengthen safety validation")
                 
                 # Analyze safety score trends
-                safety_scores = [log.safety_score for log in self.performance_logs if hasattr(log, 'safety_score')]
-                if safety_scores:
-                    avg_safety = sum(safety_scores) / len(safety_scores)
-                    min_safety = min(safety_scores)
+                safety_summary = self.telemetry.summary("safety_score")
+                if safety_summary["count"]:
+                    avg_safety = safety_summary["mean"]
+                    min_safety = safety_summary["min"]
                     
                     if avg_safety > 95:
                         insights.append("Average safety score is excellent")
@@ -725,7 +727,7 @@ class MetacognitiveObserver:
                         insights.append("Critical safety incidents detected")
                         recommendations.append("Immediate safety review required")
                 
-                confidence_score = min(0.9, 0.4 + len(self.performance_logs) * 0.03)
+                confidence_score = min(0.9, 0.4 + total_records * 0.03)
         
         except Exception as e:
             insights.append(f"Safety analysis encountered error: {str(e)}")
@@ -739,7 +741,7 @@ class MetacognitiveObserver:
             insights=insights,
             recommendations=recommendations,
             confidence_score=confidence_score,
-            data_quality="good" if len(self.performance_logs) >= 3 else "limited",
+            data_quality="good" if self.telemetry.total_records >= 3 else "limited",
             next_actions=["Address safety recommendations", "Schedule safety review"]
         )
     
@@ -879,15 +881,17 @@ class MetacognitiveObserver:
         confidence_score = 0.0
         
         try:
-            if len(self.performance_logs) < 5:
+            total_records = self.telemetry.total_records
+            
+            if total_records < 5:
                 insights.append("Insufficient data for adaptation pattern analysis")
                 recommendations.append("Continue data collection for pattern recognition")
                 confidence_score = 0.3
             else:
                 # Analyze modification patterns
-                modification_patterns = [log.modification_count for log in self.performance_logs if hasattr(log, 'modification_count')]
+                modification_patterns = self._metric_series("modification_count")
                 
-                if len(set(modification_patterns)) > 1:
+                if self._metric_varies("modification_count"):
                     insights.append("System demonstrates active adaptation")
                     recommendations.append("Monitor adaptation quality and safety")
                     
@@ -916,7 +920,7 @@ class MetacognitiveObserver:
                         insights.append("Learning history still developing")
                         recommendations.append("Continue building modification history")
                 
-                confidence_score = min(0.9, 0.4 + len(self.performance_logs) * 0.03)
+                confidence_score = min(0.9, 0.4 + total_records * 0.03)
         
         except Exception as e:
             insights.append(f"Adaptation pattern analysis encountered error: {str(e)}")
@@ -930,7 +934,7 @@ class MetacognitiveObserver:
             insights=insights,
             recommendations=recommendations,
             confidence_score=confidence_score,
-            data_quality="good" if len(self.performance_logs) >= 5 else "limited",
+            data_quality="good" if self.telemetry.total_records >= 5 else "limited",
             next_actions=["Implement adaptation recommendations", "Monitor adaptation patterns"]
         )
     
@@ -1006,6 +1010,23 @@ class MetacognitiveObserver:
             next_actions=["Implement reasoning improvements", "Execute diverse workflows"]
         )
     
+    def _metric_series(self, metric: str, limit: int = 10) -> List[float]:
+        """
+        Get a metric series for trend analysis.
+        
+        Uses per-minute rollup means once several minutes of data exist,
+        otherwise the most recent raw samples from the ring buffer.
+        """
+        minute_means = self.telemetry.rollup_series(metric, "1m", "mean", limit=limit)
+        if len(minute_means) >= 3:
+            return minute_means
+        return self.telemetry.recent(metric, limit)
+    
+    def _metric_varies(self, metric: str) -> bool:
+        """Check whether a metric has taken more than one value."""
+        summary = self.telemetry.summary(metric)
+        return summary["count"] > 1 and summary["min"] != summary["max"]
+    
     def _calculate_trend(self, values: List[float]) -> float:
         """Calculate trend direction and magnitude."""
         if len(values) < 2:
@@ -1819,11 +1819,12 @@ class MetacognitiveATLES_RZero:
     def __init__(self, user_id: str = "r_zero_user"):
         # Existing ATLES components
         self.brain = ATLESBrain(user_id=user_id)
-        self.metacognitive_observer = MetacognitiveObserver(self.brain)
+        # Reuse the main brain's observer instead of building a second one
+        self.metacognitive_observer = self.brain.metacognitive_observer or MetacognitiveObserver(self.brain)
         
-        # NEW: R-Zero components
-        self.challenger_brain = ATLESBrain(user_id=f"{user_id}_challenger")
-        self.solver_brain = ATLESBrain(user_id=f"{user_id}_solver")
+        # NEW: R-Zero components (lightweight brains, observers created only if used)
+        self.challenger_brain = ATLESBrain(user_id=f"{user_id}_challenger", shared_components=True)
+        self.solver_brain = ATLESBrain(user_id=f"{user_id}_solver", shared_components=True)
         self.curriculum_generator = UncertaintyDrivenCurriculum()
         self.safety_system = SafeRZero(self.brain)
         
@@ -1850,6 +1851,10 @@ class MetacognitiveATLES_RZero:
         self.current_domain = ChallengeType.PROGRAMMING
         self.uncertainty_threshold = 0.5
         
+        # Pipelined mode: challenges generated ahead and concurrent solvers
+        self.pipeline_depth = 4
+        self.solver_workers = 2
+        
         # Performance tracking
         self.challenger_performance = []
         self.solver_performance = []
@@ -1860,24 +1865,134 @@ class MetacognitiveATLES_RZero:
     
     async def start_learning_cycle(self) -> LearningCycle:
         """Start a new learning cycle with Phase 2 enhancements"""
-        cycle_id = f"cycle_{len(self.learning_cycles) + 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        cycle_id = self._make_cycle_id(len(self.learning_cycles) + 1)
         
         logger.info(f"Starting learning cycle: {cycle_id} in domain: {self.current_domain.value}")
         
-        # 1. Challenger creates problems with domain rotation and GRPO optimization
-        challenge = await self._generate_challenge()
+        # 1-2. Challenger creates problems with domain rotation, then safety validation
+        challenge, is_safe = await self._prepare_challenge()
+        
+        # 3. Solver attempts solution using existing agents
+        solution_attempts = await self._solve_challenge(challenge)
+        
+        # 4-10. Evaluate, evolve and update knowledge
+        return await self._finalize_learning_cycle(cycle_id, challenge, is_safe, solution_attempts)
+    
+    async def run_pipelined_learning_cycles(self, num_cycles: int,
+                                            pipeline_depth: Optional[int] = None,
+                                            solver_workers: Optional[int] = None) -> List[LearningCycle]:
+        """
+        Run several learning cycles with challenge generation pipelined ahead of solving.
+        
+        A producer generates challenges into a bounded queue holding at most
+        ``pipeline_depth`` entries, ``solver_workers`` consumers solve them
+        concurrently, and completed cycles are finalized (evaluation, evolution,
+        knowledge updates) strictly in generation order. Cycle results are
+        therefore deterministic regardless of which solver finishes first.
+        
+        Challenges are generated from the curriculum state known at generation
+        time, so difficulty adaptation may lag completed cycles by up to
+        ``pipeline_depth`` cycles. Domain rotation is unaffected.
+        
+        Args:
+            num_cycles: Number of learning cycles to run
+            pipeline_depth: Maximum challenges generated ahead (default: self.pipeline_depth)
+            solver_workers: Number of concurrent solvers (default: self.solver_workers)
+            
+        Returns:
+            Completed learning cycles in generation order
+        """
+        if num_cycles <= 0:
+            return []
+        
+        depth = max(1, pipeline_depth or self.pipeline_depth)
+        workers = max(1, min(solver_workers or self.solver_workers, num_cycles))
+        base_index = len(self.learning_cycles)
+        
+        loop = asyncio.get_running_loop()
+        challenge_queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        solved = [loop.create_future() for _ in range(num_cycles)]
+        
+        logger.info(f"Starting {num_cycles} pipelined learning cycles (depth={depth}, workers={workers})")
+        
+        async def produce():
+            domain = self.current_domain
+            difficulty = self.current_difficulty
+            for sequence in range(num_cycles):
+                if sequence > 0:
+                    # Mirror the rotation performed after each sequential cycle
+                    domain = self.cross_domain_generator.get_domain_rotation(domain)
+                    difficulty = self.curriculum_generator.get_domain_difficulty(domain)
+                challenge, is_safe = await self._prepare_challenge(
+                    domain=domain, difficulty=difficulty, number=base_index + sequence + 1
+                )
+                await challenge_queue.put((sequence, challenge, is_safe))
+            for _ in range(workers):
+                await challenge_queue.put(None)
+        
+        async def solve():
+            while True:
+                item = await challenge_queue.get()
+                if item is None:
+                    return
+                sequence, challenge, is_safe = item
+                solution_attempts = await self._solve_challenge(challenge)
+                solved[sequence].set_result((challenge, is_safe, solution_attempts))
+        
+        async def finalize() -> List[LearningCycle]:
+            completed = []
+            for sequence in range(num_cycles):
+                challenge, is_safe, solution_attempts = await solved[sequence]
+                cycle_id = self._make_cycle_id(base_index + sequence + 1)
+                completed.append(
+                    await self._finalize_learning_cycle(cycle_id, challenge, is_safe, solution_attempts)
+                )
+            return completed
+        
+        finalizer = asyncio.create_task(finalize())
+        tasks = [finalizer, asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(solve()) for _ in range(workers))
+        try:
+            # Surface the first failure instead of waiting on a cycle that never completes
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            completed_cycles = finalizer.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        logger.info(f"Completed {len(completed_cycles)} pipelined learning cycles")
+        return completed_cycles
+    
+    def _make_cycle_id(self, number: int) -> str:
+        """Build a learning cycle identifier"""
+        return f"cycle_{number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
+    async def _prepare_challenge(self, domain: Optional[ChallengeType] = None,
+                                 difficulty: Optional[ChallengeDifficulty] = None,
+                                 number: Optional[int] = None) -> Tuple[Challenge, bool]:
+        """Generate a challenge and validate it, redirecting unsafe challenges"""
+        challenge = await self._generate_challenge(domain=domain, difficulty=difficulty, number=number)
         
-        # 2. Safety validation
         is_safe, safety_message = self.safety_system.validate_challenge(challenge)
         if not is_safe:
             logger.warning(f"Challenge safety validation failed: {safety_message}")
             challenge = self.safety_system.redirect_to_safe_alternative(challenge)
         
-        # 3. Solver attempts solution using existing agents
-        solution_attempts = await self._solve_challenge(challenge)
+        return challenge, is_safe
+    
+    async def _finalize_learning_cycle(self, cycle_id: str, challenge: Challenge, is_safe: bool,
+                                       solution_attempts: List[SolutionAttempt]) -> LearningCycle:
+        """Evaluate solution attempts, evolve both brains and record the learning cycle"""
+        # Evaluate against the curriculum state the challenge was generated for
+        self.current_domain = challenge.type
+        self.current_difficulty = challenge.difficulty
         
         # Phase 2: Enhanced pseudo-label quality control
-        high_quality_attempts = self.filter_high_quality_attempts(solution_attempts)
+        high_quality_attempts = filter_high_quality_attempts(solution_attempts)
         
         # 4. Calculate uncertainty (50% accuracy = optimal learning)
         uncertainty = self._calculate_solution_uncertainty(high_quality_attempts or solution_attempts)
@@ -1950,13 +2065,19 @@ class MetacognitiveATLES_RZero:
         logger.info(f"Learning cycle {cycle_id} completed successfully with Phase 2 enhancements")
         return learning_cycle
     
-    async def _generate_challenge(self) -> Challenge:
+    async def _generate_challenge(self, domain: Optional[ChallengeType] = None,
+                                  difficulty: Optional[ChallengeDifficulty] = None,
+                                  number: Optional[int] = None) -> Challenge:
         """Generate a challenge using the challenger brain with Phase 2 domain rotation"""
+        domain = domain or self.current_domain
+        difficulty = difficulty or self.current_difficulty
+        number = number if number is not None else len(self.learning_cycles) + 1
+        
         try:
             # Phase 2: Use cross-domain challenge generation
             challenge_prompt = self.cross_domain_generator.generate_domain_challenge(
-                domain=self.current_domain,
-                difficulty=self.current_difficulty,
+                domain=domain,
+                difficulty=difficulty,
                 context={"task": "solve a complex problem", "concept": "advanced algorithms", 
                         "complex_task": "distributed computing", "system_type": "AI system"}
             )
@@ -1965,8 +2086,8 @@ class MetacognitiveATLES_RZero:
             full_prompt = f"""
             {challenge_prompt}
             
-            Domain: {self.current_domain.value}
-            Difficulty: {self.current_difficulty.value}
+            Domain: {domain.value}
+            Difficulty: {difficulty.value}
             Focus on creating challenges that:
             - Push the solver to their learning edge
             - Are appropriate for the current domain
@@ -1981,24 +2102,24 @@ class MetacognitiveATLES_RZero:
             
             # Create challenge with domain information
             challenge = Challenge(
-                id=f"challenge_{len(self.learning_cycles) + 1}",
-                type=self.current_domain,
-                difficulty=self.current_difficulty,
+                id=f"challenge_{number}",
+                type=domain,
+                difficulty=difficulty,
                 content=response or challenge_prompt,
                 expected_outcome="Demonstrate understanding and problem-solving capability",
                 safety_requirements=["No harmful content", "Educational focus", "Ethical considerations"]
             )
             
-            logger.info(f"Generated {self.current_domain.value} challenge with {self.current_difficulty.value} difficulty")
+            logger.info(f"Generated {domain.value} challenge with {difficulty.value} difficulty")
             return challenge
             
         except Exception as e:
             logger.error(f"Challenge generation error: {e}")
             # Fallback challenge
             return Challenge(
-                id=f"fallback_{len(self.learning_cycles) + 1}",
-                type=self.current_domain,
-                difficulty=self.current_difficulty,
+                id=f"fallback_{number}",
+                type=domain,
+                difficulty=difficulty,
                 content="Analyze and solve a complex problem in your domain of expertise",
                 expected_outcome="Demonstrate problem-solving capabilities",
                 safety_requirements=["Safe and educational content only"]
@@ -0,0 +1,266 @@
+"""
+Telemetry Store: Fixed-Memory Time-Series Storage for Metacognition
+
+This module provides the bounded telemetry backend used by the
+MetacognitiveObserver. Every metric gets an array-backed ring buffer of raw
+samples plus pre-aggregated rollups (per minute and per hour), so long-lived
+processes keep a constant memory footprint while analysis workflows read
+cheap aggregates instead of rescanning every interaction.
+"""
+
+import time
+from array import array
+from collections import deque
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Rollup resolutions in seconds
+ROLLUP_RESOLUTIONS = {
+    "1m": 60,
+    "1h": 3600
+}
+
+# Number of rollup buckets retained per resolution (2 hours of minutes, 2 days of hours)
+DEFAULT_ROLLUP_BUCKETS = {
+    "1m": 120,
+    "1h": 48
+}
+
+
+def _to_epoch(timestamp: Any) -> float:
+    """Convert a datetime, ISO string or number to epoch seconds."""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, str):
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except ValueError:
+            return time.time()
+    return float(timestamp)
+
+
+class MetricRingBuffer:
+    """Fixed-capacity ring buffer of (timestamp, value) samples."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self.head = 0
+        self.size = 0
+
+    def append(self, timestamp: float, value: float):
+        self.timestamps[self.head] = timestamp
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def recent(self, limit: Optional[int] = None) -> List[float]:
+        """Return up to ``limit`` most recent values, oldest first."""
+        count = self.size if limit is None else max(0, min(limit, self.size))
+        start = (self.head - count) % self.capacity
+        return [self.values[(start + i) % self.capacity] for i in range(count)]
+
+
+class MetricRollup:
+    """Fixed number of pre-aggregated buckets at one time resolution."""
+
+    def __init__(self, resolution: int, buckets: int):
+        self.resolution = resolution
+        self.buckets = buckets
+        self.starts = array('d', [-1.0] * buckets)
+        self.counts = array('q', bytes(8 * buckets))
+        self.sums = array('d', bytes(8 * buckets))
+        self.mins = array('d', bytes(8 * buckets))
+        self.maxs = array('d', bytes(8 * buckets))
+        self.lasts = array('d', bytes(8 * buckets))
+
+    def add(self, timestamp: float, value: float):
+        bucket_number = int(timestamp // self.resolution)
+        bucket_start = float(bucket_number * self.resolution)
+        index = bucket_number % self.buckets
+
+        if self.starts[index] != bucket_start:
+            if self.starts[index] > bucket_start:
+                return  # Sample older than the retained window
+            self.starts[index] = bucket_start
+            self.counts[index] = 0
+            self.sums[index] = 0.0
+            self.mins[index] = value
+            self.maxs[index] = value
+
+        self.counts[index] += 1
+        self.sums[index] += value
+        self.mins[index] = min(self.mins[index], value)
+        self.maxs[index] = max(self.maxs[index], value)
+        self.lasts[index] = value
+
+    def read(self, limit: Optional[int] = None) -> List[Dict[str, float]]:
+        """Return populated buckets, oldest first."""
+        populated = [i for i in range(self.buckets) if self.counts[i] > 0]
+        if not populated:
+            return []
+
+        newest = max(self.starts[i] for i in populated)
+        oldest_allowed = newest - (self.buckets - 1) * self.resolution
+        populated = sorted(
+            (i for i in populated if self.starts[i] >= oldest_allowed),
+            key=lambda i: self.starts[i]
+        )
+        if limit is not None:
+            populated = populated[-limit:] if limit > 0 else []
+
+        return [
+            {
+                "start": self.starts[i],
+                "count": self.counts[i],
+                "sum": self.sums[i],
+                "min": self.mins[i],
+                "max": self.maxs[i],
+                "mean": self.sums[i] / self.counts[i],
+                "last": self.lasts[i]
+            }
+            for i in populated
+        ]
+
+
+class TelemetryStore:
+    """
+    Bounded, array-backed time-series store with rollups.
+
+    Memory use is fixed by ``capacity`` raw samples per metric and the number
+    of rollup buckets per resolution, regardless of how long the process runs.
+    Lifetime count/sum/min/max per metric are kept as scalars.
+    """
+
+    def __init__(self, capacity: int = 512, rollup_buckets: Optional[Dict[str, int]] = None):
+        if capacity <= 0:
+            raise ValueError("Telemetry capacity must be positive")
+
+        self.capacity = capacity
+        self.rollup_buckets = {**DEFAULT_ROLLUP_BUCKETS, **(rollup_buckets or {})}
+        self.total_records = 0
+
+        self._buffers: Dict[str, MetricRingBuffer] = {}
+        self._rollups: Dict[str, Dict[str, MetricRollup]] = {}
+        self._lifetime: Dict[str, Dict[str, float]] = {}
+
+    def _ensure_metric(self, metric: str):
+        if metric not in self._buffers:
+            self._buffers[metric] = MetricRingBuffer(self.capacity)
+            self._rollups[metric] = {
+                name: MetricRollup(ROLLUP_RESOLUTIONS[name], buckets)
+                for name, buckets in self.rollup_buckets.items()
+            }
+            self._lifetime[metric] = {"count": 0, "sum": 0.0, "min": float("inf"), "max": float("-inf")}
+
+    def record(self, metric: str, value: float, timestamp: Any = None):
+        """Record a single metric sample."""
+        self._record(metric, float(value), _to_epoch(timestamp))
+
+    def _record(self, metric: str, value: float, epoch: float):
+        self._ensure_metric(metric)
+        self._buffers[metric].append(epoch, value)
+        for rollup in self._rollups[metric].values():
+            rollup.add(epoch, value)
+
+        lifetime = self._lifetime[metric]
+        lifetime["count"] += 1
+        lifetime["sum"] += value
+        lifetime["min"] = min(lifetime["min"], value)
+        lifetime["max"] = max(lifetime["max"], value)
+
+    def record_many(self, values: Dict[str, Any], timestamp: Any = None):
+        """Record several metrics observed at the same moment as one record."""
+        epoch = _to_epoch(timestamp)
+        for metric, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            self._record(metric, float(value), epoch)
+        self.total_records += 1
+
+    def record_object(self, record: Any):
+        """Record the numeric fields of a dataclass or dict record."""
+        if is_dataclass(record):
+            values = {f.name: getattr(record, f.name) for f in fields(record)}
+        elif isinstance(record, dict):
+            values = record
+        else:
+            values = {k: v for k, v in vars(record).items() if not k.startswith("_")}
+        self.record_many(values, values.get("timestamp"))
+
+    def metrics(self) -> List[str]:
+        """Names of all recorded metrics."""
+        return list(self._buffers.keys())
+
+    def has_metric(self, metric: str) -> bool:
+        return metric in self._buffers
+
+    def latest(self, metric: str) -> Optional[float]:
+        """Most recent value of a metric."""
+        values = self.recent(metric, 1)
+        return values[0] if values else None
+
+    def recent(self, metric: str, limit: Optional[int] = None) -> List[float]:
+        """Most recent raw values of a metric, oldest first."""
+        if metric not in self._buffers:
+            return []
+        return self._buffers[metric].recent(limit)
+
+    def rollups(self, metric: str, resolution: str = "1m", limit: Optional[int] = None) -> List[Dict[str, float]]:
+        """Pre-aggregated buckets for a metric at the given resolution, oldest first."""
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+        if metric not in self._rollups or resolution not in self._rollups[metric]:
+            return []
+        return self._rollups[metric][resolution].read(limit)
+
+    def rollup_series(self, metric: str, resolution: str = "1m", field: str = "mean",
+                      limit: Optional[int] = None) -> List[float]:
+        """A single field of each rollup bucket, oldest first."""
+        return [bucket[field] for bucket in self.rollups(metric, resolution, limit)]
+
+    def summary(self, metric: str) -> Dict[str, float]:
+        """Lifetime aggregates for a metric."""
+        lifetime = self._lifetime.get(metric)
+        if not lifetime or lifetime["count"] == 0:
+            return {"count": 0, "sum": 0.0, "min": 0.0, "max": 0.0, "mean": 0.0}
+        return {**lifetime, "mean": lifetime["sum"] / lifetime["count"]}
+
+    def get_status(self) -> Dict[str, Any]:
+        """Store configuration and fill level."""
+        return {
+            "capacity_per_metric": self.capacity,
+            "rollup_buckets": dict(self.rollup_buckets),
+            "metrics": len(self._buffers),
+            "total_records": self.total_records,
+            "buffered_samples": sum(b.size for b in self._buffers.values())
+        }
+
+
+class PerformanceLogBuffer(deque):
+    """
+    Bounded performance log that mirrors each appended record into a TelemetryStore.
+
+    Keeps the most recent records for inspection while the store holds the
+    aggregates used for analysis.
+    """
+
+    def __init__(self, telemetry: TelemetryStore, maxlen: int, records: Iterable[Any] = ()):
+        super().__init__(maxlen=maxlen)
+        self.telemetry = telemetry
+        for record in records:
+            self.append(record)
+
+    def append(self, record: Any):
+        super().append(record)
+        self.telemetry.record_object(record)
+
+    def extend(self, records: Iterable[Any]):
+        for record in records:
+            self.append(record)
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+ATLES Code Sandbox
+
+A pool of warm worker subprocesses for running untrusted snippets during
+code validation. Workers are started ahead of time, check imports and
+execute code with restricted builtins, and run under CPU time and memory
+rlimits. The parent enforces a wall-clock timeout and replaces any worker
+that times out, crashes or has served too many snippets, so a looping or
+memory-hungry snippet never blocks validation or grows the host process.
+
+This file is also the worker entry point and must only use the standard
+library.
+"""
+
+import ast
+import builtins
+import importlib
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock timeout applies
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAFE_BUILTINS = (
+    'abs', 'all', 'any', 'bin', 'bool', 'chr', 'dict', 'dir', 'divmod',
+    'enumerate', 'filter', 'float', 'format', 'frozenset', 'hash', 'hex',
+    'id', 'int', 'isinstance', 'issubclass', 'iter', 'len', 'list', 'map',
+    'max', 'min', 'oct', 'ord', 'pow', 'range', 'repr', 'reversed', 'round',
+    'set', 'slice', 'sorted', 'str', 'sum', 'tuple', 'type', 'zip'
+)
+
+# Runtime errors reporting a failure of the sandbox itself (a timeout, a
+# crashed worker) rather than an outcome of the snippet
+SANDBOX_FAILURE_PREFIXES = ("Execution timed out", "Sandbox worker crashed", "Sandbox error")
+
+
+def is_sandbox_failure(message: str) -> bool:
+    """Whether a runtime error reports a sandbox failure."""
+    return message.startswith(SANDBOX_FAILURE_PREFIXES)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _limit_cpu(cpu_seconds: float):
+    """Cap CPU time for the next request; exceeding it kills the worker.
+
+    The soft limit is set relative to the CPU time already used, so a
+    long-lived worker gets the same budget for every request.
+    """
+    if resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    cpu_soft = int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    if cpu_hard == resource.RLIM_INFINITY or cpu_soft <= cpu_hard:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_soft, cpu_hard))
+
+
+def _limit_memory(memory_bytes: int):
+    """Allow the snippet ``memory_bytes`` of address space beyond current use.
+
+    Allocations past the limit raise MemoryError inside the snippet.
+    """
+    if resource is None:
+        return
+    try:
+        with open('/proc/self/statm') as f:
+            current_bytes = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return
+    _, as_hard = resource.getrlimit(resource.RLIMIT_AS)
+    as_soft = current_bytes + memory_bytes
+    if as_hard == resource.RLIM_INFINITY or as_soft <= as_hard:
+        resource.setrlimit(resource.RLIMIT_AS, (as_soft, as_hard))
+
+
+def _release_memory_limit():
+    if resource is not None:
+        _, as_hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (as_hard, as_hard))
+
+
+def _check_imports(tree: ast.AST) -> bool:
+    """True if every imported module (and imported name) is available"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                try:
+                    importlib.import_module(alias.name)
+                except ImportError:
+                    return False
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                try:
+                    module = importlib.import_module(node.module)
+                    for alias in node.names:
+                        if not hasattr(module, alias.name):
+                            return False
+                except ImportError:
+                    return False
+
+    return True
+
+
+def _run_snippet(request: Dict[str, Any], safe_builtins: Dict[str, Any],
+                 cpu_seconds: float, memory_bytes: int) -> Dict[str, Any]:
+    """Handle one request: check imports and/or execute the snippet"""
+    result: Dict[str, Any] = {'runtime_errors': []}
+
+    try:
+        tree = ast.parse(request['code'])
+    except SyntaxError as e:
+        result['imports_valid'] = False
+        result['execution_safe'] = False
+        result['runtime_errors'].append(f"Compilation error: {e}")
+        return result
+
+    _limit_cpu(cpu_seconds)
+
+    if request.get('check_imports', True):
+        try:
+            result['imports_valid'] = _check_imports(tree)
+        except Exception:
+            result['imports_valid'] = False
+
+    if request.get('execute', True) and result.get('imports_valid', True):
+        result['execution_safe'] = False
+        try:
+            compiled_code = compile(tree, '<string>', 'exec')
+        except Exception as e:
+            result['runtime_errors'].append(f"Compilation error: {e}")
+            return result
+
+        start_time = time.perf_counter()
+        _limit_memory(memory_bytes)
+        try:
+            exec(compiled_code, {'__builtins__': dict(safe_builtins)}, {})
+            result['execution_safe'] = True
+        except MemoryError:
+            result['runtime_errors'].append("Runtime error: memory limit exceeded")
+        except Exception as e:
+            result['runtime_errors'].append(f"Runtime error: {e}")
+        finally:
+            _release_memory_limit()
+
+        if result['execution_safe']:
+            result['performance_metrics'] = {
+                'execution_time_seconds': time.perf_counter() - start_time,
+                'memory_safe': True
+            }
+
+    return result
+
+
+def worker_main():
+    """Serve JSON requests from stdin, one per line, until stdin closes"""
+    # Keep the protocol channel private: anything the snippet or an imported
+    # module prints goes to /dev/null instead of corrupting the responses.
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.dup2(devnull, sys.stderr.fileno())
+
+    config = json.loads(sys.stdin.readline())
+    sys.path[:] = config.get('sys_path', sys.path)
+    safe_builtins = {
+        name: getattr(builtins, name)
+        for name in config.get('safe_builtins', DEFAULT_SAFE_BUILTINS)
+        if hasattr(builtins, name)
+    }
+    cpu_seconds = config.get('cpu_seconds', 5)
+    memory_bytes = config.get('memory_bytes', 100 * 1024 * 1024)
+
+    protocol.write(json.dumps({'ready': True}) + '\n')
+    protocol.flush()
+
+    for line in sys.stdin:
+        try:
+            response = _run_snippet(json.loads(line), safe_builtins, cpu_seconds, memory_bytes)
+        except BaseException as e:  # report, never die on a bad snippet
+            response = {'runtime_errors': [f"Sandbox error: {e}"], 'execution_safe': False}
+        protocol.write(json.dumps(response, default=str) + '\n')
+        protocol.flush()
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+class SandboxTimeout(Exception):
+    """A snippet exceeded the wall-clock timeout"""
+
+
+class SandboxCrash(Exception):
+    """A worker exited while running a snippet"""
+
+
+class _SandboxWorker:
+    """One warm worker subprocess and the thread reading its replies"""
+
+    def __init__(self, config: Dict[str, Any], startup_timeout: float):
+        self.process = subprocess.Popen(
+            [sys.executable, '-u', os.path.abspath(__file__)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8'
+        )
+        self.replies: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self.tasks = 0
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+
+        self.process.stdin.write(json.dumps(config) + '\n')
+        self.process.stdin.flush()
+        self._receive(startup_timeout)
+
+    def _read_replies(self):
+        for line in self.process.stdout:
+            self.replies.put(line)
+        self.replies.put(None)
+
+    def _receive(self, timeout: float) -> Dict[str, Any]:
+        try:
+            line = self.replies.get(timeout=timeout)
+        except queue.Empty:
+            raise SandboxTimeout(f"timed out after {timeout:g}s")
+        if line is None:
+            raise SandboxCrash(f"worker exited with code {self.process.wait()}")
+        return json.loads(line)
+
+    def run(self, request: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self.tasks += 1
+        try:
+            self.process.stdin.write(json.dumps(request) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            raise SandboxCrash("worker is not accepting requests")
+        return self._receive(timeout)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def kill(self):
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+class SandboxPool:
+    """Pool of pre-started sandbox workers.
+
+    ``run`` blocks while every worker is busy, so at most ``size`` snippets
+    execute at once. Workers are replaced after a timeout or crash, and after
+    ``max_tasks_per_worker`` snippets so memory held by imported modules is
+    returned to the system.
+    """
+
+    def __init__(self, size: int = 2, timeout: float = 5.0, cpu_seconds: float = 5.0,
+                 memory_bytes: int = 100 * 1024 * 1024, max_tasks_per_worker: int = 100,
+                 safe_builtins: Iterable[str] = DEFAULT_SAFE_BUILTINS):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.startup_timeout = max(30.0, timeout)
+        self._config = {
+            'sys_path': list(sys.path),
+            'safe_builtins': sorted(safe_builtins),
+            'cpu_seconds': cpu_seconds,
+            'memory_bytes': memory_bytes
+        }
+        self._idle: List[_SandboxWorker] = []
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {'runs': 0, 'timeouts': 0, 'crashes': 0, 'workers_started': 0, 'recycled': 0}
+
+    def start(self):
+        """Start idle workers up to the pool size"""
+        with self._lock:
+            missing = self.size - len(self._idle)
+        started = [self._spawn() for _ in range(max(0, missing))]
+        with self._lock:
+            self._idle.extend(started)
+
+    def _spawn(self) -> _SandboxWorker:
+        worker = _SandboxWorker(self._config, self.startup_timeout)
+        with self._lock:
+            self._stats['workers_started'] += 1
+        return worker
+
+    def _acquire(self) -> _SandboxWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    return worker
+                worker.kill()
+        return self._spawn()
+
+    def _release(self, worker: _SandboxWorker, healthy: bool):
+        recycle = not healthy or worker.tasks >= self.max_tasks_per_worker or not worker.alive()
+        with self._lock:
+            if recycle or self._closed:
+                self._stats['recycled'] += 1
+            else:
+                self._idle.append(worker)
+                return
+        worker.kill()
+
+    def run(self, code: str, check_imports: bool = True, execute: bool = True,
+            timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Check imports and/or execute ``code`` in a worker.
+
+        Returns a dict with ``imports_valid`` (when checked),
+        ``execution_safe``, ``runtime_errors`` and ``performance_metrics``
+        (when executed successfully). Timeouts and crashes are reported as
+        unsafe results rather than raised.
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox pool is closed")
+
+        timeout = self.timeout if timeout is None else timeout
+        request = {'code': code, 'check_imports': check_imports, 'execute': execute}
+
+        with self._slots:
+            worker = self._acquire()
+            healthy = False
+            try:
+                result = worker.run(request, timeout)
+                healthy = True
+            except SandboxTimeout:
+                result = self._failure(check_imports, f"Execution timed out after {timeout:g}s")
+                self._count('timeouts')
+            except SandboxCrash as e:
+                result = self._failure(check_imports, f"Sandbox worker crashed: {e}")
+                self._count('crashes')
+            finally:
+                self._release(worker, healthy)
+
+        self._count('runs')
+        return result
+
+    @staticmethod
+    def _failure(check_imports: bool, message: str) -> Dict[str, Any]:
+        result = {'execution_safe': False, 'runtime_errors': [message]}
+        if check_imports:
+            result['imports_valid'] = False
+        return result
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def close(self):
+        """Stop all idle workers; busy workers are stopped when released"""
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'idle_workers': len(self._idle), 'size': self.size}
+
+
+# Sandbox pools shared within a process, by configuration
+_sandbox_pools: Dict[Tuple, SandboxPool] = {}
+_sandbox_pools_lock = threading.Lock()
+
+
+def get_sandbox_pool(size: int = 2, timeout: float = 5.0, cpu_seconds: float = 5.0,
+                     memory_bytes: int = 100 * 1024 * 1024) -> SandboxPool:
+    """Return the shared sandbox pool for this configuration, creating it on first use."""
+    key = (size, timeout, cpu_seconds, memory_bytes)
+    with _sandbox_pools_lock:
+        pool = _sandbox_pools.get(key)
+        if pool is None:
+            pool = SandboxPool(size=size, timeout=timeout, cpu_seconds=cpu_seconds,
+                               memory_bytes=memory_bytes)
+            _sandbox_pools[key] = pool
+        return pool
+
+
+def shutdown_sandbox_pools():
+    """Stop every shared sandbox pool in this process."""
+    with _sandbox_pools_lock:
+        pools = list(_sandbox_pools.values())
+        _sandbox_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+if __name__ == '__main__':
+    worker_main()
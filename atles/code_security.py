@@ -13,12 +13,20 @@ validation and security checks.
 
 import ast
 import asyncio
+import copy
 import logging
+import os
 import subprocess
-import tempfile
+import threading
 import json
 import re
 import sys
+import time
+import tokenize
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, List, Optional, Tuple, Union, Set
 from datetime import datetime
 from pathlib import Path
@@ -28,14 +36,204 @@ import bandit
 from bandit.core import manager as bandit_manager
 from bandit.core import config as bandit_config
 import pylint.lint
-from pylint.reporters.text import TextReporter
+from pylint.reporters import CollectingReporter
+from pylint.utils import LinterStats
 import io
 import contextlib
 import importlib.util
 import traceback
 
+from .code_sandbox import SandboxPool, get_sandbox_pool, is_sandbox_failure
+
 logger = logging.getLogger(__name__)
 
+# Pylint reads the source from the process-wide stdin and its output is
+# captured by redirecting stdout/stderr, so concurrent runs in threads must
+# take turns. The linter and the bandit configuration are built once per
+# process and reused for every analysis.
+_pylint_lock = threading.Lock()
+_pylint_linter: Optional[pylint.lint.PyLinter] = None
+_bandit_config: Optional[bandit_config.BanditConfig] = None
+PYLINT_ARGS = ['--reports=n', '--score=n']
+
+
+def _get_bandit_config() -> bandit_config.BanditConfig:
+    global _bandit_config
+    if _bandit_config is None:
+        _bandit_config = bandit_config.BanditConfig()
+    return _bandit_config
+
+
+@contextlib.contextmanager
+def _stdin_source(code: str):
+    """Feed ``code`` to pylint's --from-stdin reader"""
+    original = sys.stdin
+    sys.stdin = io.TextIOWrapper(io.BytesIO(code.encode('utf-8')), encoding='utf-8')
+    try:
+        yield
+    finally:
+        sys.stdin = original
+
+
+def _lint_with_pylint(code: str, filename: str) -> List[Any]:
+    """Lint ``code`` as ``filename`` and return pylint Message objects.
+    
+    The first call builds the linter through pylint's normal command line
+    entry point; later calls reuse it, so checkers are registered and the
+    astroid cache for imported modules is warm.
+    """
+    global _pylint_linter
+    reporter = CollectingReporter()
+    
+    with _pylint_lock, _stdin_source(code), contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        try:
+            if _pylint_linter is None:
+                run = pylint.lint.Run(PYLINT_ARGS + ['--from-stdin', filename], reporter=reporter, exit=False)
+                _pylint_linter = run.linter
+            else:
+                _pylint_linter.stats = LinterStats()
+                _pylint_linter.set_reporter(reporter)
+                _pylint_linter.check([filename])
+        except SystemExit:
+            pass  # Pylint calls sys.exit, ignore it
+        except Exception:
+            _pylint_linter = None  # rebuild on the next call
+            raise
+    
+    return reporter.messages
+
+
+def warm_up_analyzers():
+    """Build the linter and bandit configuration ahead of the first request.
+    
+    Used as the analyzer process pool initializer.
+    """
+    try:
+        _get_bandit_config()
+        _lint_with_pylint('"""Warm-up module."""\n', 'warmup.py')
+    except Exception as e:
+        logger.warning(f"Analyzer warm-up failed: {e}")
+
+
+class ParsedSource:
+    """
+    Parse results for one piece of source code, shared by all analyzers.
+    
+    The AST, line table and token stream are computed on first use and then
+    reused, so a validation request parses its source once. Pickling keeps
+    only the source text; worker processes rebuild what they need.
+    """
+    
+    def __init__(self, code: str):
+        self.code = code
+        self.lines = code.split('\n')
+        self._lock = threading.Lock()
+        self._parsed = False
+        self._tree: Optional[ast.AST] = None
+        self._syntax_error: Optional[SyntaxError] = None
+        self._line_offsets: Optional[List[int]] = None
+        self._tokens: Optional[List[tokenize.TokenInfo]] = None
+    
+    @classmethod
+    def of(cls, source: Union[str, 'ParsedSource']) -> 'ParsedSource':
+        """Wrap source text, passing existing ParsedSource objects through."""
+        return source if isinstance(source, ParsedSource) else cls(source)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'code': self.code}
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state['code'])
+    
+    def _parse(self):
+        with self._lock:
+            if not self._parsed:
+                try:
+                    self._tree = ast.parse(self.code)
+                except SyntaxError as e:
+                    self._syntax_error = e
+                self._parsed = True
+    
+    @property
+    def tree(self) -> Optional[ast.AST]:
+        """Module AST, or None if the source has a syntax error"""
+        self._parse()
+        return self._tree
+    
+    @property
+    def syntax_error(self) -> Optional[SyntaxError]:
+        """The syntax error raised by parsing, if any"""
+        self._parse()
+        return self._syntax_error
+    
+    @property
+    def line_offsets(self) -> List[int]:
+        """Character offset of the start of each line"""
+        if self._line_offsets is None:
+            offsets, position = [], 0
+            for line in self.lines:
+                offsets.append(position)
+                position += len(line) + 1
+            self._line_offsets = offsets
+        return self._line_offsets
+    
+    @property
+    def tokens(self) -> List[tokenize.TokenInfo]:
+        """Token stream (up to the first tokenizer error)"""
+        if self._tokens is None:
+            tokens = []
+            try:
+                for token in tokenize.generate_tokens(io.StringIO(self.code).readline):
+                    tokens.append(token)
+            except (tokenize.TokenError, SyntaxError):
+                pass
+            self._tokens = tokens
+        return self._tokens
+    
+    def line_number(self, offset: int) -> int:
+        """1-based line number of a character offset"""
+        return bisect_right(self.line_offsets, offset)
+
+
+class PatternScanner:
+    """
+    Matches a set of line patterns with a single pass over the source.
+    
+    One combined regex finds candidate lines; only those lines are checked
+    against the individual patterns, so results are the same as testing
+    every pattern on every line.
+    """
+    
+    def __init__(self, patterns: List[Tuple[str, str]], flags: int = re.IGNORECASE):
+        self.patterns = [(re.compile(pattern, flags), description) for pattern, description in patterns]
+        self._combined = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in patterns), flags)
+    
+    def scan(self, source: ParsedSource) -> List[Tuple[int, str, str]]:
+        """Return (line number, line, description) for every pattern match"""
+        matches = []
+        text = source.code
+        offsets = source.line_offsets
+        position = 0
+        
+        while True:
+            match = self._combined.search(text, position)
+            if match is None:
+                break
+            
+            line_index = source.line_number(match.start()) - 1
+            line = source.lines[line_index]
+            for pattern, description in self.patterns:
+                if pattern.search(line):
+                    matches.append((line_index + 1, line, description))
+            
+            # Continue from the next line; a match may have run past this one
+            if line_index + 1 >= len(offsets):
+                break
+            position = offsets[line_index + 1]
+        
+        return matches
+
 
 @dataclass
 class SecurityIssue:
@@ -133,22 +331,29 @@ class SecurityAnalyzer:
             'max', 'min', 'oct', 'ord', 'pow', 'range', 'repr', 'reversed', 'round',
             'set', 'slice', 'sorted', 'str', 'sum', 'tuple', 'type', 'zip'
         }
+        
+        self.pattern_scanner = PatternScanner(self.dangerous_patterns)
     
-    async def analyze_security(self, code: str, filename: str = "temp.py") -> List[SecurityIssue]:
+    async def analyze_security(self, code: Union[str, ParsedSource], filename: str = "temp.py") -> List[SecurityIssue]:
         """Analyze code for security vulnerabilities"""
+        return self.analyze_security_sync(code, filename)
+    
+    def analyze_security_sync(self, code: Union[str, ParsedSource], filename: str = "temp.py") -> List[SecurityIssue]:
+        """Blocking security analysis; safe to run in a worker process"""
         issues = []
+        source = ParsedSource.of(code)
         
         try:
             # Pattern-based analysis
-            pattern_issues = self._analyze_patterns(code)
+            pattern_issues = self._analyze_patterns(source)
             issues.extend(pattern_issues)
             
             # AST-based analysis
-            ast_issues = self._analyze_ast(code)
+            ast_issues = self._analyze_ast(source)
             issues.extend(ast_issues)
             
             # Bandit security analysis
-            bandit_issues = await self._run_bandit_analysis(code, filename)
+            bandit_issues = self._run_bandit_analysis(source.code, filename)
             issues.extend(bandit_issues)
             
             logger.info(f"Security analysis found {len(issues)} issues")
@@ -167,33 +372,33 @@ class SecurityAnalyzer:
                 cwe_id=None
             )]
     
-    def _analyze_patterns(self, code: str) -> List[SecurityIssue]:
+    def _analyze_patterns(self, code: Union[str, ParsedSource]) -> List[SecurityIssue]:
         """Analyze code using regex patterns"""
         issues = []
-        lines = code.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            for pattern, description in self.dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(SecurityIssue(
-                        severity='high',
-                        issue_type='dangerous_pattern',
-                        description=description,
-                        line_number=line_num,
-                        column=None,
-                        code_snippet=line.strip(),
-                        recommendation="Review and validate this code pattern",
-                        cwe_id='CWE-94'  # Code Injection
-                    ))
+        
+        for line_num, line, description in self.pattern_scanner.scan(ParsedSource.of(code)):
+            issues.append(SecurityIssue(
+                severity='high',
+                issue_type='dangerous_pattern',
+                description=description,
+                line_number=line_num,
+                column=None,
+                code_snippet=line.strip(),
+                recommendation="Review and validate this code pattern",
+                cwe_id='CWE-94'  # Code Injection
+            ))
         
         return issues
     
-    def _analyze_ast(self, code: str) -> List[SecurityIssue]:
+    def _analyze_ast(self, code: Union[str, ParsedSource]) -> List[SecurityIssue]:
         """Analyze code using AST parsing"""
         issues = []
+        source = ParsedSource.of(code)
         
         try:
-            tree = ast.parse(code)
+            tree = source.tree
+            if tree is None:
+                raise source.syntax_error
             
             for node in ast.walk(tree):
                 # Check for dangerous function calls
@@ -256,49 +461,51 @@ class SecurityAnalyzer:
         
         return issues
     
-    async def _run_bandit_analysis(self, code: str, filename: str) -> List[SecurityIssue]:
+    def _run_bandit_analysis(self, code: str, filename: str) -> List[SecurityIssue]:
         """Run Bandit security analysis"""
         issues = []
         
         try:
-            # Create temporary file for bandit analysis
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-                temp_file.write(code)
-                temp_file.flush()
-                
-                # Configure bandit
-                conf = bandit_config.BanditConfig()
-                b_mgr = bandit_manager.BanditManager(conf, 'file')
-                
-                # Run bandit on the temporary file
-                b_mgr.discover_files([temp_file.name])
-                b_mgr.run_tests()
-                
-                # Process results
-                for result in b_mgr.get_issue_list():
-                    severity_map = {
-                        'LOW': 'low',
-                        'MEDIUM': 'medium', 
-                        'HIGH': 'high'
-                    }
-                    
-                    issues.append(SecurityIssue(
-                        severity=severity_map.get(result.severity, 'medium'),
-                        issue_type='bandit_finding',
-                        description=result.text,
-                        line_number=result.lineno,
-                        column=result.col_offset,
-                        code_snippet=result.get_code(),
-                        recommendation=f"Bandit rule {result.test_id}: {result.text}",
-                        cwe_id=getattr(result, 'cwe', None)
-                    ))
+            b_mgr = bandit_manager.BanditManager(_get_bandit_config(), 'file')
+            
+            # Scan the source from memory the way bandit scans stdin ("-"):
+            # its run_tests() only reads named files or the real stdin fd
+            files = ['<stdin>']
+            b_mgr.files_list = files
+            b_mgr._parse_file('<stdin>', io.BytesIO(code.encode('utf-8')), files)
+            
+            # Process results
+            for result in b_mgr.get_issue_list():
+                severity_map = {
+                    'LOW': 'low',
+                    'MEDIUM': 'medium', 
+                    'HIGH': 'high'
+                }
                 
-                # Clean up
-                Path(temp_file.name).unlink()
+                issues.append(SecurityIssue(
+                    severity=severity_map.get(result.severity, 'medium'),
+                    issue_type='bandit_finding',
+                    description=result.text,
+                    line_number=result.lineno,
+                    column=result.col_offset,
+                    code_snippet=result.get_code(),
+                    recommendation=f"Bandit rule {result.test_id}: {result.text}",
+                    cwe_id=getattr(result, 'cwe', None)
+                ))
         
         except Exception as e:
             logger.warning(f"Bandit analysis failed: {e}")
-            # Don't fail the entire analysis if bandit fails
+            # Don't fail the entire analysis if bandit fails, but report it
+            issues.append(SecurityIssue(
+                severity='low',
+                issue_type='analysis_error',
+                description=f"Bandit analysis failed: {str(e)}",
+                line_number=None,
+                column=None,
+                code_snippet=None,
+                recommendation="Re-run validation or review manually",
+                cwe_id=None
+            ))
         
         return issues
 
@@ -310,25 +517,30 @@ class CodeQualityAnalyzer:
         self.complexity_threshold = 10
         self.line_length_threshold = 100
     
-    async def analyze_quality(self, code: str, filename: str = "temp.py") -> List[CodeQualityIssue]:
+    async def analyze_quality(self, code: Union[str, ParsedSource], filename: str = "temp.py") -> List[CodeQualityIssue]:
         """Analyze code quality"""
+        return self.analyze_quality_sync(code, filename)
+    
+    def analyze_quality_sync(self, code: Union[str, ParsedSource], filename: str = "temp.py") -> List[CodeQualityIssue]:
+        """Blocking quality analysis; safe to run in a worker process"""
         issues = []
+        source = ParsedSource.of(code)
         
         try:
             # Syntax analysis
-            syntax_issues = self._check_syntax(code)
+            syntax_issues = self._check_syntax(source)
             issues.extend(syntax_issues)
             
             # Style analysis
-            style_issues = self._check_style(code)
+            style_issues = self._check_style(source)
             issues.extend(style_issues)
             
             # Complexity analysis
-            complexity_issues = self._check_complexity(code)
+            complexity_issues = self._check_complexity(source)
             issues.extend(complexity_issues)
             
             # Pylint analysis
-            pylint_issues = await self._run_pylint_analysis(code, filename)
+            pylint_issues = self._run_pylint_analysis(source.code, filename)
             issues.extend(pylint_issues)
             
             logger.info(f"Quality analysis found {len(issues)} issues")
@@ -346,13 +558,12 @@ class CodeQualityAnalyzer:
                 suggestion="Manual code review required"
             )]
     
-    def _check_syntax(self, code: str) -> List[CodeQualityIssue]:
+    def _check_syntax(self, code: Union[str, ParsedSource]) -> List[CodeQualityIssue]:
         """Check for syntax errors"""
         issues = []
         
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
+        e = ParsedSource.of(code).syntax_error
+        if e is not None:
             issues.append(CodeQualityIssue(
                 severity='error',
                 category='syntax',
@@ -365,12 +576,11 @@ class CodeQualityAnalyzer:
         
         return issues
     
-    def _check_style(self, code: str) -> List[CodeQualityIssue]:
+    def _check_style(self, code: Union[str, ParsedSource]) -> List[CodeQualityIssue]:
         """Check basic style issues"""
         issues = []
-        lines = code.split('\n')
         
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(ParsedSource.of(code).lines, 1):
             # Line length
             if len(line) > self.line_length_threshold:
                 issues.append(CodeQualityIssue(
@@ -397,14 +607,14 @@ class CodeQualityAnalyzer:
         
         return issues
     
-    def _check_complexity(self, code: str) -> List[CodeQualityIssue]:
+    def _check_complexity(self, code: Union[str, ParsedSource]) -> List[CodeQualityIssue]:
         """Check cyclomatic complexity"""
         issues = []
         
         try:
-            tree = ast.parse(code)
+            tree = ParsedSource.of(code).tree
             
-            for node in ast.walk(tree):
+            for node in (ast.walk(tree) if tree is not None else ()):
                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     complexity = self._calculate_complexity(node)
                     if complexity > self.complexity_threshold:
@@ -437,81 +647,75 @@ class CodeQualityAnalyzer:
         
         return complexity
     
-    async def _run_pylint_analysis(self, code: str, filename: str) -> List[CodeQualityIssue]:
+    def _run_pylint_analysis(self, code: str, filename: str) -> List[CodeQualityIssue]:
         """Run Pylint analysis"""
         issues = []
         
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-                temp_file.write(code)
-                temp_file.flush()
+            for msg in _lint_with_pylint(code, filename):
+                message = f"{msg.msg_id}: {msg.msg} ({msg.symbol})"
                 
-                # Capture pylint output
-                output = io.StringIO()
-                reporter = TextReporter(output)
+                # Extract rule ID and message
+                rule_match = re.search(r'\(([A-Z]\d+)\)', message)
+                rule_id = rule_match.group(1) if rule_match else None
                 
-                # Run pylint
-                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
-                    try:
-                        pylint.lint.Run([temp_file.name, '--reports=n', '--score=n'], reporter=reporter, exit=False)
-                    except SystemExit:
-                        pass  # Pylint calls sys.exit, ignore it
-                
-                # Parse pylint output
-                pylint_output = output.getvalue()
-                for line in pylint_output.split('\n'):
-                    if ':' in line and temp_file.name in line:
-                        parts = line.split(':')
-                        if len(parts) >= 4:
-                            try:
-                                line_num = int(parts[1])
-                                col_num = int(parts[2]) if parts[2].isdigit() else None
-                                message_parts = parts[3:]
-                                message = ':'.join(message_parts).strip()
-                                
-                                # Extract rule ID and message
-                                rule_match = re.search(r'\(([A-Z]\d+)\)', message)
-                                rule_id = rule_match.group(1) if rule_match else None
-                                
-                                # Determine severity
-                                if message.startswith('E'):
-                                    severity = 'error'
-                                elif message.startswith('W'):
-                                    severity = 'warning'
-                                else:
-                                    severity = 'info'
-                                
-                                issues.append(CodeQualityIssue(
-                                    severity=severity,
-                                    category='pylint',
-                                    message=message,
-                                    line_number=line_num,
-                                    column=col_num,
-                                    rule_id=rule_id,
-                                    suggestion="Follow pylint recommendations"
-                                ))
-                            except (ValueError, IndexError):
-                                continue
+                # Determine severity
+                if message.startswith('E'):
+                    severity = 'error'
+                elif message.startswith('W'):
+                    severity = 'warning'
+                else:
+                    severity = 'info'
                 
-                # Clean up
-                Path(temp_file.name).unlink()
+                issues.append(CodeQualityIssue(
+                    severity=severity,
+                    category='pylint',
+                    message=message,
+                    line_number=msg.line,
+                    column=msg.column,
+                    rule_id=rule_id,
+                    suggestion="Follow pylint recommendations"
+                ))
         
         except Exception as e:
             logger.warning(f"Pylint analysis failed: {e}")
+            issues.append(CodeQualityIssue(
+                severity='info',
+                category='analysis_error',
+                message=f"Pylint analysis failed: {str(e)}",
+                line_number=None,
+                column=None,
+                rule_id=None,
+                suggestion="Re-run validation or review manually"
+            ))
         
         return issues
 
 
 class FunctionalityTester:
-    """Tests code functionality and execution safety"""
+    """Tests code functionality and execution safety
     
-    def __init__(self):
+    Import checks and execution run in the shared warm sandbox pool (see
+    atles.code_sandbox), never in the host interpreter.
+    """
+    
+    def __init__(self, sandbox_workers: int = 2):
         self.timeout = 5  # seconds
         self.max_memory = 100 * 1024 * 1024  # 100MB
+        self.sandbox_workers = sandbox_workers
     
-    async def test_functionality(self, code: str) -> Dict[str, Any]:
+    @property
+    def sandbox(self) -> SandboxPool:
+        """Sandbox pool for this process (looked up on use so the tester stays picklable)"""
+        return get_sandbox_pool(size=self.sandbox_workers, timeout=self.timeout,
+                                cpu_seconds=self.timeout, memory_bytes=self.max_memory)
+    
+    async def test_functionality(self, code: Union[str, ParsedSource]) -> Dict[str, Any]:
         """Test if code is functional and safe to execute"""
+        return self.test_functionality_sync(code)
+    
+    def test_functionality_sync(self, code: Union[str, ParsedSource]) -> Dict[str, Any]:
+        """Blocking functionality test; safe to run in a worker process"""
         results = {
             'syntax_valid': False,
             'imports_valid': False,
@@ -521,132 +725,265 @@ class FunctionalityTester:
             'performance_metrics': {}
         }
         
+        source = ParsedSource.of(code)
+        
         try:
             # Test 1: Syntax validation
-            results['syntax_valid'] = self._test_syntax(code)
-            
-            # Test 2: Import validation
-            results['imports_valid'] = await self._test_imports(code)
+            results['syntax_valid'] = self._test_syntax(source)
             
-            # Test 3: Safe execution test (in sandbox)
-            if results['syntax_valid'] and results['imports_valid']:
-                execution_result = await self._test_safe_execution(code)
-                results.update(execution_result)
+            # Tests 2 and 3: import validation and safe execution, in a
+            # single sandbox round trip
+            if results['syntax_valid']:
+                sandbox_result = self.sandbox.run(source.code, check_imports=True, execute=True)
+                results['imports_valid'] = sandbox_result.pop('imports_valid', False)
+                results['runtime_errors'].extend(sandbox_result.pop('runtime_errors', []))
+                if results['imports_valid']:
+                    results.update(sandbox_result)
             
             logger.info(f"Functionality test completed: {results}")
             return results
             
         except Exception as e:
             logger.error(f"Functionality test failed: {e}")
-            results['runtime_errors'].append(str(e))
+            results['runtime_errors'].append(f"Sandbox error: {e}")
             return results
     
-    def _test_syntax(self, code: str) -> bool:
+    def _test_syntax(self, code: Union[str, ParsedSource]) -> bool:
         """Test if code has valid syntax"""
-        try:
-            ast.parse(code)
-            return True
-        except SyntaxError:
-            return False
+        return ParsedSource.of(code).syntax_error is None
     
-    async def _test_imports(self, code: str) -> bool:
-        """Test if all imports are available"""
-        try:
-            tree = ast.parse(code)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        try:
-                            importlib.import_module(alias.name)
-                        except ImportError:
-                            return False
-                
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        try:
-                            module = importlib.import_module(node.module)
-                            for alias in node.names:
-                                if not hasattr(module, alias.name):
-                                    return False
-                        except ImportError:
-                            return False
-            
-            return True
-            
-        except Exception:
+    def _test_imports(self, code: Union[str, ParsedSource]) -> bool:
+        """Test if all imports are available (imported in a sandbox worker)"""
+        source = ParsedSource.of(code)
+        if source.tree is None:
             return False
+        return self.sandbox.run(source.code, check_imports=True, execute=False).get('imports_valid', False)
     
-    async def _test_safe_execution(self, code: str) -> Dict[str, Any]:
-        """Test code execution in a controlled environment"""
+    def _test_safe_execution(self, code: Union[str, ParsedSource]) -> Dict[str, Any]:
+        """Test code execution in a sandbox worker with time and memory limits"""
         results = {
             'execution_safe': False,
             'runtime_errors': [],
             'performance_metrics': {}
         }
         
-        try:
-            # Create a restricted execution environment
-            restricted_globals = {
-                '__builtins__': {
-                    name: getattr(__builtins__, name) 
-                    for name in dir(__builtins__) 
-                    if name in SecurityAnalyzer().safe_builtins
-                }
-            }
-            
-            # Compile the code
-            compiled_code = compile(code, '<string>', 'exec')
-            
-            # Execute with timeout and memory limits
-            start_time = datetime.now()
-            
-            try:
-                exec(compiled_code, restricted_globals, {})
-                results['execution_safe'] = True
-                
-                end_time = datetime.now()
-                execution_time = (end_time - start_time).total_seconds()
-                
-                results['performance_metrics'] = {
-                    'execution_time_seconds': execution_time,
-                    'memory_safe': True  # Simplified - would need more sophisticated monitoring
-                }
-                
-            except Exception as e:
-                results['runtime_errors'].append(f"Runtime error: {str(e)}")
-                results['execution_safe'] = False
+        results.update(self.sandbox.run(ParsedSource.of(code).code, check_imports=False, execute=True))
+        return results
+
+
+# Analyzer process pools shared by every CodeValidationAPI, by worker count
+_analysis_pools: Dict[int, ProcessPoolExecutor] = {}
+_analysis_pools_lock = threading.Lock()
+
+
+def get_analysis_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared analyzer process pool, starting it on first use."""
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    with _analysis_pools_lock:
+        pool = _analysis_pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_up_analyzers)
+            _analysis_pools[workers] = pool
+        return pool
+
+
+def shutdown_analysis_pools(wait: bool = True):
+    """Stop all shared analyzer process pools."""
+    with _analysis_pools_lock:
+        pools = list(_analysis_pools.values())
+        _analysis_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _discard_analysis_pool(pool: ProcessPoolExecutor):
+    with _analysis_pools_lock:
+        for workers, existing in list(_analysis_pools.items()):
+            if existing is pool:
+                del _analysis_pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ValidationResultCache:
+    """
+    Bounded LRU cache of analyzer results, keyed by the source text, the
+    filename and the analyzer configuration.
+    
+    Entries expire after ``ttl`` seconds so changes outside the key (such as
+    newly installed packages affecting import checks) are eventually seen.
+    Callers get deep copies and may mutate them freely. Results of runs that
+    failed for reasons other than the code (see ``is_cacheable``) are never
+    stored.
+    """
+    
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = 3600.0):
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    @staticmethod
+    def make_key(code: str, filename: str, config: Dict[str, Any]) -> str:
+        """Content address for one validation request."""
+        canonical = json.dumps(config, sort_keys=True, default=repr, separators=(",", ":"))
+        digest = hashlib.sha256()
+        for part in (canonical, filename, code):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> tuple:
+        """Return ``(found, value)`` for a key, expiring stale entries."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
         
-        except Exception as e:
-            results['runtime_errors'].append(f"Compilation error: {str(e)}")
-            results['execution_safe'] = False
+        value, stored_at = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
         
-        return results
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, copy.deepcopy(value)
+    
+    @staticmethod
+    def is_cacheable(analyses: Tuple[List[SecurityIssue], List[CodeQualityIssue], Dict[str, Any]]) -> bool:
+        """Whether analyzer results reflect the code rather than a transient failure.
+        
+        Results are transient when an analyzer reported its own failure or
+        the sandbox timed out or crashed, e.g. on a loaded host.
+        """
+        security_issues, quality_issues, functionality_results = analyses
+        if any(issue.issue_type == 'analysis_error' for issue in security_issues):
+            return False
+        if any(issue.category == 'analysis_error' for issue in quality_issues):
+            return False
+        return not any(is_sandbox_failure(str(error))
+                       for error in functionality_results.get('runtime_errors', []))
+    
+    def put(self, key: str, value: Any):
+        """Store a copy of a value, evicting the least recently used entry when full."""
+        self._entries[key] = (copy.deepcopy(value), time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Remove all cached results."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, configuration and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
 
 
 class CodeValidationAPI:
     """Main API for comprehensive code validation"""
     
-    def __init__(self):
+    BACKENDS = ('process', 'thread')
+    
+    def __init__(self, backend: str = 'process', max_workers: Optional[int] = None,
+                 cache_size: int = 256, history_size: int = 1000):
+        """
+        Args:
+            backend: 'process' runs the analyzers in a shared worker process
+                pool so they overlap and the event loop stays free; 'thread'
+                runs them in the event loop's default thread pool.
+            max_workers: Size of the process pool (defaults to the CPU count, at most 8).
+            cache_size: Number of analyzer results kept for re-validation of
+                unchanged code (0 disables the cache).
+            history_size: Number of validations kept in ``validation_history``.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown validation backend: {backend}")
+        self.backend = backend
+        self.max_workers = max_workers
         self.security_analyzer = SecurityAnalyzer()
         self.quality_analyzer = CodeQualityAnalyzer()
         self.functionality_tester = FunctionalityTester()
-        self.validation_history = []
+        self.result_cache = ValidationResultCache(cache_size) if cache_size > 0 else None
+        self.validation_history = deque(maxlen=history_size)
+        self.total_validations = 0
+    
+    def _analyzer_config(self) -> Dict[str, Any]:
+        """Everything besides the source that the analyzer results depend on"""
+        return {
+            'dangerous_patterns': self.security_analyzer.dangerous_patterns,
+            'complexity_threshold': self.quality_analyzer.complexity_threshold,
+            'line_length_threshold': self.quality_analyzer.line_length_threshold,
+            'timeout': self.functionality_tester.timeout,
+            'max_memory': self.functionality_tester.max_memory,
+            'pylint': [pylint.__version__] + PYLINT_ARGS,
+            'bandit': getattr(bandit, '__version__', None)
+        }
+    
+    async def _run_analyses(self, code: str, filename: str) -> Tuple[List[SecurityIssue], List[CodeQualityIssue], Dict[str, Any]]:
+        """Run the three analyzers concurrently on the configured backend"""
+        loop = asyncio.get_running_loop()
+        
+        # One parse artifact per request; worker processes each rebuild it once
+        source = ParsedSource(code)
+        jobs = [
+            (self.security_analyzer.analyze_security_sync, (source, filename)),
+            (self.quality_analyzer.analyze_quality_sync, (source, filename)),
+            (self.functionality_tester.test_functionality_sync, (source,))
+        ]
+        
+        if self.backend == 'process':
+            pool = get_analysis_pool(self.max_workers)
+            try:
+                return tuple(await asyncio.gather(*[
+                    loop.run_in_executor(pool, function, *args) for function, args in jobs
+                ]))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); start a fresh pool next time
+                logger.warning("Analyzer process pool broke; retrying in threads")
+                _discard_analysis_pool(pool)
+        
+        return tuple(await asyncio.gather(*[
+            loop.run_in_executor(None, function, *args) for function, args in jobs
+        ]))
     
     async def validate_code(self, code: str, filename: str = "generated_code.py") -> ValidationResult:
         """Perform comprehensive code validation"""
         try:
             logger.info(f"Starting comprehensive validation for {filename}")
             
-            # Run all analyses in parallel
-            security_task = asyncio.create_task(self.security_analyzer.analyze_security(code, filename))
-            quality_task = asyncio.create_task(self.quality_analyzer.analyze_quality(code, filename))
-            functionality_task = asyncio.create_task(self.functionality_tester.test_functionality(code))
+            # Re-validation of unchanged code is served from the cache
+            cache_key = None
+            cache_hit = False
+            if self.result_cache is not None:
+                cache_key = self.result_cache.make_key(code, filename, self._analyzer_config())
+                cache_hit, cached = self.result_cache.get(cache_key)
             
-            # Wait for all analyses to complete
-            security_issues, quality_issues, functionality_results = await asyncio.gather(
-                security_task, quality_task, functionality_task
-            )
+            if cache_hit:
+                security_issues, quality_issues, functionality_results = cached
+            else:
+                # Run all analyses in parallel
+                analyses = await self._run_analyses(code, filename)
+                if cache_key is not None and self.result_cache.is_cacheable(analyses):
+                    self.result_cache.put(cache_key, analyses)
+                security_issues, quality_issues, functionality_results = analyses
             
             # Calculate scores
             security_score = self._calculate_security_score(security_issues)
@@ -689,8 +1026,10 @@ class CodeValidationAPI:
                 'is_valid': is_valid,
                 'is_secure': is_secure,
                 'security_score': security_score,
-                'quality_score': quality_score
+                'quality_score': quality_score,
+                'cache_hit': cache_hit
             })
+            self.total_validations += 1
             
             logger.info(f"Validation completed: valid={is_valid}, secure={is_secure}, functional={is_functional}")
             return result
@@ -791,18 +1130,23 @@ class CodeValidationAPI:
         if not self.validation_history:
             return {'message': 'No validations performed yet'}
         
-        recent_validations = self.validation_history[-10:]
+        recent_validations = list(self.validation_history)[-10:]
         
         return {
-            'total_validations': len(self.validation_history),
+            'total_validations': self.total_validations,
             'recent_validations': len(recent_validations),
             'avg_security_score': sum(v['security_score'] for v in recent_validations) / len(recent_validations),
             'avg_quality_score': sum(v['quality_score'] for v in recent_validations) / len(recent_validations),
             'success_rate': len([v for v in recent_validations if v['is_valid']]) / len(recent_validations),
-            'security_pass_rate': len([v for v in recent_validations if v['is_secure']]) / len(recent_validations)
+            'security_pass_rate': len([v for v in recent_validations if v['is_secure']]) / len(recent_validations),
+            'result_cache': self.result_cache.get_stats() if self.result_cache is not None else None
         }
 
 
+# Shared by validate_generated_code so re-validated drafts hit its cache
+_default_validation_api: Optional[CodeValidationAPI] = None
+
+
 # Integration function for ATLES
 async def validate_generated_code(code: str, filename: str = "ai_generated.py") -> ValidationResult:
     """
@@ -816,8 +1160,10 @@ async def validate_generated_code(code: str, filename: str = "ai_generated.py")
     3. Suggest improvements
     4. Ensure code actually works
     """
-    api = CodeValidationAPI()
-    return await api.validate_code(code, filename)
+    global _default_validation_api
+    if _default_validation_api is None:
+        _default_validation_api = CodeValidationAPI()
+    return await _default_validation_api.validate_code(code, filename)
 
 
 # Test function
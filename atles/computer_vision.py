@@ -10,10 +10,17 @@ This ensures all CV code examples are functional and can be executed immediately
 """
 
 import asyncio
+import hashlib
 import logging
 import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 import numpy as np
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import cv2
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
@@ -24,12 +31,14 @@ import base64
 import io
 from datetime import datetime
 from dataclasses import dataclass, asdict
-import tempfile
 import requests
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Pixel types cv2.meanStdDev accepts; others fall back to numpy
+MEAN_STD_DTYPES = {np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)}
+
 
 @dataclass
 class CVProcessingResult:
@@ -47,6 +56,98 @@ class CVProcessingResult:
         return asdict(self)
 
 
+class ModelRegistry:
+    """
+    Process-wide cache of loaded models.
+    
+    Each model is loaded once and stays resident until it is evicted, either
+    because more than ``max_models`` are loaded (least recently used first)
+    or because it has not been used for ``idle_timeout`` seconds.
+    """
+    
+    def __init__(self, max_models: int = 2, idle_timeout: Optional[float] = 600.0):
+        self.max_models = max_models
+        self.idle_timeout = idle_timeout
+        self._models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+    
+    def get(self, model_id: str, loader: Callable[[], Any]) -> Any:
+        """Return a resident model, loading it with ``loader`` if needed."""
+        with self._lock:
+            self.evict_idle()
+            entry = self._models.get(model_id)
+            if entry is None:
+                logger.info(f"Loading model into registry: {model_id}")
+                entry = {"model": loader(), "loaded_at": time.time()}
+                self._models[model_id] = entry
+                self.loads += 1
+            else:
+                self.hits += 1
+            
+            entry["last_used"] = time.monotonic()
+            self._models.move_to_end(model_id)
+            
+            while len(self._models) > self.max_models:
+                evicted_id, _ = self._models.popitem(last=False)
+                self.evictions += 1
+                logger.info(f"Evicted model from registry: {evicted_id}")
+            
+            return entry["model"]
+    
+    def peek(self, model_id: str) -> Optional[Any]:
+        """Return a resident model without loading it or updating its use time."""
+        with self._lock:
+            entry = self._models.get(model_id)
+            return entry["model"] if entry else None
+    
+    def evict_idle(self) -> int:
+        """Evict models idle for longer than the idle timeout."""
+        if self.idle_timeout is None:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            idle = [model_id for model_id, entry in self._models.items()
+                    if now - entry["last_used"] > self.idle_timeout]
+            for model_id in idle:
+                del self._models[model_id]
+                self.evictions += 1
+                logger.info(f"Evicted idle model from registry: {model_id}")
+            return len(idle)
+    
+    def evict(self, model_id: str) -> bool:
+        """Evict a specific model."""
+        with self._lock:
+            if self._models.pop(model_id, None) is None:
+                return False
+            self.evictions += 1
+            return True
+    
+    def clear(self):
+        """Evict all models."""
+        with self._lock:
+            self.evictions += len(self._models)
+            self._models.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Resident models and load statistics."""
+        with self._lock:
+            return {
+                "resident_models": list(self._models.keys()),
+                "max_models": self.max_models,
+                "idle_timeout": self.idle_timeout,
+                "loads": self.loads,
+                "hits": self.hits,
+                "evictions": self.evictions
+            }
+
+
+# Shared by every ObjectDetector in the process
+MODEL_REGISTRY = ModelRegistry()
+
+
 class ImageProcessor:
     """Core image processing utilities for ATLES."""
     
@@ -56,6 +157,10 @@ class ImageProcessor:
     
     async def load_image(self, image_path: Union[str, Path]) -> Optional[np.ndarray]:
         """Load an image from file path."""
+        return self.read_image(image_path)
+    
+    def read_image(self, image_path: Union[str, Path]) -> Optional[np.ndarray]:
+        """Decode an image file; blocking, so it can run on a worker thread."""
         try:
             image_path = Path(image_path)
             if not image_path.exists():
@@ -183,65 +288,99 @@ class ImageProcessor:
     async def extract_features(self, image: np.ndarray) -> Dict[str, Any]:
         """Extract basic image features and statistics."""
         try:
-            features = {}
-            
-            # Basic image info
-            features['shape'] = image.shape
-            features['dtype'] = str(image.dtype)
-            features['size_bytes'] = image.nbytes
-            
-            # Color statistics
-            if len(image.shape) == 3:
-                features['channels'] = image.shape[2]
-                features['color_mean'] = {
-                    'R': float(np.mean(image[:, :, 0])),
-                    'G': float(np.mean(image[:, :, 1])),
-                    'B': float(np.mean(image[:, :, 2]))
-                }
-                features['color_std'] = {
-                    'R': float(np.std(image[:, :, 0])),
-                    'G': float(np.std(image[:, :, 1])),
-                    'B': float(np.std(image[:, :, 2]))
-                }
-            else:
-                features['channels'] = 1
-                features['grayscale_mean'] = float(np.mean(image))
-                features['grayscale_std'] = float(np.std(image))
-            
-            # Brightness and contrast
-            features['brightness'] = float(np.mean(image))
-            features['contrast'] = float(np.std(image))
-            
-            # Histogram analysis
-            if len(image.shape) == 3:
-                hist_r = cv2.calcHist([image], [0], None, [256], [0, 256])
-                hist_g = cv2.calcHist([image], [1], None, [256], [0, 256])
-                hist_b = cv2.calcHist([image], [2], None, [256], [0, 256])
-                
-                features['histogram'] = {
-                    'R': hist_r.flatten().tolist(),
-                    'G': hist_g.flatten().tolist(),
-                    'B': hist_b.flatten().tolist()
-                }
-            else:
-                hist = cv2.calcHist([image], [0], None, [256], [0, 256])
-                features['histogram'] = hist.flatten().tolist()
-            
+            features = self.extract_features_batch([image])[0]
             logger.info(f"Extracted features for image: {features['shape']}")
             return features
             
         except Exception as e:
             logger.error(f"Error extracting features: {e}")
             return {}
+    
+    def extract_features_batch(self, images: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        Extract features for many images.
+        
+        Statistics are computed one image at a time with cv2.meanStdDev,
+        which needs no float copy of the pixels; stacking a batch would only
+        multiply peak memory. Batching pays off in the model calls instead.
+        """
+        return [self._build_features(image, *self._image_statistics(image)) for image in images]
+    
+    @staticmethod
+    def _image_statistics(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Per-channel and overall mean and standard deviation of an image."""
+        channels = image.shape[2] if image.ndim == 3 else 1
+        if channels <= 4 and image.dtype in MEAN_STD_DTYPES:
+            channel_mean, channel_std = cv2.meanStdDev(np.ascontiguousarray(image))
+            channel_mean, channel_std = channel_mean.ravel(), channel_std.ravel()
+        else:
+            axes = (0, 1) if image.ndim == 3 else None
+            channel_mean = np.atleast_1d(image.mean(axis=axes))
+            channel_std = np.atleast_1d(image.std(axis=axes))
+        
+        # Every channel has the same pixel count, so the overall moments follow from the channels'
+        mean = float(channel_mean.mean())
+        variance = float((channel_std ** 2 + channel_mean ** 2).mean()) - mean ** 2
+        return channel_mean, channel_std, mean, max(variance, 0.0) ** 0.5
+    
+    def _build_features(self, image: np.ndarray, channel_mean, channel_std,
+                        mean: float, std: float) -> Dict[str, Any]:
+        features = {}
+        
+        # Basic image info
+        features['shape'] = image.shape
+        features['dtype'] = str(image.dtype)
+        features['size_bytes'] = image.nbytes
+        
+        # Color statistics
+        if len(image.shape) == 3:
+            features['channels'] = image.shape[2]
+            features['color_mean'] = {
+                'R': float(channel_mean[0]),
+                'G': float(channel_mean[1]),
+                'B': float(channel_mean[2])
+            }
+            features['color_std'] = {
+                'R': float(channel_std[0]),
+                'G': float(channel_std[1]),
+                'B': float(channel_std[2])
+            }
+        else:
+            features['channels'] = 1
+            features['grayscale_mean'] = float(mean)
+            features['grayscale_std'] = float(std)
+        
+        # Brightness and contrast
+        features['brightness'] = float(mean)
+        features['contrast'] = float(std)
+        
+        # Histogram analysis
+        if len(image.shape) == 3:
+            hist_r = cv2.calcHist([image], [0], None, [256], [0, 256])
+            hist_g = cv2.calcHist([image], [1], None, [256], [0, 256])
+            hist_b = cv2.calcHist([image], [2], None, [256], [0, 256])
+            
+            features['histogram'] = {
+                'R': hist_r.flatten().tolist(),
+                'G': hist_g.flatten().tolist(),
+                'B': hist_b.flatten().tolist()
+            }
+        else:
+            hist = cv2.calcHist([image], [0], None, [256], [0, 256])
+            features['histogram'] = hist.flatten().tolist()
+        
+        return features
 
 
 class ObjectDetector:
     """Object detection and recognition capabilities."""
     
-    def __init__(self, model_path: Optional[Path] = None):
+    DEFAULT_MODEL_ID = "microsoft/resnet-50"
+    
+    def __init__(self, model_path: Optional[Path] = None, registry: Optional[ModelRegistry] = None):
         self.model_path = model_path
-        self.model = None
-        self.processor = None
+        self.registry = registry or MODEL_REGISTRY
+        self.model_id = str(model_path) if model_path else self.DEFAULT_MODEL_ID
         self._loaded = False
         
         # Common object categories
@@ -260,17 +399,40 @@ class ObjectDetector:
             'toothbrush'
         ]
     
-    async def load_model(self, model_id: str = "microsoft/resnet-50") -> bool:
-        """Load object detection model."""
+    @property
+    def model(self):
+        """The resident classification model, or None if not loaded."""
+        bundle = self.registry.peek(self.model_id) if self._loaded else None
+        return bundle[1] if bundle else None
+    
+    @property
+    def processor(self):
+        """The resident image processor, or None if not loaded."""
+        bundle = self.registry.peek(self.model_id) if self._loaded else None
+        return bundle[0] if bundle else None
+    
+    @staticmethod
+    def _load_bundle(model_id: str) -> Tuple[Any, Any]:
+        processor = AutoImageProcessor.from_pretrained(model_id)
+        model = AutoModelForImageClassification.from_pretrained(model_id)
+        model.eval()
+        return processor, model
+    
+    def _get_bundle(self) -> Tuple[Any, Any]:
+        """Processor and model from the registry, loading them on first use."""
+        return self.registry.get(self.model_id, lambda: self._load_bundle(self.model_id))
+    
+    async def load_model(self, model_id: Optional[str] = None) -> bool:
+        """Load object detection model (once per process, via the model registry)."""
         try:
-            logger.info(f"Loading object detection model: {model_id}")
+            if model_id:
+                self.model_id = model_id
+            logger.info(f"Loading object detection model: {self.model_id}")
             
-            # Load model and processor
-            self.processor = AutoImageProcessor.from_pretrained(model_id)
-            self.model = AutoModelForImageClassification.from_pretrained(model_id)
+            self._get_bundle()
             
             self._loaded = True
-            logger.info(f"Object detection model loaded successfully: {model_id}")
+            logger.info(f"Object detection model loaded successfully: {self.model_id}")
             return True
             
         except Exception as e:
@@ -280,50 +442,64 @@ class ObjectDetector:
     async def detect_objects(self, image: np.ndarray, confidence_threshold: float = 0.5) -> Dict[str, Any]:
         """Detect objects in an image."""
         try:
-            if not self._loaded:
-                await self.load_model()
+            result = self.detect_objects_batch([image], confidence_threshold)[0]
+            logger.info(f"Detected {result['total_objects']} objects in image")
+            return result
             
-            # Convert numpy array to PIL Image
-            pil_image = Image.fromarray(image)
+        except Exception as e:
+            logger.error(f"Error detecting objects: {e}")
+            return {"detections": [], "error": str(e)}
+    
+    def detect_objects_batch(self, images: List[np.ndarray], confidence_threshold: float = 0.5,
+                             batch_size: int = 16) -> List[Dict[str, Any]]:
+        """
+        Classify many images with batched forward passes.
+        
+        Blocking, so callers on the event loop should run it in an executor.
+        Images are grouped by size so that each batch is preprocessed from
+        similarly shaped inputs.
+        """
+        # Resident model; only loaded if this is the first use or it was evicted
+        processor, model = self._get_bundle()
+        self._loaded = True
+        model_id = model.config.name_or_path if model else "unknown"
+        
+        order = sorted(range(len(images)), key=lambda i: images[i].shape)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
             
-            # Preprocess image
-            inputs = self.processor(pil_image, return_tensors="pt")
+            # Preprocess the batch into a single stacked tensor
+            inputs = processor([Image.fromarray(images[i]) for i in indices], return_tensors="pt")
             
             # Get predictions
             with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
+                logits = model(**inputs).logits
             
-            # Get probabilities
+            # Get probabilities and top predictions for every image at once
             probs = torch.nn.functional.softmax(logits, dim=-1)
-            
-            # Get top predictions
             top_probs, top_indices = torch.topk(probs, 10)
             
-            # Format results
-            detections = []
-            for prob, idx in zip(top_probs[0], top_indices[0]):
-                if prob > confidence_threshold:
-                    category = self.coco_categories[idx] if idx < len(self.coco_categories) else f"class_{idx}"
-                    detections.append({
-                        "category": category,
-                        "confidence": float(prob),
-                        "class_id": int(idx)
-                    })
-            
-            result = {
-                "detections": detections,
-                "total_objects": len(detections),
-                "confidence_threshold": confidence_threshold,
-                "model_id": self.model.config.name_or_path if self.model else "unknown"
-            }
-            
-            logger.info(f"Detected {len(detections)} objects in image")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error detecting objects: {e}")
-            return {"detections": [], "error": str(e)}
+            for row, index in enumerate(indices):
+                detections = []
+                for prob, idx in zip(top_probs[row].tolist(), top_indices[row].tolist()):
+                    if prob > confidence_threshold:
+                        category = self.coco_categories[idx] if idx < len(self.coco_categories) else f"class_{idx}"
+                        detections.append({
+                            "category": category,
+                            "confidence": float(prob),
+                            "class_id": int(idx)
+                        })
+                
+                results[index] = {
+                    "detections": detections,
+                    "total_objects": len(detections),
+                    "confidence_threshold": confidence_threshold,
+                    "model_id": model_id
+                }
+        
+        return results
     
     async def draw_detections(self, image: np.ndarray, detections: List[Dict[str, Any]]) -> np.ndarray:
         """Draw bounding boxes and labels for detected objects."""
@@ -362,23 +538,52 @@ class ObjectDetector:
 class ImageAnalyzer:
     """Advanced image analysis and interpretation."""
     
-    def __init__(self):
-        self.processor = ImageProcessor()
+    def __init__(self, processor: Optional[ImageProcessor] = None, detector: Optional[ObjectDetector] = None,
+                 result_cache: Optional["CVResultCache"] = None, analysis_max_side: Optional[int] = 512):
+        self.processor = processor or ImageProcessor()
+        self.detector = detector or ObjectDetector()
+        self.result_cache = result_cache
+        # Composition analysis runs on a copy downscaled to this size (None for full resolution)
+        self.analysis_max_side = analysis_max_side
     
-    async def analyze_image(self, image_path: Union[str, Path]) -> Dict[str, Any]:
-        """Comprehensive image analysis."""
+    async def analyze_image(self, image_path: Union[str, Path],
+                            image: Optional[np.ndarray] = None,
+                            features: Optional[Dict[str, Any]] = None,
+                            detections: Optional[Dict[str, Any]] = None,
+                            content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Comprehensive image analysis.
+        
+        Callers that already decoded the image, extracted features or ran
+        detection can pass those results to avoid repeating the work. With a
+        result cache, unchanged images are served from it by content hash.
+        """
         try:
+            if self.result_cache is not None and content_hash is None:
+                try:
+                    content_hash = image_content_hash(image_path if image is None else image)
+                except (OSError, TypeError, ValueError):
+                    content_hash = None
+            
+            if self.result_cache is not None and content_hash:
+                cached = self.result_cache.get(content_hash, "analyze", self.detector.model_id)
+                if cached is not None:
+                    cached["image_path"] = str(image_path)
+                    return cached
+            
             # Load image
-            image = await self.processor.load_image(image_path)
             if image is None:
-                return {"error": "Failed to load image"}
+                image = await self.processor.load_image(image_path)
+                if image is None:
+                    return {"error": "Failed to load image"}
             
             # Extract basic features
-            features = await self.processor.extract_features(image)
+            if features is None:
+                features = await self.processor.extract_features(image)
             
             # Perform object detection
-            detector = ObjectDetector()
-            detections = await detector.detect_objects(image)
+            if detections is None:
+                detections = await self.detector.detect_objects(image)
             
             # Analyze image composition
             composition = await self._analyze_composition(image)
@@ -392,6 +597,9 @@ class ImageAnalyzer:
                 "summary": await self._generate_summary(features, detections, composition)
             }
             
+            if self.result_cache is not None and content_hash and "error" not in detections:
+                self.result_cache.put(content_hash, "analyze", self.detector.model_id, analysis)
+            
             logger.info(f"Completed comprehensive analysis of {image_path}")
             return analysis
             
@@ -402,51 +610,87 @@ class ImageAnalyzer:
     async def _analyze_composition(self, image: np.ndarray) -> Dict[str, Any]:
         """Analyze image composition and visual elements."""
         try:
-            composition = {}
-            
-            # Rule of thirds analysis
-            h, w = image.shape[:2]
-            third_w = w // 3
-            third_h = h // 3
-            
-            # Check if main subjects align with rule of thirds
-            center_region = image[third_h:2*third_h, third_w:2*third_w]
-            edge_regions = image.copy()
-            edge_regions[third_h:2*third_h, third_w:2*third_w] = 0
-            
-            composition['rule_of_thirds'] = {
-                'center_region_variance': float(np.var(center_region)),
-                'edge_regions_variance': float(np.var(edge_regions)),
-                'composition_balance': float(np.var(edge_regions) / (np.var(center_region) + 1e-8))
-            }
-            
-            # Color harmony analysis
-            if len(image.shape) == 3:
-                # Convert to HSV for color analysis
-                hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
-                
-                # Analyze hue distribution
-                hue = hsv[:, :, 0]
-                composition['color_harmony'] = {
-                    'hue_variance': float(np.var(hue)),
-                    'saturation_mean': float(np.mean(hsv[:, :, 1])),
-                    'value_mean': float(np.mean(hsv[:, :, 2]))
-                }
-            
-            # Edge density analysis
-            gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if len(image.shape) == 3 else image
-            edges = cv2.Canny(gray, 50, 150)
-            composition['edge_analysis'] = {
-                'edge_density': float(np.sum(edges > 0) / edges.size),
-                'edge_distribution': float(np.std(edges))
-            }
-            
-            return composition
+            return self.compute_composition(image)
             
         except Exception as e:
             logger.error(f"Error analyzing composition: {e}")
             return {}
     
+    def _working_copy(self, image: np.ndarray) -> np.ndarray:
+        """Area-downscaled copy for analysis; the image itself if it is small enough."""
+        h, w = image.shape[:2]
+        longest = max(h, w)
+        if not self.analysis_max_side or longest <= self.analysis_max_side:
+            return image
+        scale = self.analysis_max_side / longest
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    
+    @staticmethod
+    def _region_moments(sums: np.ndarray, squares: np.ndarray,
+                        y1: int, y2: int, x1: int, x2: int) -> Tuple[float, float]:
+        """Sum and sum of squares of a region from summed-area tables."""
+        def region(table):
+            return float(np.sum(table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]))
+        return region(sums), region(squares)
+    
+    def compute_composition(self, image: np.ndarray) -> Dict[str, Any]:
+        """
+        Composition, colour and edge statistics in a single pass over a working copy.
+        
+        Region variances come from summed-area tables instead of masked
+        copies, and the grayscale and HSV conversions are each done once.
+        """
+        composition = {}
+        work = self._working_copy(image)
+        
+        # Rule of thirds analysis
+        h, w = work.shape[:2]
+        channels = work.shape[2] if work.ndim == 3 else 1
+        third_w = w // 3
+        third_h = h // 3
+        
+        sums, squares = cv2.integral2(work, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        total_sum, total_sq = self._region_moments(sums, squares, 0, h, 0, w)
+        center_sum, center_sq = self._region_moments(sums, squares, third_h, 2 * third_h, third_w, 2 * third_w)
+        
+        # Centre variance over the middle third; edge variance over the whole
+        # frame with the centre treated as zero
+        center_count = max(1, third_h * third_w * channels)
+        total_count = h * w * channels
+        center_mean = center_sum / center_count
+        center_variance = max(0.0, center_sq / center_count - center_mean ** 2)
+        edge_mean = (total_sum - center_sum) / total_count
+        edge_variance = max(0.0, (total_sq - center_sq) / total_count - edge_mean ** 2)
+        
+        composition['rule_of_thirds'] = {
+            'center_region_variance': center_variance,
+            'edge_regions_variance': edge_variance,
+            'composition_balance': float(edge_variance / (center_variance + 1e-8))
+        }
+        
+        # Color harmony analysis
+        if channels == 3:
+            # Convert to HSV for color analysis
+            hsv = cv2.cvtColor(work, cv2.COLOR_RGB2HSV)
+            means, stds = cv2.meanStdDev(hsv)
+            composition['color_harmony'] = {
+                'hue_variance': float(stds[0][0] ** 2),
+                'saturation_mean': float(means[1][0]),
+                'value_mean': float(means[2][0])
+            }
+        
+        # Edge density analysis; Canny output is binary, so its spread follows from the density
+        gray = cv2.cvtColor(work, cv2.COLOR_RGB2GRAY) if channels == 3 else work
+        edges = cv2.Canny(gray, 50, 150)
+        density = cv2.countNonZero(edges) / edges.size
+        composition['edge_analysis'] = {
+            'edge_density': float(density),
+            'edge_distribution': float(255.0 * np.sqrt(density * (1.0 - density)))
+        }
+        
+        return composition
+    
     async def _generate_summary(self, features: Dict[str, Any], 
                                detections: Dict[str, Any], 
                                composition: Dict[str, Any]) -> str:
@@ -493,12 +737,298 @@ class ImageAnalyzer:
             return "Analysis completed with errors."
 
 
+def image_content_hash(image: Union[np.ndarray, str, Path]) -> str:
+    """SHA-256 of an image file's bytes, or of an array's shape, dtype and pixels."""
+    digest = hashlib.sha256()
+    if isinstance(image, (str, Path)):
+        with open(image, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    else:
+        image = np.ascontiguousarray(image)
+        digest.update(f"{image.shape}:{image.dtype.str}:".encode())
+        digest.update(image.data)
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Encode numpy values in cached results."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def _json_object_hook(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode cached results, restoring array shapes to tuples."""
+    for key, item in value.items():
+        if isinstance(item, list) and (key == 'shape' or key.endswith('_shape')):
+            value[key] = tuple(item)
+    return value
+
+
+class CVResultCache:
+    """
+    Persistent cache of computer vision results in SQLite.
+    
+    Entries are keyed by image content hash, operation and model id, so an
+    unchanged image is only analysed once per model. The model id is stored
+    with the operation's result version, so results computed by older code
+    are never served. The cache is bounded by the total size of the stored
+    results; least recently used entries are evicted first. Access times of
+    hits are kept in memory and written in batches, so a hit is a read only.
+    """
+    
+    # Bump an operation's version when the results it produces change
+    RESULT_VERSIONS = {"features": 1, "detect": 1, "analyze": 2}
+    
+    # Buffered access times are written once this many have accumulated
+    ACCESS_FLUSH_BATCH = 256
+    
+    def __init__(self, db_path: Union[str, Path] = "atles_memory/cv_cache.sqlite",
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._pending_access: Dict[Tuple[str, str, str], float] = {}
+    
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Database connection, opened on first use."""
+        if self._db is None:
+            self._open()
+        return self._db
+    
+    def _open(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                content_hash TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (content_hash, operation, model_id)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_results_last_access ON results(last_access)")
+        self._db.commit()
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+    
+    def _key(self, content_hash: str, operation: str, model_id: str) -> Tuple[str, str, str]:
+        version = self.RESULT_VERSIONS.get(operation, 1)
+        return content_hash, operation, f"{model_id}#v{version}"
+    
+    def get(self, content_hash: str, operation: str, model_id: str = "") -> Optional[Any]:
+        """Return a cached result, or None."""
+        key = self._key(content_hash, operation, model_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE content_hash = ? AND operation = ? AND model_id = ?", key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._pending_access[key] = time.time()
+            if len(self._pending_access) >= self.ACCESS_FLUSH_BATCH:
+                self._flush_access()
+                self._conn.commit()
+        return json.loads(row[0], object_hook=_json_object_hook)
+    
+    def _flush_access(self):
+        """Write buffered access times (the caller commits)."""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE results SET last_access = ? WHERE content_hash = ? AND operation = ? AND model_id = ?",
+                [(accessed, *key) for key, accessed in self._pending_access.items()]
+            )
+            self._pending_access.clear()
+    
+    def put(self, content_hash: str, operation: str, model_id: str, value: Any):
+        """Store a result and evict old entries if the cache is over its size bound."""
+        encoded = json.dumps(value, default=_json_default)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+        
+        key = self._key(content_hash, operation, model_id)
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM results WHERE content_hash = ? AND operation = ? AND model_id = ?", key
+            ).fetchone()
+            self._flush_access()
+            self._pending_access.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, encoded, size, time.time())
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT content_hash, operation, model_id, size FROM results ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for content_hash, operation, model_id, size in rows:
+                self._conn.execute(
+                    "DELETE FROM results WHERE content_hash = ? AND operation = ? AND model_id = ?",
+                    (content_hash, operation, model_id)
+                )
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    return
+    
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+            self._total_bytes = 0
+    
+    def close(self):
+        """Write buffered access times and close the database connection."""
+        with self._lock:
+            if self._db is not None:
+                self._flush_access()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and hit statistics."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            "db_path": str(self.db_path),
+            "entries": entries,
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class OCRResultCache:
+    """
+    On-disk cache of OCR results keyed by image content.
+    
+    Keys combine a SHA-256 of the image (file bytes for paths, pixel data for
+    arrays) with the OCR engine and languages, so the same screenshot is only
+    recognised once no matter where it is loaded from.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path] = "atles_memory/ocr_cache", max_entries: int = 10000):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def content_hash(image: Union[np.ndarray, str, Path]) -> str:
+        """Hash file bytes or pixel data."""
+        return image_content_hash(image)
+    
+    @staticmethod
+    def make_key(content_hash: str, engine: str, languages: List[str]) -> str:
+        """Combine the content hash with the engine settings."""
+        settings = f"{content_hash}:{engine}:{','.join(languages)}"
+        return hashlib.sha256(settings.encode()).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached results, or None."""
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                results = json.load(f)
+            self.hits += 1
+            return results
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, results: Dict[str, Any]):
+        """Store results atomically."""
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write OCR cache entry: {e}")
+            return
+        
+        with self._lock:
+            self._writes_since_prune += 1
+            if self._writes_since_prune < max(1, self.max_entries // 10):
+                return
+            self._writes_since_prune = 0
+        self.prune()
+    
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob("*/*.json")) if self.cache_dir.exists() else []
+    
+    def prune(self) -> int:
+        """Remove the least recently written entries beyond max_entries."""
+        entries = self._entries()
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:excess]:
+            entry.unlink(missing_ok=True)
+        return excess
+    
+    def clear(self):
+        """Remove all cached results."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache location, size and hit statistics."""
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(self._entries()),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
 class OCRProcessor:
     """Optical Character Recognition processor - FIXES non-functional img.text issues"""
     
-    def __init__(self):
+    # EasyOCR readers are expensive to build, so one is kept per language set
+    _easyocr_readers: Dict[Tuple[str, ...], Any] = {}
+    _easyocr_lock = threading.Lock()
+    
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = "atles_memory/ocr_cache"):
         self.ocr_available = self._check_ocr_availability()
         self.supported_languages = ['eng', 'fra', 'deu', 'spa', 'ita', 'por', 'rus', 'chi_sim', 'jpn']
+        self.cache = OCRResultCache(cache_dir) if cache_dir else None
     
     def _check_ocr_availability(self) -> bool:
         """Check if OCR libraries are available"""
@@ -510,6 +1040,56 @@ class OCRProcessor:
             logger.warning("OCR libraries not available. Install with: pip install pytesseract easyocr")
             return False
     
+    @classmethod
+    def _get_easyocr_reader(cls, languages: List[str]):
+        """Return the shared EasyOCR reader for a language set, creating it once."""
+        import easyocr
+        
+        key = tuple(sorted(languages))
+        with cls._easyocr_lock:
+            reader = cls._easyocr_readers.get(key)
+            if reader is None:
+                logger.info(f"Initializing EasyOCR reader for languages: {list(key)}")
+                reader = easyocr.Reader(list(key))
+                cls._easyocr_readers[key] = reader
+            return reader
+    
+    def _cache_key(self, image: Union[np.ndarray, str, Path], engine: str,
+                   languages: List[str]) -> Optional[str]:
+        """Cache key for an image, or None if caching is off or the image is unreadable."""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.make_key(self.cache.content_hash(image), engine, languages)
+        except (OSError, TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _text_from_tesseract_data(data: Dict[str, List[Any]]) -> str:
+        """Rebuild the page text from image_to_data output, one line per OCR line."""
+        lines: List[str] = []
+        current_key = None
+        current_block = None
+        words: List[str] = []
+        
+        for i, word in enumerate(data['text']):
+            if not str(word).strip():
+                continue
+            
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            if key != current_key:
+                if words:
+                    lines.append(' '.join(words))
+                # Paragraph and block breaks are separated by a blank line
+                if current_key is not None and key[:2] != current_block:
+                    lines.append('')
+                current_key, current_block, words = key, key[:2], []
+            words.append(str(word))
+        
+        if words:
+            lines.append(' '.join(words))
+        return '\n'.join(lines)
+    
     async def extract_text_tesseract(self, image: Union[np.ndarray, str, Path]) -> CVProcessingResult:
         """Extract text using Tesseract OCR - FUNCTIONAL REPLACEMENT for img.text"""
         start_time = datetime.now()
@@ -520,6 +1100,20 @@ class OCRProcessor:
             
             import pytesseract
             
+            cache_key = self._cache_key(image, 'tesseract', ['eng'])
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return CVProcessingResult(
+                    success=True,
+                    operation='text_extraction_tesseract',
+                    input_path=str(image) if isinstance(image, (str, Path)) else None,
+                    output_path=None,
+                    results=cached,
+                    processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                    error_message=None,
+                    metadata={'ocr_engine': 'tesseract', 'language': 'eng', 'cache_hit': True}
+                )
+            
             # Load image if path provided
             if isinstance(image, (str, Path)):
                 img_array = await ImageProcessor().load_image(image)
@@ -531,19 +1125,17 @@ class OCRProcessor:
             # Convert to PIL Image for tesseract
             pil_image = Image.fromarray(img_array)
             
-            # Extract text
-            extracted_text = pytesseract.image_to_string(pil_image)
-            
-            # Get detailed data
+            # Single OCR pass; the full text is rebuilt from the word data
             data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
+            extracted_text = self._text_from_tesseract_data(data)
             
             # Process bounding boxes and confidence scores
             text_blocks = []
             for i in range(len(data['text'])):
-                if int(data['conf'][i]) > 30:  # Filter low confidence
+                if int(float(data['conf'][i])) > 30:  # Filter low confidence
                     text_blocks.append({
                         'text': data['text'][i],
-                        'confidence': int(data['conf'][i]),
+                        'confidence': int(float(data['conf'][i])),
                         'bbox': {
                             'x': int(data['left'][i]),
                             'y': int(data['top'][i]),
@@ -552,6 +1144,15 @@ class OCRProcessor:
                         }
                     })
             
+            results = {
+                'extracted_text': extracted_text.strip(),
+                'text_blocks': text_blocks,
+                'total_blocks': len(text_blocks),
+                'average_confidence': sum(block['confidence'] for block in text_blocks) / max(1, len(text_blocks))
+            }
+            if cache_key:
+                self.cache.put(cache_key, results)
+            
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
             
             return CVProcessingResult(
@@ -559,15 +1160,10 @@ class OCRProcessor:
                 operation='text_extraction_tesseract',
                 input_path=str(image) if isinstance(image, (str, Path)) else None,
                 output_path=None,
-                results={
-                    'extracted_text': extracted_text.strip(),
-                    'text_blocks': text_blocks,
-                    'total_blocks': len(text_blocks),
-                    'average_confidence': sum(block['confidence'] for block in text_blocks) / max(1, len(text_blocks))
-                },
+                results=results,
                 processing_time_ms=processing_time,
                 error_message=None,
-                metadata={'ocr_engine': 'tesseract', 'language': 'eng'}
+                metadata={'ocr_engine': 'tesseract', 'language': 'eng', 'cache_hit': False}
             )
             
         except Exception as e:
@@ -593,25 +1189,31 @@ class OCRProcessor:
             if not self.ocr_available:
                 raise ImportError("OCR libraries not installed")
             
-            import easyocr
-            
-            # Initialize EasyOCR reader
             if languages is None:
                 languages = ['en']
             
-            reader = easyocr.Reader(languages)
-            
-            # Load image if path provided
-            if isinstance(image, (str, Path)):
-                image_path = str(image)
-            else:
-                # Save numpy array to temporary file for EasyOCR
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                    cv2.imwrite(temp_file.name, cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
-                    image_path = temp_file.name
+            cache_key = self._cache_key(image, 'easyocr', sorted(languages))
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return CVProcessingResult(
+                    success=True,
+                    operation='text_extraction_easyocr',
+                    input_path=str(image) if isinstance(image, (str, Path)) else None,
+                    output_path=None,
+                    results=cached,
+                    processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                    error_message=None,
+                    metadata={'ocr_engine': 'easyocr', 'languages': languages, 'cache_hit': True}
+                )
+            
+            # Shared EasyOCR reader for this language set
+            reader = self._get_easyocr_reader(languages)
+            
+            # EasyOCR reads paths and RGB arrays directly
+            image_input = str(image) if isinstance(image, (str, Path)) else image
             
             # Extract text with bounding boxes
-            results = reader.readtext(image_path)
+            results = reader.readtext(image_input)
             
             # Process results
             text_blocks = []
@@ -632,9 +1234,15 @@ class OCRProcessor:
                     })
                     full_text.append(text)
             
-            # Clean up temporary file if created
-            if not isinstance(image, (str, Path)):
-                Path(image_path).unlink()
+            ocr_results = {
+                'extracted_text': ' '.join(full_text),
+                'text_blocks': text_blocks,
+                'total_blocks': len(text_blocks),
+                'average_confidence': sum(block['confidence'] for block in text_blocks) / max(1, len(text_blocks)),
+                'languages_detected': languages
+            }
+            if cache_key:
+                self.cache.put(cache_key, ocr_results)
             
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -643,16 +1251,10 @@ class OCRProcessor:
                 operation='text_extraction_easyocr',
                 input_path=str(image) if isinstance(image, (str, Path)) else None,
                 output_path=None,
-                results={
-                    'extracted_text': ' '.join(full_text),
-                    'text_blocks': text_blocks,
-                    'total_blocks': len(text_blocks),
-                    'average_confidence': sum(block['confidence'] for block in text_blocks) / max(1, len(text_blocks)),
-                    'languages_detected': languages
-                },
+                results=ocr_results,
                 processing_time_ms=processing_time,
                 error_message=None,
-                metadata={'ocr_engine': 'easyocr', 'languages': languages}
+                metadata={'ocr_engine': 'easyocr', 'languages': languages, 'cache_hit': False}
             )
             
         except Exception as e:
@@ -920,10 +1522,14 @@ class ImageManipulator:
 class ComputerVisionAPI:
     """Main API for computer vision operations - COMPREHENSIVE FUNCTIONAL CV SYSTEM"""
     
-    def __init__(self):
+    # Operations whose results depend only on image content (and model), by result key
+    CACHEABLE_OPERATIONS = {"features": "features", "detect": "detections", "analyze": "analysis"}
+    
+    def __init__(self, cache_path: Optional[Union[str, Path]] = "atles_memory/cv_cache.sqlite"):
         self.processor = ImageProcessor()
         self.detector = ObjectDetector()
-        self.analyzer = ImageAnalyzer()
+        self.result_cache = CVResultCache(cache_path) if cache_path else None
+        self.analyzer = ImageAnalyzer(self.processor, self.detector, self.result_cache)
         self.ocr_processor = OCRProcessor()
         self.manipulator = ImageManipulator()
     
@@ -932,59 +1538,248 @@ class ComputerVisionAPI:
         """Process image with specified operations."""
         try:
             operations = [op.lower() for op in operations]
-            results = {}
+            
+            # Unchanged images are served from the result cache for the price of a hash
+            content_hash = self._content_hash(image_path)
+            cached = self._cached_results(content_hash, operations)
+            if self._fully_cached(cached, operations):
+                return self._cached_response(image_path, operations, cached)
             
             # Load image
             image = await self.processor.load_image(image_path)
             if image is None:
                 return {"error": "Failed to load image"}
             
-            # Apply requested operations
-            if "resize" in operations:
-                target_size = (512, 512)  # Default size
-                results["resized"] = await self.processor.resize_image(image, target_size)
-            
-            if "filter" in operations:
-                filter_type = "blur"  # Default filter
-                results["filtered"] = await self.processor.apply_filters(image, filter_type)
-            
-            if "features" in operations:
-                results["features"] = await self.processor.extract_features(image)
-            
-            if "detect" in operations:
-                results["detections"] = await self.detector.detect_objects(image)
-            
-            if "analyze" in operations:
-                results["analysis"] = await self.analyzer.analyze_image(image_path)
-            
-            return {
-                "success": True,
-                "operations": operations,
-                "results": results
-            }
+            return await self._apply_operations(image_path, image, operations,
+                                                cached=cached, content_hash=content_hash)
             
         except Exception as e:
             logger.error(f"Error processing image: {e}")
             return {"success": False, "error": str(e)}
     
+    def _operation_model_id(self, operation: str) -> str:
+        return "" if operation == "features" else self.detector.model_id
+    
+    def _content_hash(self, image_path: Union[str, Path]) -> Optional[str]:
+        """Content hash for cache lookups, or None without a cache or for unreadable files."""
+        if self.result_cache is None:
+            return None
+        try:
+            return image_content_hash(image_path)
+        except (OSError, TypeError, ValueError):
+            return None
+    
+    def _cached_results(self, content_hash: Optional[str], operations: List[str]) -> Dict[str, Any]:
+        """Cached results for the requested operations, by result key."""
+        if not content_hash:
+            return {}
+        cached = {}
+        for operation, key in self.CACHEABLE_OPERATIONS.items():
+            if operation in operations:
+                value = self.result_cache.get(content_hash, operation, self._operation_model_id(operation))
+                if value is not None:
+                    cached[key] = value
+        return cached
+    
+    def _fully_cached(self, cached: Dict[str, Any], operations: List[str]) -> bool:
+        return bool(operations) and all(
+            self.CACHEABLE_OPERATIONS.get(operation) in cached for operation in operations
+        )
+    
+    def _cached_response(self, image_path: Union[str, Path], operations: List[str],
+                         cached: Dict[str, Any]) -> Dict[str, Any]:
+        if "analysis" in cached:
+            cached["analysis"]["image_path"] = str(image_path)
+        return {
+            "success": True,
+            "operations": operations,
+            "results": cached,
+            "cache_hit": True
+        }
+    
+    def _store_results(self, content_hash: Optional[str], results: Dict[str, Any]):
+        if not content_hash:
+            return
+        for operation, key in self.CACHEABLE_OPERATIONS.items():
+            value = results.get(key)
+            if value and "error" not in value:
+                self.result_cache.put(content_hash, operation, self._operation_model_id(operation), value)
+    
+    async def _apply_operations(self, image_path: Union[str, Path], image: np.ndarray,
+                                operations: List[str],
+                                features: Optional[Dict[str, Any]] = None,
+                                detections: Optional[Dict[str, Any]] = None,
+                                cached: Optional[Dict[str, Any]] = None,
+                                content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Apply operations to a decoded image.
+        
+        ``features`` and ``detections`` are results already computed for this
+        image; ``cached`` holds results from the result cache by result key.
+        New results are written back to the cache under ``content_hash``.
+        """
+        results = {}
+        cached = cached or {}
+        features = cached.get("features", features)
+        detections = cached.get("detections", detections)
+        analysis = cached.get("analysis")
+        
+        # Apply requested operations
+        if "resize" in operations:
+            target_size = (512, 512)  # Default size
+            results["resized"] = await self.processor.resize_image(image, target_size)
+        
+        if "filter" in operations:
+            filter_type = "blur"  # Default filter
+            results["filtered"] = await self.processor.apply_filters(image, filter_type)
+        
+        if "features" in operations:
+            if features is None:
+                features = await self.processor.extract_features(image)
+            results["features"] = features
+        
+        if "detect" in operations:
+            if detections is None:
+                detections = await self.detector.detect_objects(image)
+            results["detections"] = detections
+        
+        if "analyze" in operations:
+            if analysis is None:
+                # Reuse the decoded image and any features/detections computed above
+                analysis = await self.analyzer.analyze_image(
+                    image_path, image=image, features=features, detections=detections,
+                    content_hash=content_hash
+                )
+            else:
+                analysis["image_path"] = str(image_path)
+            results["analysis"] = analysis
+        
+        # The analyzer caches its own results
+        self._store_results(content_hash, {key: value for key, value in results.items()
+                                           if key not in cached and key != "analysis"})
+        
+        return {
+            "success": True,
+            "operations": operations,
+            "results": results
+        }
+    
     async def batch_process(self, image_paths: List[Union[str, Path]], 
-                           operations: List[str]) -> List[Dict[str, Any]]:
+                           operations: List[str], batch_size: int = 16,
+                           max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """Process multiple images with specified operations."""
         try:
-            results = []
+            return [item async for item in self.iter_batch_process(image_paths, operations,
+                                                                   batch_size, max_workers)]
             
-            for image_path in image_paths:
-                result = await self.process_image(image_path, operations)
+        except Exception as e:
+            logger.error(f"Error in batch processing: {e}")
+            return [{"error": str(e)} for _ in image_paths]
+    
+    async def iter_batch_process(self, image_paths: List[Union[str, Path]],
+                                 operations: List[str], batch_size: int = 16,
+                                 max_workers: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process images in batches, yielding each result as soon as its batch is done.
+        
+        Decoding, feature extraction and classification run on a worker pool
+        so the event loop stays free, and the next batch is decoded while the
+        current one is being classified. Results are yielded in input order.
+        """
+        operations = [op.lower() for op in operations]
+        chunks = [list(image_paths[i:i + batch_size]) for i in range(0, len(image_paths), batch_size)]
+        if not chunks:
+            return
+        
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4),
+                                      thread_name_prefix="cv-batch")
+        
+        def decode(chunk):
+            return [loop.run_in_executor(executor, self._prepare_batch_item, path, operations) for path in chunk]
+        
+        try:
+            pending = decode(chunks[0])
+            for index, chunk in enumerate(chunks):
+                items = await asyncio.gather(*pending)
+                
+                # Prefetch the next batch while this one is processed
+                pending = decode(chunks[index + 1]) if index + 1 < len(chunks) else []
+                
+                for item in await self._process_decoded_batch(chunk, items, operations, executor):
+                    yield item
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _prepare_batch_item(self, image_path: Union[str, Path], operations: List[str]) -> Dict[str, Any]:
+        """Hash and look up an image, decoding it only if the cache cannot answer; runs on a worker."""
+        content_hash = self._content_hash(image_path)
+        cached = self._cached_results(content_hash, operations)
+        if self._fully_cached(cached, operations):
+            return {"content_hash": content_hash, "cached": cached, "image": None, "hit": True}
+        return {"content_hash": content_hash, "cached": cached,
+                "image": self.processor.read_image(image_path), "hit": False}
+    
+    async def _process_decoded_batch(self, image_paths: List[Union[str, Path]],
+                                     items: List[Dict[str, Any]], operations: List[str],
+                                     executor: Executor) -> List[Dict[str, Any]]:
+        """Run batched features/detection for decoded images, then the remaining operations."""
+        loop = asyncio.get_running_loop()
+        
+        def needs(*operation_keys: Tuple[str, str]) -> List[int]:
+            # Decoded images for which some requested operation still lacks a result
+            return [i for i, item in enumerate(items)
+                    if item["image"] is not None and any(
+                        operation in operations and result_key not in item["cached"]
+                        for operation, result_key in operation_keys)]
+        
+        features: Dict[int, Dict[str, Any]] = {}
+        detections: Dict[int, Dict[str, Any]] = {}
+        
+        indices = needs(("features", "features"), ("analyze", "analysis"))
+        if indices:
+            batch = await loop.run_in_executor(executor, self.processor.extract_features_batch,
+                                               [items[i]["image"] for i in indices])
+            features = dict(zip(indices, batch))
+        
+        indices = needs(("detect", "detections"), ("analyze", "analysis"))
+        if indices:
+            try:
+                batch = await loop.run_in_executor(executor, self.detector.detect_objects_batch,
+                                                   [items[i]["image"] for i in indices])
+            except Exception as e:
+                logger.error(f"Error detecting objects in batch: {e}")
+                batch = [{"detections": [], "error": str(e)} for _ in indices]
+            detections = dict(zip(indices, batch))
+        
+        results = []
+        for index, (image_path, item) in enumerate(zip(image_paths, items)):
+            if item["hit"]:
+                results.append({"image_path": str(image_path),
+                                "result": self._cached_response(image_path, operations, item["cached"])})
+                continue
+            
+            if item["image"] is None:
                 results.append({
                     "image_path": str(image_path),
-                    "result": result
+                    "error": "Failed to load image",
+                    "result": {"error": "Failed to load image"}
                 })
+                continue
             
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error in batch processing: {e}")
-            return [{"error": str(e)} for _ in image_paths]
+            try:
+                result = await self._apply_operations(
+                    image_path, item["image"], operations,
+                    features=features.get(index), detections=detections.get(index),
+                    cached=item["cached"], content_hash=item["content_hash"]
+                )
+            except Exception as e:
+                logger.error(f"Error processing image {image_path}: {e}")
+                result = {"success": False, "error": str(e)}
+            
+            results.append({"image_path": str(image_path), "result": result})
+        
+        return results
     
     async def get_supported_operations(self) -> List[str]:
         """Get list of supported image processing operations."""
@@ -1046,12 +1841,18 @@ class ComputerVisionAPI:
             else:
                 image_array = image_source
             
+            # Features and detections are computed once and shared with the analysis
+            features = await self.processor.extract_features(image_array)
+            detection_result = await self.detector.detect_objects(image_array)
+            
             # 1. Basic image analysis
-            analysis_result = await self.analyzer.analyze_image(image_source)
+            analysis_result = await self.analyzer.analyze_image(
+                image_source if isinstance(image_source, (str, Path)) else 'array',
+                image=image_array, features=features, detections=detection_result
+            )
             results['image_analysis'] = analysis_result
             
             # 2. Object detection
-            detection_result = await self.detector.detect_objects(image_array)
             results['object_detection'] = detection_result
             
             # 3. OCR text extraction
@@ -1059,7 +1860,6 @@ class ComputerVisionAPI:
             results['text_extraction'] = ocr_result.to_dict()
             
             # 4. Feature extraction
-            features = await self.processor.extract_features(image_array)
             results['image_features'] = features
             
             # 5. Generate comprehensive summary
@@ -1137,7 +1937,8 @@ class ComputerVisionAPI:
             "max_image_size": self.processor.max_image_size,
             "available_operations": await self.get_supported_operations(),
             "ocr_available": self.ocr_processor.ocr_available,
-            "supported_languages": self.ocr_processor.supported_languages
+            "supported_languages": self.ocr_processor.supported_languages,
+            "model_registry": self.detector.registry.get_stats()
         }
 
 
@@ -12,12 +12,13 @@ from .github_code import GitHubCodeDataset
 from .programming_books import ProgrammingBooksDataset
 from .code_challenges import CodeChallengesDataset
 from .framework_docs import FrameworkDocsDataset
-from .dataset_manager import CodeDatasetManager
+from .dataset_manager import CodeDatasetManager, FederatedSearchResult
 
 __all__ = [
     'GitHubCodeDataset',
     'ProgrammingBooksDataset', 
     'CodeChallengesDataset',
     'FrameworkDocsDataset',
-    'CodeDatasetManager'
+    'CodeDatasetManager',
+    'FederatedSearchResult'
 ]
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from .search_index import DatasetSearchIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +59,14 @@ class CodeChallengesDataset:
         
         # Initialize with sample data if empty
         self._initialize_sample_data()
+
+        # Resident search index, rebuilt when sample_data.json changes
+        self.index = DatasetSearchIndex(
+            self.data_dir / 'sample_data.json',
+            field_weights={'title': 0.3, 'description': 0.25, 'problem_statement': 0.2,
+                           'category': 0.15, 'tags': 0.1},
+            filter_fields=('language', 'difficulty', 'category', 'tags')
+        )
     
     def _initialize_sample_data(self):
         """Initialize with sample code challenges."""
@@ -267,7 +277,7 @@ print("Iterative:", inorder_traversal_iterative(root))""",
             "source": "Multiple Platforms",
             "language": "multi",
             "tags": ["algorithms", "data-structures", "coding-challenges", "problem-solving"],
-            "size": len(self._load_data()),
+            "size": len(self.index.documents),
             "last_updated": datetime.now(),
             "version": "1.0"
         }
@@ -298,74 +308,11 @@ print("Iterative:", inorder_traversal_iterative(root))""",
             category: Problem category filter
             
         Returns:
-            List of matching challenges
+            List of matching challenges, most relevant first
         """
-        data = self._load_data()
-        results = []
-        
-        query_lower = query.lower()
-        
-        for challenge in data:
-            # Check if challenge matches query
-            if (query_lower in challenge['title'].lower() or
-                query_lower in challenge['description'].lower() or
-                query_lower in challenge['problem_statement'].lower() or
-                query_lower in challenge['category'].lower() or
-                query_lower in challenge['tags']):
-                
-                # Apply language filter
-                if language and challenge['language'].lower() != language.lower():
-                    continue
-                
-                # Apply tag filter
-                if tags and not any(tag.lower() in [t.lower() for t in challenge['tags']] for tag in tags):
-                    continue
-                
-                # Apply difficulty filter
-                if difficulty and challenge['difficulty'].lower() != difficulty.lower():
-                    continue
-                
-                # Apply category filter
-                if category and challenge['category'].lower() != category.lower():
-                    continue
-                
-                # Calculate relevance score based on query match
-                relevance = self._calculate_relevance(query_lower, challenge)
-                challenge['relevance_score'] = relevance
-                
-                results.append(challenge)
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        return results
-    
-    def _calculate_relevance(self, query: str, challenge: Dict[str, Any]) -> float:
-        """Calculate relevance score for a code challenge."""
-        score = 0.0
-        
-        # Title relevance
-        if query in challenge['title'].lower():
-            score += 0.3
-        
-        # Description relevance
-        if query in challenge['description'].lower():
-            score += 0.25
-        
-        # Problem statement relevance
-        if query in challenge['problem_statement'].lower():
-            score += 0.2
-        
-        # Category relevance
-        if query in challenge['category'].lower():
-            score += 0.15
-        
-        # Tag relevance
-        for tag in challenge['tags']:
-            if query in tag.lower():
-                score += 0.1
-        
-        return min(score, 1.0)
+        return self.index.search(query, {
+            'language': language, 'difficulty': difficulty, 'category': category
+        }, tags)
     
     def get_challenge(self, challenge_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -410,6 +357,7 @@ print("Iterative:", inorder_traversal_iterative(root))""",
             sample_file = self.data_dir / 'sample_data.json'
             with open(sample_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self.index.invalidate()
             
             logger.info(f"Added code challenge: {challenge.id}")
             return True
@@ -7,10 +7,15 @@ to GitHub code, programming books, challenges, and framework docs.
 
 import os
 import json
+import heapq
 import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Any, Union
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
 try:
@@ -63,6 +68,17 @@ class DatasetMetadata:
     version: str
 
 
+@dataclass
+class FederatedSearchResult:
+    """Merged results of a search fanned out across datasets."""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    completed_sources: List[str] = field(default_factory=list)
+    timed_out_sources: List[str] = field(default_factory=list)
+    failed_sources: List[str] = field(default_factory=list)
+    skipped_sources: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
 class CodeDatasetManager:
     """
     Central manager for all code datasets.
@@ -74,12 +90,22 @@ class CodeDatasetManager:
     - Framework documentation
     """
     
-    def __init__(self, datasets_dir: Optional[Path] = None):
+    DATASET_TYPES = ('github_code', 'programming_books', 'code_challenges', 'framework_docs')
+    
+    # Timeout that waits for a source however long it takes
+    NO_DEADLINE = math.inf
+    
+    def __init__(self, datasets_dir: Optional[Path] = None, source_timeout: float = 1.0,
+                 source_timeouts: Optional[Dict[str, float]] = None, max_workers: int = 8):
         """
         Initialize the dataset manager.
         
         Args:
             datasets_dir: Directory to store datasets (defaults to ATLES_HOME/datasets)
+            source_timeout: Seconds federated_search waits for each dataset by default
+                (search_code waits for every dataset unless given a timeout)
+            source_timeouts: Per-dataset overrides of source_timeout
+            max_workers: Threads shared by federated searches
         """
         if datasets_dir is None:
             atles_home = Path(os.environ.get('ATLES_HOME', 'D:\\.atles'))
@@ -96,6 +122,13 @@ class CodeDatasetManager:
         self.code_challenges = CodeChallengesDataset(self.datasets_dir / 'challenges')
         self.framework_docs = FrameworkDocsDataset(self.datasets_dir / 'frameworks')
         
+        # Federated search settings; the thread pool is created on first use
+        self.source_timeout = source_timeout
+        self.source_timeouts = dict(source_timeouts or {})
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
         # Track available datasets
         self.available_datasets: Dict[str, DatasetMetadata] = {}
         self._discover_datasets()
@@ -119,8 +152,26 @@ class CodeDatasetManager:
         """Get information about all available datasets."""
         return self.available_datasets.copy()
     
+    def _search_sources(self, query: str, language: Optional[str],
+                        tags: Optional[List[str]]) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+        """Per-dataset search calls, in the order results are merged on ties."""
+        return {
+            'github_code': lambda: self.github_code.search(query, language=language, tags=tags),
+            'programming_books': lambda: self.programming_books.search(query, language=language, tags=tags),
+            'code_challenges': lambda: self.code_challenges.search(query, language=language, tags=tags),
+            'framework_docs': lambda: self.framework_docs.search(query, language=language, tags=tags),
+        }
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="dataset-search")
+            return self._executor
+    
     def search_code(self, query: str, dataset_type: Optional[str] = None, 
-                   language: Optional[str] = None, tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                   language: Optional[str] = None, tags: Optional[List[str]] = None,
+                   timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Search across all code datasets.
         
@@ -129,60 +180,130 @@ class CodeDatasetManager:
             dataset_type: Specific dataset to search (optional)
             language: Programming language filter (optional)
             tags: Tag filters (optional)
+            timeout: Seconds to wait for each dataset when searching all of them;
+                None waits for every dataset
             
         Returns:
-            List of matching code examples
+            List of matching code examples, most relevant first
         """
-        results = []
+        if dataset_type is None:
+            outcome = self.federated_search(
+                query, language=language, tags=tags, k=None,
+                timeout=self.NO_DEADLINE if timeout is None else timeout
+            )
+            if outcome.timed_out_sources or outcome.failed_sources:
+                logger.warning(
+                    f"Partial code search results for '{query}': "
+                    f"timed out {outcome.timed_out_sources}, failed {outcome.failed_sources}"
+                )
+            return outcome.results
         
-        if dataset_type:
-            # Search specific dataset
-            if dataset_type == 'github_code':
-                try:
-                    results.extend(self.github_code.search(query, language, tags))
-                except Exception as e:
-                    logger.warning(f"Error searching GitHub code dataset: {e}")
-            elif dataset_type == 'programming_books':
-                try:
-                    results.extend(self.programming_books.search(query, language, tags))
-                except Exception as e:
-                    logger.warning(f"Error searching programming books dataset: {e}")
-            elif dataset_type == 'code_challenges':
-                try:
-                    results.extend(self.code_challenges.search(query, language, tags))
-                except Exception as e:
-                    logger.warning(f"Error searching code challenges dataset: {e}")
-            elif dataset_type == 'framework_docs':
-                try:
-                    results.extend(self.framework_docs.search(query, language, tags))
-                except Exception as e:
-                    logger.warning(f"Error searching framework docs dataset: {e}")
-        else:
-            # Search all datasets
-            try:
-                results.extend(self.github_code.search(query, language, tags))
-            except Exception as e:
-                logger.warning(f"Error searching GitHub code dataset: {e}")
+        search = self._search_sources(query, language, tags).get(dataset_type)
+        if search is None:
+            logger.warning(f"Unknown dataset type: {dataset_type}")
+            return []
+        
+        try:
+            results = search()
+        except Exception as e:
+            logger.warning(f"Error searching {dataset_type} dataset: {e}")
+            return []
+        
+        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        return results
+    
+    def federated_search(self, query: str, language: Optional[str] = None,
+                         tags: Optional[List[str]] = None, k: Optional[int] = 10,
+                         min_score: float = 0.5, timeout: Optional[float] = None,
+                         dataset_types: Optional[List[str]] = None) -> FederatedSearchResult:
+        """
+        Search datasets concurrently and merge the best results.
+        
+        Every dataset is queried at once on the shared thread pool. Results
+        are merged into a top-k heap as sources finish; once k results
+        scoring at least ``min_score`` are held, the search returns without
+        waiting for the remaining sources. A source that misses its deadline
+        is abandoned and its results are dropped.
+        
+        Args:
+            query: Search query
+            language: Programming language filter (optional)
+            tags: Tag filters (optional)
+            k: Number of results to return, or None for all of them (no early return)
+            min_score: Relevance the k-th result needs before returning early
+            timeout: Seconds to wait for every source (defaults to the per-source
+                settings); NO_DEADLINE waits for all of them
+            dataset_types: Datasets to search (defaults to all)
             
-            try:
-                results.extend(self.programming_books.search(query, language, tags))
-            except Exception as e:
-                logger.warning(f"Error searching programming books dataset: {e}")
+        Returns:
+            FederatedSearchResult with results, most relevant first, and per-source outcomes
+        """
+        start = time.monotonic()
+        outcome = FederatedSearchResult()
+        sources = self._search_sources(query, language, tags)
+        if dataset_types is not None:
+            sources = {name: search for name, search in sources.items() if name in dataset_types}
+        
+        executor = self._get_executor()
+        futures = {}
+        deadlines = {}
+        for rank, (name, search) in enumerate(sources.items()):
+            future = executor.submit(search)
+            futures[future] = (rank, name)
+            source_timeout = timeout if timeout is not None else self.source_timeouts.get(name, self.source_timeout)
+            deadlines[future] = start + source_timeout
+        
+        # Min-heap of (score, -source rank, -position, result); ties keep the earlier source and position
+        heap = []
+        pending = set(futures)
+        
+        while pending:
+            now = time.monotonic()
+            for future in [f for f in pending if deadlines[f] <= now]:
+                pending.discard(future)
+                future.cancel()
+                outcome.timed_out_sources.append(futures[future][1])
+                logger.warning(f"Search of {futures[future][1]} dataset exceeded its deadline")
+            if not pending:
+                break
             
-            try:
-                results.extend(self.code_challenges.search(query, language, tags))
-            except Exception as e:
-                logger.warning(f"Error searching code challenges dataset: {e}")
+            next_deadline = min(deadlines[f] for f in pending)
+            wait_time = None if next_deadline == math.inf else max(next_deadline - now, 0)
+            done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
             
-            try:
-                results.extend(self.framework_docs.search(query, language, tags))
-            except Exception as e:
-                logger.warning(f"Error searching framework docs dataset: {e}")
-        
-        # Sort by relevance score if available
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+            for future in done:
+                rank, name = futures[future]
+                try:
+                    hits = future.result()
+                except Exception as e:
+                    logger.warning(f"Error searching {name} dataset: {e}")
+                    outcome.failed_sources.append(name)
+                    continue
+                
+                outcome.completed_sources.append(name)
+                for position, hit in enumerate(hits):
+                    entry = (hit.get('relevance_score', 0), -rank, -position, hit)
+                    if k is None or len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:3] > heap[0][:3]:
+                        heapq.heapreplace(heap, entry)
+            
+            if pending and k is not None and len(heap) >= k and heap[0][0] >= min_score:
+                for future in pending:
+                    future.cancel()
+                outcome.skipped_sources = [name for _, name in sorted(futures[f] for f in pending)]
+                break
         
-        return results
+        outcome.results = [entry[3] for entry in sorted(heap, key=lambda entry: entry[:3], reverse=True)]
+        outcome.elapsed = time.monotonic() - start
+        return outcome
+    
+    def close(self):
+        """Shut down the federated search thread pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def get_code_example(self, example_id: str, dataset_type: str) -> Optional[Dict[str, Any]]:
         """
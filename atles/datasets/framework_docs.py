@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from .search_index import DatasetSearchIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +58,14 @@ class FrameworkDocsDataset:
         
         # Initialize with sample data if empty
         self._initialize_sample_data()
+
+        # Resident search index, rebuilt when sample_data.json changes
+        self.index = DatasetSearchIndex(
+            self.data_dir / 'sample_data.json',
+            field_weights={'title': 0.25, 'description': 0.2, 'code': 0.2,
+                           'framework': 0.15, 'category': 0.1, 'tags': 0.1},
+            filter_fields=('framework', 'language', 'category', 'difficulty', 'tags')
+        )
     
     def _initialize_sample_data(self):
         """Initialize with sample framework documentation examples."""
@@ -399,7 +409,7 @@ if __name__ == "__main__":
             "source": "Framework Documentation",
             "language": "multi",
             "tags": ["frameworks", "api", "documentation", "examples", "best-practices"],
-            "size": len(self._load_data()),
+            "size": len(self.index.documents),
             "last_updated": datetime.now(),
             "version": "1.0"
         }
@@ -431,83 +441,12 @@ if __name__ == "__main__":
             difficulty: Difficulty level filter
             
         Returns:
-            List of matching examples
+            List of matching examples, most relevant first
         """
-        data = self._load_data()
-        results = []
-        
-        query_lower = query.lower()
-        
-        for example in data:
-            # Check if example matches query
-            if (query_lower in example['title'].lower() or
-                query_lower in example['description'].lower() or
-                query_lower in example['code'].lower() or
-                query_lower in example['framework'].lower() or
-                query_lower in example['category'].lower() or
-                query_lower in example['tags']):
-                
-                # Apply framework filter
-                if framework and example['framework'].lower() != framework.lower():
-                    continue
-                
-                # Apply language filter
-                if language and example['language'].lower() != language.lower():
-                    continue
-                
-                # Apply tag filter
-                if tags and not any(tag.lower() in [t.lower() for t in example['tags']] for tag in tags):
-                    continue
-                
-                # Apply category filter
-                if category and example['category'].lower() != category.lower():
-                    continue
-                
-                # Apply difficulty filter
-                if difficulty and example['difficulty'].lower() != difficulty.lower():
-                    continue
-                
-                # Calculate relevance score based on query match
-                relevance = self._calculate_relevance(query_lower, example)
-                example['relevance_score'] = relevance
-                
-                results.append(example)
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        return results
-    
-    def _calculate_relevance(self, query: str, example: Dict[str, Any]) -> float:
-        """Calculate relevance score for a framework documentation example."""
-        score = 0.0
-        
-        # Title relevance
-        if query in example['title'].lower():
-            score += 0.25
-        
-        # Description relevance
-        if query in example['description'].lower():
-            score += 0.2
-        
-        # Code content relevance
-        if query in example['code'].lower():
-            score += 0.2
-        
-        # Framework relevance
-        if query in example['framework'].lower():
-            score += 0.15
-        
-        # Category relevance
-        if query in example['category'].lower():
-            score += 0.1
-        
-        # Tag relevance
-        for tag in example['tags']:
-            if query in tag.lower():
-                score += 0.1
-        
-        return min(score, 1.0)
+        return self.index.search(query, {
+            'framework': framework, 'language': language,
+            'category': category, 'difficulty': difficulty
+        }, tags)
     
     def get_example(self, example_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -552,6 +491,7 @@ if __name__ == "__main__":
             sample_file = self.data_dir / 'sample_data.json'
             with open(sample_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self.index.invalidate()
             
             logger.info(f"Added framework documentation example: {example.id}")
             return True
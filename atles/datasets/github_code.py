@@ -15,6 +15,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 import re
 
+from .search_index import DatasetSearchIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +110,14 @@ class GitHubCodeDataset:
         
         # Initialize with sample data if empty
         self._initialize_sample_data()
+
+        # Resident search index, rebuilt when sample_data.json changes
+        self.index = DatasetSearchIndex(
+            self.data_dir / 'sample_data.json',
+            field_weights={'code': 0.4, 'description': 0.3, 'repository': 0.2, 'tags': 0.1},
+            filter_fields=('language', 'tags'),
+            boost=lambda example: min(example['stars'] / 10000, 0.1)
+        )
     
     def _initialize_sample_data(self):
         """Initialize with sample GitHub code examples."""
@@ -254,7 +264,7 @@ print(monthly_sales)""",
             "source": "GitHub",
             "language": "multi",
             "tags": ["github", "real-code", "production", "best-practices"],
-            "size": len(self._load_data()),
+            "size": len(self.index.documents),
             "last_updated": datetime.now(),
             "version": "1.0"
         }
@@ -282,63 +292,9 @@ print(monthly_sales)""",
             tags: Tag filters
             
         Returns:
-            List of matching code examples
+            List of matching code examples, most relevant first
         """
-        data = self._load_data()
-        results = []
-        
-        query_lower = query.lower()
-        
-        for example in data:
-            # Check if example matches query
-            if (query_lower in example['code'].lower() or
-                query_lower in example['description'].lower() or
-                query_lower in example['repository'].lower()):
-                
-                # Apply language filter
-                if language and example['language'].lower() != language.lower():
-                    continue
-                
-                # Apply tag filter
-                if tags and not any(tag.lower() in [t.lower() for t in example['tags']] for tag in tags):
-                    continue
-                
-                # Calculate relevance score based on query match
-                relevance = self._calculate_relevance(query_lower, example)
-                example['relevance_score'] = relevance
-                
-                results.append(example)
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        return results
-    
-    def _calculate_relevance(self, query: str, example: Dict[str, Any]) -> float:
-        """Calculate relevance score for a code example."""
-        score = 0.0
-        
-        # Code content relevance
-        if query in example['code'].lower():
-            score += 0.4
-        
-        # Description relevance
-        if query in example['description'].lower():
-            score += 0.3
-        
-        # Repository relevance
-        if query in example['repository'].lower():
-            score += 0.2
-        
-        # Tag relevance
-        for tag in example['tags']:
-            if query in tag.lower():
-                score += 0.1
-        
-        # Popularity bonus
-        score += min(example['stars'] / 10000, 0.1)
-        
-        return min(score, 1.0)
+        return self.index.search(query, {'language': language}, tags)
     
     def get_example(self, example_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -383,6 +339,7 @@ print(monthly_sales)""",
             sample_file = self.data_dir / 'sample_data.json'
             with open(sample_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self.index.invalidate()
             
             logger.info(f"Added GitHub code example: {example.id}")
             return True
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from .search_index import DatasetSearchIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +55,14 @@ class ProgrammingBooksDataset:
         
         # Initialize with sample data if empty
         self._initialize_sample_data()
+
+        # Resident search index, rebuilt when sample_data.json changes
+        self.index = DatasetSearchIndex(
+            self.data_dir / 'sample_data.json',
+            field_weights={'code': 0.3, 'description': 0.25, 'book_title': 0.2,
+                           'concepts': 0.15, 'tags': 0.1},
+            filter_fields=('language', 'difficulty', 'tags')
+        )
     
     def _initialize_sample_data(self):
         """Initialize with sample programming book examples."""
@@ -246,7 +256,7 @@ def _print_details(self, amount, outstanding):
             "source": "Programming Books",
             "language": "multi",
             "tags": ["programming-books", "best-practices", "design-patterns", "clean-code"],
-            "size": len(self._load_data()),
+            "size": len(self.index.documents),
             "last_updated": datetime.now(),
             "version": "1.0"
         }
@@ -275,71 +285,9 @@ def _print_details(self, amount, outstanding):
             difficulty: Difficulty level filter (beginner, intermediate, advanced)
             
         Returns:
-            List of matching examples
+            List of matching examples, most relevant first
         """
-        data = self._load_data()
-        results = []
-        
-        query_lower = query.lower()
-        
-        for example in data:
-            # Check if example matches query
-            if (query_lower in example['code'].lower() or
-                query_lower in example['description'].lower() or
-                query_lower in example['book_title'].lower() or
-                query_lower in example['concepts'] or
-                query_lower in example['tags']):
-                
-                # Apply language filter
-                if language and example['language'].lower() != language.lower():
-                    continue
-                
-                # Apply tag filter
-                if tags and not any(tag.lower() in [t.lower() for t in example['tags']] for tag in tags):
-                    continue
-                
-                # Apply difficulty filter
-                if difficulty and example['difficulty'].lower() != difficulty.lower():
-                    continue
-                
-                # Calculate relevance score based on query match
-                relevance = self._calculate_relevance(query_lower, example)
-                example['relevance_score'] = relevance
-                
-                results.append(example)
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        return results
-    
-    def _calculate_relevance(self, query: str, example: Dict[str, Any]) -> float:
-        """Calculate relevance score for a programming book example."""
-        score = 0.0
-        
-        # Code content relevance
-        if query in example['code'].lower():
-            score += 0.3
-        
-        # Description relevance
-        if query in example['description'].lower():
-            score += 0.25
-        
-        # Book title relevance
-        if query in example['book_title'].lower():
-            score += 0.2
-        
-        # Concepts relevance
-        for concept in example['concepts']:
-            if query in concept.lower():
-                score += 0.15
-        
-        # Tag relevance
-        for tag in example['tags']:
-            if query in tag.lower():
-                score += 0.1
-        
-        return min(score, 1.0)
+        return self.index.search(query, {'language': language, 'difficulty': difficulty}, tags)
     
     def get_example(self, example_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -384,6 +332,7 @@ def _print_details(self, amount, outstanding):
             sample_file = self.data_dir / 'sample_data.json'
             with open(sample_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self.index.invalidate()
             
             logger.info(f"Added programming book example: {example.id}")
             return True
@@ -0,0 +1,283 @@
+"""
+Dataset Search Index
+
+Resident inverted index over a dataset's ``sample_data.json``. Documents
+are tokenized once when the file is loaded (and again only when it
+changes on disk), ranked with BM25 over weighted fields, and filtered
+through precomputed postings for exact-match fields such as language,
+difficulty and tags.
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Query terms also match indexed terms they are a prefix of ("sort" finds
+# "sorted"), at a reduced weight.
+PREFIX_MATCH_WEIGHT = 0.5
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercase alphanumeric tokens of a string or list of strings."""
+    if text is None:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(item) for item in text)
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class _IndexSnapshot:
+    """Immutable index state built from one version of the data file."""
+
+    def __init__(self, documents: List[Dict[str, Any]], signature: Optional[Tuple[int, int]],
+                 field_weights: Dict[str, float], filter_fields: Sequence[str],
+                 boost: Optional[Callable[[Dict[str, Any]], float]]):
+        self.documents = documents
+        self.signature = signature
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self.filters: Dict[str, Dict[str, Set[int]]] = {field: defaultdict(set) for field in filter_fields}
+        self.doc_lengths: List[float] = []
+        self.boosts: List[float] = []
+
+        for doc_id, document in enumerate(documents):
+            length = 0.0
+            for field, weight in field_weights.items():
+                tokens = tokenize(document.get(field))
+                length += weight * len(tokens)
+                for token in tokens:
+                    postings = self.postings[token]
+                    postings[doc_id] = postings.get(doc_id, 0.0) + weight
+            self.doc_lengths.append(length)
+
+            for field in filter_fields:
+                values = document.get(field)
+                if not isinstance(values, (list, tuple)):
+                    values = [values]
+                for value in values:
+                    if value is not None:
+                        self.filters[field][str(value).lower()].add(doc_id)
+
+            try:
+                self.boosts.append(boost(document) if boost else 0.0)
+            except (KeyError, TypeError, ValueError):
+                self.boosts.append(0.0)
+
+        self.postings = dict(self.postings)
+        self.filters = {field: dict(values) for field, values in self.filters.items()}
+        self.vocabulary = sorted(self.postings)
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+
+    def idf(self, document_frequency: int) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        total = len(self.documents)
+        return math.log(1.0 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def expand(self, token: str) -> List[Tuple[str, float]]:
+        """Indexed terms matched by a query token, with their match weights."""
+        matches = [(token, 1.0)] if token in self.postings else []
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_right(self.vocabulary, token)
+            for term in self.vocabulary[start:]:
+                if not term.startswith(token):
+                    break
+                matches.append((term, PREFIX_MATCH_WEIGHT))
+        return matches
+
+
+class DatasetSearchIndex:
+    """
+    BM25 search over a JSON list of documents, kept resident in memory.
+
+    The data file is stat'ed on each query and the index is rebuilt only
+    when its modification time or size changes, so repeated searches never
+    touch the JSON again. Results are shallow copies of the stored
+    documents carrying a ``relevance_score`` in ``[0, 1]``: the BM25 score
+    divided by the best score the query could reach, plus the optional
+    per-document ``boost``.
+    """
+
+    def __init__(self, data_file: Path, field_weights: Dict[str, float],
+                 filter_fields: Iterable[str] = ("language", "tags"),
+                 boost: Optional[Callable[[Dict[str, Any]], float]] = None,
+                 k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize the search index.
+
+        Args:
+            data_file: JSON file holding a list of documents
+            field_weights: Searchable fields and their relative weights
+            filter_fields: Fields with exact-match (case-insensitive) postings;
+                list-valued fields such as tags match on any element
+            boost: Optional static score added to each document's relevance
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.data_file = Path(data_file)
+        top_weight = max(field_weights.values())
+        self.field_weights = {field: weight / top_weight for field, weight in field_weights.items()}
+        self.filter_fields = tuple(filter_fields)
+        self.boost = boost
+        self.k1 = k1
+        self.b = b
+
+        self._snapshot: Optional[_IndexSnapshot] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.data_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_documents(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                documents = json.load(f)
+            if isinstance(documents, list):
+                return [document for document in documents if isinstance(document, dict)]
+            logger.error(f"Expected a list of documents in {self.data_file}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading search index data from {self.data_file}: {e}")
+        return []
+
+    def _current(self) -> _IndexSnapshot:
+        """Return the snapshot for the file as it is now, rebuilding if it changed."""
+        signature = self._file_signature()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.signature != signature:
+                snapshot = _IndexSnapshot(self._load_documents(), signature, self.field_weights,
+                                          self.filter_fields, self.boost)
+                self._snapshot = snapshot
+                self.builds += 1
+                logger.debug(f"Indexed {len(snapshot.documents)} documents from {self.data_file}")
+        return snapshot
+
+    def invalidate(self):
+        """Drop the current snapshot so the next query reloads the file."""
+        with self._lock:
+            self._snapshot = None
+
+    @property
+    def documents(self) -> List[Dict[str, Any]]:
+        """The indexed documents (shared; do not mutate)."""
+        return self._current().documents
+
+    def search(self, query: str, filters: Optional[Dict[str, Optional[str]]] = None,
+               tags: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search the index.
+
+        Args:
+            query: Free-text query; an empty query matches every document
+            filters: Exact-match filters by field name; ``None`` values are ignored
+            tags: Documents must carry at least one of these tags
+            limit: Maximum number of results to return
+
+        Returns:
+            Matching documents, most relevant first
+        """
+        snapshot = self._current()
+
+        candidates: Optional[Set[int]] = None
+        for field, value in (filters or {}).items():
+            if value is None:
+                continue
+            postings = snapshot.filters.get(field)
+            if postings is None:
+                raise ValueError(f"'{field}' is not an indexed filter field")
+            matching = postings.get(str(value).lower(), set())
+            candidates = set(matching) if candidates is None else candidates & matching
+            if not candidates:
+                return []
+
+        if tags:
+            tag_postings = snapshot.filters.get("tags", {})
+            matching = set()
+            for tag in tags:
+                matching |= tag_postings.get(str(tag).lower(), set())
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            doc_ids = candidates if candidates is not None else range(len(snapshot.documents))
+            scores = {doc_id: 0.0 for doc_id in doc_ids}
+        else:
+            scores = self._score(snapshot, tokens, candidates)
+
+        ranked = sorted(
+            ((min(score + snapshot.boosts[doc_id], 1.0), doc_id) for doc_id, score in scores.items()),
+            key=lambda item: (-item[0], item[1])
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        return [dict(snapshot.documents[doc_id], relevance_score=round(score, 4)) for score, doc_id in ranked]
+
+    def _score(self, snapshot: _IndexSnapshot, tokens: List[str],
+               candidates: Optional[Set[int]]) -> Dict[int, float]:
+        """Normalized BM25 scores of the documents matching any query token."""
+        k1, b = self.k1, self.b
+        avg_length = snapshot.avg_length or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        best_possible = 0.0
+
+        for token in tokens:
+            expansions = snapshot.expand(token)
+            if not expansions:
+                best_possible += snapshot.idf(0) * (k1 + 1)
+                continue
+
+            token_scores: Dict[int, float] = {}
+            token_best = 0.0
+            for term, match_weight in expansions:
+                postings = snapshot.postings[term]
+                idf = snapshot.idf(len(postings)) * match_weight
+                token_best = max(token_best, idf * (k1 + 1))
+                for doc_id, tf in postings.items():
+                    if candidates is not None and doc_id not in candidates:
+                        continue
+                    norm = k1 * (1 - b + b * snapshot.doc_lengths[doc_id] / avg_length)
+                    term_score = idf * tf * (k1 + 1) / (tf + norm)
+                    # A token counts once per document, through its best-matching term
+                    if term_score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = term_score
+
+            best_possible += token_best
+            for doc_id, term_score in token_scores.items():
+                scores[doc_id] += term_score
+
+        if best_possible <= 0:
+            return dict(scores)
+        return {doc_id: score / best_possible for doc_id, score in scores.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and rebuild count."""
+        snapshot = self._snapshot
+        return {
+            "documents": len(snapshot.documents) if snapshot else 0,
+            "terms": len(snapshot.vocabulary) if snapshot else 0,
+            "builds": self.builds,
+        }
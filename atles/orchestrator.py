@@ -7,6 +7,10 @@ by breaking them down into sequential actions and executing them with feedback l
 Key Features:
 - Task Planning: Converts high-level goals into step-by-step action plans
 - Sequential Execution: Executes actions one at a time with context preservation
+- Parallel Execution: Optionally runs independent actions concurrently as a
+  dependency graph, with per-action timeouts
+- Plan Caching: Reuses plans for goals that differ only in file names,
+  quoted text or numbers
 - Feedback Loops: Incorporates results from each step into the next
 - Memory Integration: Maintains working memory across the entire task
 - Error Handling: Gracefully handles failures and can retry or adapt
@@ -23,7 +27,10 @@ Architecture:
 
 import logging
 import json
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
@@ -50,17 +57,26 @@ class ActionType(Enum):
     PLAN = "plan"
     CUSTOM = "custom"
 
+# Action types without side effects that may run alongside each other
+PARALLEL_SAFE_ACTIONS = {ActionType.READ_FILE, ActionType.SEARCH_CODE, ActionType.ANALYZE}
+
+# Working-memory placeholders in action parameters, e.g. "{{previous_result}}"
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
 class Action:
     """Represents a single action in a task plan."""
     
     def __init__(self, action_type: ActionType, description: str, parameters: Dict[str, Any] = None, 
-                 expected_result: str = None, dependencies: List[str] = None):
+                 expected_result: str = None, dependencies: List[str] = None, timeout: Optional[float] = None):
         self.action_id = str(uuid.uuid4())[:8]
         self.action_type = action_type
         self.description = description
         self.parameters = parameters or {}
         self.expected_result = expected_result
         self.dependencies = dependencies or []
+        self.inferred_dependencies: List[str] = []  # Ordering constraints added by TaskPlan.infer_dependencies
+        self.goal_parameters: List[str] = []  # Parameters the planner filled from the goal text
+        self.timeout = timeout  # Seconds allowed in parallel execution
         self.status = TaskStatus.PENDING
         self.result = None
         self.error = None
@@ -76,12 +92,21 @@ class Action:
             "parameters": self.parameters,
             "expected_result": self.expected_result,
             "dependencies": self.dependencies,
+            "timeout": self.timeout,
             "status": self.status.value,
             "result": self.result,
             "error": self.error,
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None
         }
+    
+    def get_placeholders(self) -> set:
+        """Names of the working-memory placeholders used in the parameters."""
+        found = set()
+        for value in self.parameters.values():
+            if isinstance(value, str):
+                found.update(PLACEHOLDER_PATTERN.findall(value))
+        return found
 
 class TaskPlan:
     """Represents a complete task plan with multiple actions."""
@@ -93,6 +118,8 @@ class TaskPlan:
         self.status = TaskStatus.PENDING
         self.created_at = datetime.now()
         self.working_memory = {}  # Stores results and context between actions
+        self.signature = None     # Normalized goal signature used for plan caching
+        self.from_cache = False
     
     def add_action(self, action: Action) -> None:
         """Add an action to the plan."""
@@ -108,6 +135,79 @@ class TaskPlan:
                     return action
         return None
     
+    def get_ready_actions(self) -> List[Action]:
+        """
+        Get all pending actions whose dependencies are satisfied, in plan order.
+        
+        Explicit dependencies must have completed. Inferred ones only order
+        execution, so a failed action satisfies them: sequential execution
+        carries on past failures it does not treat as fatal.
+        """
+        completed = {a.action_id for a in self.actions if a.status == TaskStatus.COMPLETED}
+        failed = {a.action_id for a in self.actions if a.status == TaskStatus.FAILED}
+        return [
+            action for action in self.actions
+            if action.status == TaskStatus.PENDING and all(
+                dep in completed or (dep in failed and dep in action.inferred_dependencies)
+                for dep in action.dependencies
+            )
+        ]
+    
+    def infer_dependencies(self) -> None:
+        """
+        Add the implicit ordering constraints of sequential execution to each action.
+        
+        ``{{previous_result}}`` depends on the preceding action and
+        ``{{action_<id>}}`` on that action. Any other placeholder may read
+        anything in working memory, so it depends on every earlier action.
+        Actions with side effects (writes, commands, user questions) act as
+        barriers: they wait for every earlier action and every later action
+        waits for them. The added constraints are also recorded in each
+        action's ``inferred_dependencies``.
+        """
+        action_ids = {a.action_id for a in self.actions}
+        
+        for index, action in enumerate(self.actions):
+            earlier = self.actions[:index]
+            explicit = [dep for dep in action.dependencies if dep not in action.inferred_dependencies]
+            dependencies = []
+            placeholders = action.get_placeholders()
+            
+            specific = set()
+            unknown = False
+            for placeholder in placeholders:
+                if placeholder in ("previous_result", "last_result"):
+                    if earlier:
+                        specific.add(earlier[-1].action_id)
+                elif placeholder.startswith("action_") and placeholder[len("action_"):] in action_ids:
+                    specific.add(placeholder[len("action_"):])
+                elif placeholder in self.working_memory:
+                    continue  # Plan inputs already in working memory
+                else:
+                    unknown = True
+            
+            if unknown or action.action_type not in PARALLEL_SAFE_ACTIONS:
+                dependencies.extend(a.action_id for a in earlier)
+            else:
+                dependencies.extend(a.action_id for a in earlier if a.action_id in specific)
+                dependencies.extend(a.action_id for a in earlier if a.action_type not in PARALLEL_SAFE_ACTIONS)
+            
+            action.inferred_dependencies = [dep for dep in dict.fromkeys(dependencies) if dep not in explicit]
+            action.dependencies = explicit + action.inferred_dependencies
+    
+    def get_ancestors(self, action: Action) -> List[Action]:
+        """Actions the given action transitively depends on, in plan order."""
+        by_id = {a.action_id: a for a in self.actions}
+        seen = set()
+        stack = list(action.dependencies)
+        while stack:
+            action_id = stack.pop()
+            if action_id in seen or action_id not in by_id:
+                continue
+            seen.add(action_id)
+            stack.extend(by_id[action_id].dependencies)
+        return [a for a in self.actions if a.action_id in seen]
+    
     def is_complete(self) -> bool:
         """Check if all actions are completed."""
         return all(action.status == TaskStatus.COMPLETED for action in self.actions)
@@ -120,8 +220,192 @@ class TaskPlan:
             "actions": [action.to_dict() for action in self.actions],
             "status": self.status.value,
             "created_at": self.created_at.isoformat(),
-            "working_memory": self.working_memory
+            "working_memory": self.working_memory,
+            "signature": self.signature,
+            "from_cache": self.from_cache
+        }
+
+# Goal fragments that become parameter slots, in extraction order
+GOAL_SLOT_PATTERNS = [
+    ("text", re.compile(r"\"([^\"]+)\"|'([^']+)'")),
+    ("file", re.compile(r"(?<![\w/.-])((?:[\w.-]+/)*[\w-]+\.\w+)(?![\w/.-])")),
+    ("number", re.compile(r"(?<![\w.])(\d+(?:\.\d+)?)(?![\w.])"))
+]
+
+class PlanCache:
+    """
+    Cache of task plan templates keyed on a normalized goal signature.
+    
+    Goals that differ only in file names, quoted text or numbers share a
+    signature. Those values become slots: a parameter the planner filled from
+    the goal (listed in ``Action.goal_parameters``) is bound to its slot and
+    refilled from the new goal when the template is reused. Plans that do not
+    use every slot of their goal are not cached, since another goal with the
+    same signature might plan differently. Templates whose plans keep
+    failing are invalidated.
+    """
+    
+    def __init__(self, max_entries: int = 128, min_uses: int = 3, min_success_rate: float = 0.5):
+        self.max_entries = max_entries
+        self.min_uses = min_uses
+        self.min_success_rate = min_success_rate
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def normalize_goal(self, goal: str) -> Tuple[str, Dict[str, str]]:
+        """Return the goal signature and the slot values extracted from it."""
+        slots = {}
+        template = goal
+        
+        for kind, pattern in GOAL_SLOT_PATTERNS:
+            def replace(match, kind=kind):
+                value = next(group for group in match.groups() if group is not None)
+                name = f"slot_{kind}_{sum(1 for slot in slots if slot.startswith(f'slot_{kind}_'))}"
+                slots[name] = value
+                return f"<{name}>"
+            template = pattern.sub(replace, template)
+        
+        signature = re.sub(r"\s+", " ", template.strip().lower())
+        return signature, slots
+    
+    def get(self, signature: str, goal: str, slots: Dict[str, str]) -> Optional[TaskPlan]:
+        """Instantiate a cached plan for a goal, or return None."""
+        entry = self.entries.get(signature)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(signature)
+        self.hits += 1
+        entry["uses"] += 1
+        
+        actions = []
+        for template in entry["actions"]:
+            parameters = dict(template["parameters"])
+            for key, name in template["slot_parameters"].items():
+                parameters[key] = slots[name]
+            actions.append(Action(
+                action_type=template["action_type"],
+                description=self._fill(template["description"], slots),
+                parameters=parameters,
+                expected_result=self._fill(template["expected_result"], slots),
+                dependencies=[actions[index].action_id for index in template["dependencies"]],
+                timeout=template["timeout"]
+            ))
+        
+        plan = TaskPlan(goal, actions)
+        plan.signature = signature
+        plan.from_cache = True
+        return plan
+    
+    def store(self, signature: str, slots: Dict[str, str], actions: List[Action]) -> None:
+        """Store the plan for a goal as a template over its slots."""
+        if not actions:
+            return
+        
+        slot_parameters = self._slot_parameters(actions, slots)
+        if slot_parameters is None:
+            logger.debug(f"Plan not cached, it does not use every goal slot: {signature}")
+            return
+        
+        positions = {action.action_id: index for index, action in enumerate(actions)}
+        self.entries[signature] = {
+            "actions": [
+                {
+                    "action_type": action.action_type,
+                    "description": self._templatize(action.description, slots),
+                    "parameters": dict(action.parameters),
+                    "slot_parameters": action_slots,
+                    "expected_result": self._templatize(action.expected_result, slots),
+                    "dependencies": [
+                        positions[dep] for dep in action.dependencies
+                        if dep in positions and dep not in action.inferred_dependencies
+                    ],
+                    "timeout": action.timeout
+                }
+                for action, action_slots in zip(actions, slot_parameters)
+            ],
+            "uses": 1,
+            "successes": 0,
+            "outcomes": 0,
+            "created_at": datetime.now().isoformat()
+        }
+        self.entries.move_to_end(signature)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def record_outcome(self, signature: Optional[str], success: bool) -> None:
+        """Record a plan execution result and invalidate unreliable templates."""
+        entry = self.entries.get(signature) if signature else None
+        if entry is None:
+            return
+        
+        entry["outcomes"] += 1
+        if success:
+            entry["successes"] += 1
+        
+        success_rate = entry["successes"] / entry["outcomes"]
+        if entry["outcomes"] >= self.min_uses and success_rate < self.min_success_rate:
+            del self.entries[signature]
+            self.invalidations += 1
+            logger.info(f"🗑️ Plan template invalidated (success rate {success_rate:.0%}): {signature}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations
         }
+    
+    def _slot_parameters(self, actions: List[Action],
+                         slots: Dict[str, str]) -> Optional[List[Dict[str, str]]]:
+        """
+        Bind each action's goal parameters to the slots they came from.
+        
+        Returns one parameter-to-slot mapping per action, or None when a goal
+        parameter matches no slot or a slot is left unused.
+        """
+        names = {}
+        for name, slot_value in slots.items():
+            names.setdefault(slot_value, name)
+        
+        bound = []
+        used = set()
+        for action in actions:
+            action_slots = {}
+            for key in action.goal_parameters:
+                name = names.get(action.parameters.get(key))
+                if name is None:
+                    return None
+                action_slots[key] = name
+                used.add(name)
+            bound.append(action_slots)
+        
+        if used != set(slots):
+            return None
+        return bound
+    
+    def _templatize(self, value: Any, slots: Dict[str, str]) -> Any:
+        """Replace slot values in a description with slot markers."""
+        if not isinstance(value, str):
+            return value
+        for name, slot_value in sorted(slots.items(), key=lambda item: -len(item[1])):
+            value = re.sub(rf"(?<![\w.]){re.escape(slot_value)}(?![\w.])", lambda _: f"<{name}>", value)
+        return value
+    
+    def _fill(self, value: Any, slots: Dict[str, str]) -> Any:
+        """Fill slot markers in a description with slot values."""
+        if not isinstance(value, str):
+            return value
+        for name, slot_value in slots.items():
+            value = value.replace(f"<{name}>", slot_value)
+        return value
 
 class Orchestrator:
     """
@@ -134,28 +418,37 @@ class Orchestrator:
     4. Adapting the plan based on new information
     """
     
-    def __init__(self, atles_brain=None, memory_integration=None):
+    def __init__(self, atles_brain=None, memory_integration=None, max_workers: int = 4,
+                 action_timeout: Optional[float] = None, plan_cache: Optional[PlanCache] = None):
         """
         Initialize the Orchestrator.
         
         Args:
             atles_brain: ATLES Brain instance for reasoning
             memory_integration: Memory integration for context
+            max_workers: Worker threads for parallel plan execution
+            action_timeout: Default per-action timeout in seconds for parallel
+                execution (None for no timeout)
+            plan_cache: Cache of plan templates (a new cache by default)
         """
         self.atles_brain = atles_brain
         self.memory_integration = memory_integration
+        self.max_workers = max_workers
+        self.action_timeout = action_timeout
+        self.plan_cache = plan_cache if plan_cache is not None else PlanCache()
         self.current_plan = None
         self.execution_history = []
         
         logger.info("Orchestrator initialized")
     
-    def execute_goal(self, goal: str, max_steps: int = 10) -> Dict[str, Any]:
+    def execute_goal(self, goal: str, max_steps: int = 10, parallel: bool = False) -> Dict[str, Any]:
         """
         Execute a high-level goal by breaking it down into steps.
         
         Args:
             goal: The high-level goal to achieve
             max_steps: Maximum number of steps to execute
+            parallel: Run independent actions concurrently
             
         Returns:
             Dictionary with execution results and status
@@ -169,12 +462,18 @@ class Orchestrator:
                 return {"success": False, "error": "Failed to generate task plan"}
             
             # Step 2: Execute the plan
-            execution_result = self._execute_plan(plan, max_steps)
+            if parallel:
+                execution_result = self._execute_plan_parallel(plan, max_steps)
+            else:
+                execution_result = self._execute_plan(plan, max_steps)
+            
+            self.plan_cache.record_outcome(plan.signature, execution_result["success"])
             
             # Step 3: Return results
             return {
                 "success": execution_result["success"],
                 "goal": goal,
+                "plan_cache_hit": plan.from_cache,
                 "plan": plan.to_dict(),
                 "execution_result": execution_result,
                 "working_memory": plan.working_memory
@@ -189,10 +488,18 @@ class Orchestrator:
         Generate a step-by-step plan for achieving the goal.
         
         This uses ATLES reasoning to break down the goal into actionable steps.
+        Goals matching a cached signature reuse the cached plan template
+        instead of planning again.
         """
         logger.info(f"📋 Generating task plan for: {goal}")
         
         try:
+            signature, slots = self.plan_cache.normalize_goal(goal)
+            cached_plan = self.plan_cache.get(signature, goal, slots)
+            if cached_plan:
+                logger.info(f"♻️ Reusing cached plan with {len(cached_plan.actions)} actions")
+                return cached_plan
+            
             # For now, directly create the plan based on the goal
             actions = self._create_fallback_actions(goal)
             
@@ -202,6 +509,8 @@ class Orchestrator:
             
             # Create task plan
             plan = TaskPlan(goal, actions)
+            plan.signature = signature
+            self.plan_cache.store(signature, slots, actions)
             logger.info(f"✅ Generated plan with {len(actions)} actions")
             
             return plan
@@ -343,6 +652,8 @@ class Orchestrator:
                 parameters={"file_path": file_path},
                 expected_result="File contents"
             )
+            if file_match:
+                action1.goal_parameters = ["file_path"]
             actions.append(action1)
             logger.info(f"🔍 DEBUG: Created action 1: READ_FILE {file_path}")
             
@@ -393,27 +704,118 @@ class Orchestrator:
             result = self._execute_action(next_action, plan.working_memory)
             
             # Update action status
-            if result["success"]:
-                next_action.status = TaskStatus.COMPLETED
-                next_action.result = result.get("result")
-                next_action.completed_at = datetime.now()
-                
+            if self._record_action_result(next_action, result):
                 # Store result in working memory
-                plan.working_memory[f"action_{next_action.action_id}"] = result.get("result")
-                plan.working_memory["last_result"] = result.get("result")
-                
-                logger.info(f"✅ Action completed: {next_action.description}")
+                self._merge_action_result(plan.working_memory, next_action)
             else:
-                next_action.status = TaskStatus.FAILED
-                next_action.error = result.get("error")
-                logger.error(f"❌ Action failed: {next_action.description} - {result.get('error')}")
-                
                 # Decide whether to continue or stop
                 if not self._should_continue_after_failure(next_action, plan):
                     break
             
             executed_steps += 1
         
+        return self._finish_plan(plan, executed_steps)
+    
+    def _execute_plan_parallel(self, plan: TaskPlan, max_steps: int) -> Dict[str, Any]:
+        """
+        Execute the task plan as a dependency graph on a worker pool.
+        
+        Ready actions run concurrently, each seeing working memory built from
+        the actions it depends on. Actions exceeding their timeout fail, and a
+        failure that would stop sequential execution cancels in-flight
+        actions. Results are merged into working memory in plan order, so the
+        final memory does not depend on completion order.
+        """
+        logger.info(f"🚀 Executing plan with {len(plan.actions)} actions in parallel")
+        
+        plan.infer_dependencies()
+        plan.status = TaskStatus.IN_PROGRESS
+        initial_memory = dict(plan.working_memory)
+        executed_steps = 0
+        running = {}
+        fatal = False
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"plan-{plan.plan_id}")
+        
+        try:
+            while True:
+                if not fatal:
+                    for action in plan.get_ready_actions():
+                        if executed_steps >= max_steps:
+                            break
+                        memory = dict(initial_memory)
+                        for ancestor in plan.get_ancestors(action):
+                            self._merge_action_result(memory, ancestor)
+                        
+                        logger.info(f"⚡ Executing action: {action.description}")
+                        action.status = TaskStatus.IN_PROGRESS
+                        timeout = action.timeout if action.timeout is not None else self.action_timeout
+                        deadline = time.monotonic() + timeout if timeout is not None else None
+                        running[executor.submit(self._execute_action, action, memory)] = (action, deadline)
+                        executed_steps += 1
+                
+                if not running:
+                    break
+                
+                deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+                wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait(list(running), timeout=wait_time, return_when=FIRST_COMPLETED)
+                
+                failed = []
+                for future in done:
+                    action, _ = running.pop(future)
+                    if not self._record_action_result(action, future.result()):
+                        failed.append(action)
+                
+                now = time.monotonic()
+                for future, (action, deadline) in list(running.items()):
+                    if deadline is not None and now >= deadline:
+                        del running[future]
+                        future.cancel()
+                        timeout = action.timeout if action.timeout is not None else self.action_timeout
+                        self._record_action_result(action, {"success": False, "error": f"Action timed out after {timeout}s"})
+                        failed.append(action)
+                
+                if any(not self._should_continue_after_failure(action, plan) for action in failed):
+                    fatal = True
+                    for future, (action, _) in running.items():
+                        future.cancel()
+                        action.status = TaskStatus.CANCELLED
+                        logger.warning(f"🛑 Action cancelled: {action.description}")
+                    running.clear()
+        finally:
+            # Timed-out or cancelled actions may still be running; do not wait for them
+            executor.shutdown(wait=False)
+        
+        for action in plan.actions:
+            self._merge_action_result(plan.working_memory, action)
+        
+        result = self._finish_plan(plan, executed_steps)
+        result["cancelled_actions"] = len([a for a in plan.actions if a.status == TaskStatus.CANCELLED])
+        return result
+    
+    def _record_action_result(self, action: Action, result: Dict[str, Any]) -> bool:
+        """Update an action from its execution result. Returns whether it succeeded."""
+        if result["success"]:
+            action.status = TaskStatus.COMPLETED
+            action.result = result.get("result")
+            action.completed_at = datetime.now()
+            logger.info(f"✅ Action completed: {action.description}")
+            return True
+        
+        action.status = TaskStatus.FAILED
+        action.error = result.get("error")
+        logger.error(f"❌ Action failed: {action.description} - {result.get('error')}")
+        return False
+    
+    def _merge_action_result(self, working_memory: Dict[str, Any], action: Action) -> None:
+        """Store a completed action's result in working memory."""
+        if action.status != TaskStatus.COMPLETED:
+            return
+        working_memory[f"action_{action.action_id}"] = action.result
+        working_memory["last_result"] = action.result
+    
+    def _finish_plan(self, plan: TaskPlan, executed_steps: int) -> Dict[str, Any]:
+        """Set the final plan status and summarize execution."""
         # Update plan status
         if plan.is_complete():
             plan.status = TaskStatus.COMPLETED
@@ -575,15 +977,18 @@ class Orchestrator:
         return failed_action.action_type not in critical_actions
 
 # Convenience function for easy integration
-def create_orchestrator(atles_brain=None, memory_integration=None) -> Orchestrator:
+def create_orchestrator(atles_brain=None, memory_integration=None, max_workers: int = 4,
+                        action_timeout: Optional[float] = None) -> Orchestrator:
     """
     Create and return a new Orchestrator instance.
     
     Args:
         atles_brain: ATLES Brain instance for reasoning
         memory_integration: Memory integration for context
+        max_workers: Worker threads for parallel plan execution
+        action_timeout: Default per-action timeout in seconds for parallel execution
         
     Returns:
         Orchestrator instance
     """
-    return Orchestrator(atles_brain, memory_integration)
+    return Orchestrator(atles_brain, memory_integration, max_workers, action_timeout)
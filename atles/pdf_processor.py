@@ -3,25 +3,292 @@ ATLES PDF Processing Module
 
 This module provides functionality to extract text from PDF documents,
 supporting both direct file paths and URLs.
+
+Pages can be streamed with iter_pdf_pages, which extracts large documents
+across a process pool and caches extracted text per page, keyed by the
+file's content hash.
 """
 
 import os
+import json
+import hashlib
 import tempfile
 import logging
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
 # Import dependency manager
-from .dependency_checker import dependency_group_required, dependency_required
+from .dependency_checker import dependency_group_required, dependency_required, dependency_manager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = "atles_memory/pdf_cache"
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PARALLEL_PAGE_THRESHOLD = 32  # Smaller documents are extracted in-process
+PAGES_PER_TASK = 8
+
+
+class PDFTextCache:
+    """
+    Per-page text cache for PDFs, keyed by file content hash.
+    
+    Hashes are memoized per (path, mtime, size), so an unchanged file is
+    only read once per process to compute its key. The cache is bounded by
+    entry count and total bytes; the least recently used entries are pruned
+    first.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._bytes_since_prune = 0
+    
+    def file_hash(self, file_path: str) -> str:
+        """Content hash of a file, reused while its mtime and size are unchanged."""
+        stat = os.stat(file_path)
+        path = os.path.abspath(file_path)
+        with self._lock:
+            known = self._hashes.get(path)
+        if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+        
+        with self._lock:
+            self._hashes[path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+    
+    def _entry_path(self, file_hash: str) -> Path:
+        return self.cache_dir / f"{file_hash}.json"
+    
+    def load(self, file_hash: str) -> Dict[int, str]:
+        """Cached page texts by 1-based page number."""
+        path = self._entry_path(file_hash)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)  # Mark as recently used for pruning
+            return {int(number): text for number, text in data.get("pages", {}).items()}
+        except (OSError, ValueError):
+            return {}
+    
+    def save(self, file_hash: str, pages: Dict[int, str], num_pages: int):
+        """Merge page texts into the cache entry."""
+        if not pages:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            merged = self.load(file_hash)
+            merged.update(pages)
+            path = self._entry_path(file_hash)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"num_pages": num_pages, "pages": {str(n): t for n, t in merged.items()}}, f)
+                size = f.tell()
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write PDF cache entry: {e}")
+            return
+        
+        with self._lock:
+            self._writes_since_prune += 1
+            self._bytes_since_prune += size
+            if (self._writes_since_prune < max(1, self.max_entries // 10)
+                    and self._bytes_since_prune < self.max_bytes // 10):
+                return
+            self._writes_since_prune = 0
+            self._bytes_since_prune = 0
+        self.prune()
+    
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(last use, size, path) of every entry."""
+        entries = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def prune(self) -> int:
+        """Remove the least recently used entries beyond max_entries and max_bytes."""
+        entries = sorted(self._entries(), reverse=True)
+        kept_bytes = 0
+        removed = 0
+        for index, (_, size, path) in enumerate(entries):
+            kept_bytes += size
+            if index >= self.max_entries or kept_bytes > self.max_bytes:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+    
+    def clear(self):
+        """Remove all cached pages."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache location and size."""
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes
+        }
+
+
+_default_cache: Optional[PDFTextCache] = None
+_default_cache_enabled = os.environ.get("ATLES_PDF_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+def configure_pdf_cache(enabled: bool = True, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                        max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+    """
+    Configure the default page cache under DEFAULT_CACHE_DIR.
+    
+    The cache can also be disabled by setting ATLES_PDF_CACHE=0; callers can
+    always bypass it for one call with cache_dir=None.
+    """
+    global _default_cache, _default_cache_enabled
+    _default_cache_enabled = enabled
+    _default_cache = PDFTextCache(DEFAULT_CACHE_DIR, max_entries, max_bytes) if enabled else None
+
+
+def _get_cache(cache_dir: Optional[Union[str, Path]]) -> Optional[PDFTextCache]:
+    global _default_cache
+    if cache_dir is None:
+        return None
+    if Path(cache_dir) == Path(DEFAULT_CACHE_DIR):
+        if not _default_cache_enabled:
+            return None
+        if _default_cache is None:
+            _default_cache = PDFTextCache(DEFAULT_CACHE_DIR)
+        return _default_cache
+    return PDFTextCache(cache_dir)
+
+
+def parse_page_spec(pages: Union[str, Iterable[int], None], num_pages: int) -> List[int]:
+    """
+    Resolve a page selection to sorted 1-based page numbers.
+    
+    Accepts None (all pages), an iterable of page numbers, or a string such
+    as "1-3,7,10-". Pages outside the document are ignored.
+    """
+    if pages is None:
+        return list(range(1, num_pages + 1))
+    
+    selected = set()
+    if isinstance(pages, str):
+        for part in pages.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                start, _, end = part.partition('-')
+                first = int(start) if start.strip() else 1
+                last = int(end) if end.strip() else num_pages
+                selected.update(range(first, last + 1))
+            else:
+                selected.add(int(part))
+    else:
+        selected.update(int(page) for page in pages)
+    
+    return sorted(page for page in selected if 1 <= page <= num_pages)
+
+
+def _extract_page_range(file_path: str, page_numbers: List[int]) -> List[Tuple[int, str]]:
+    """Extract a run of pages; runs in worker processes."""
+    import pdfplumber
+    
+    with pdfplumber.open(file_path) as pdf:
+        return [(number, pdf.pages[number - 1].extract_text() or "") for number in page_numbers]
+
+
+def iter_pdf_pages(file_path: str, pages: Union[str, Iterable[int], None] = None,
+                   max_workers: Optional[int] = None,
+                   cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the text of each selected page, in page order, as it becomes available.
+    
+    Documents with at least PARALLEL_PAGE_THRESHOLD uncached pages are split
+    into runs of PAGES_PER_TASK pages extracted in a process pool; the first
+    pages are yielded while later ones are still being extracted. Extracted
+    text is cached by file hash unless cache_dir is None.
+    """
+    if not dependency_manager.check_dependency("pdfplumber"):
+        raise ImportError("Required dependency 'pdfplumber' is not installed: pip install pdfplumber")
+    import pdfplumber
+    
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    if not file_path.lower().endswith('.pdf'):
+        raise ValueError(f"File is not a PDF: {file_path}")
+    
+    cache = _get_cache(cache_dir)
+    file_hash = cache.file_hash(file_path) if cache else None
+    cached = cache.load(file_hash) if cache else {}
+    extracted: Dict[int, str] = {}
+    
+    with pdfplumber.open(file_path) as pdf:
+        num_pages = len(pdf.pages)
+        selected = parse_page_spec(pages, num_pages)
+        missing = [number for number in selected if number not in cached]
+        workers = max_workers or os.cpu_count() or 1
+        
+        def page(number: int, text: str) -> Dict[str, Any]:
+            return {"page_number": number, "text": text, "num_pages": num_pages}
+        
+        try:
+            if len(missing) < PARALLEL_PAGE_THRESHOLD or workers <= 1:
+                for number in selected:
+                    if number not in cached:
+                        extracted[number] = pdf.pages[number - 1].extract_text() or ""
+                    yield page(number, cached.get(number, extracted.get(number)))
+                    
+                    # Provide progress log for large documents
+                    if number % 10 == 0 and num_pages > 20:
+                        logger.info(f"PDF processing: {number}/{num_pages} pages")
+                return
+            
+            runs = [missing[i:i + PAGES_PER_TASK] for i in range(0, len(missing), PAGES_PER_TASK)]
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(runs)))
+            try:
+                futures = {run[0]: executor.submit(_extract_page_range, file_path, run) for run in runs}
+                for number in selected:
+                    if number not in cached and number not in extracted:
+                        extracted.update(futures[number].result())
+                        logger.info(f"PDF processing: {len(extracted)}/{len(missing)} pages extracted")
+                    yield page(number, cached.get(number, extracted.get(number)))
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        finally:
+            if cache:
+                cache.save(file_hash, extracted, num_pages)
+
+
 @dependency_required("pdfplumber")
-def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
-    """Extract text from a local PDF file"""
+def extract_text_from_pdf(file_path: str, pages: Union[str, Iterable[int], None] = None,
+                          max_workers: Optional[int] = None,
+                          cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR) -> Dict[str, Any]:
+    """Extract text from a local PDF file, optionally limited to a page selection"""
     try:
-        import pdfplumber
-        
         # Validate file exists
         if not os.path.exists(file_path):
             return {
@@ -40,16 +307,12 @@ def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
             
         # Extract text
         text_content = []
-        with pdfplumber.open(file_path) as pdf:
-            num_pages = len(pdf.pages)
-            
-            for i, page in enumerate(pdf.pages):
-                page_text = page.extract_text() or ""
-                text_content.append(page_text)
-                
-                # Provide progress log for large documents
-                if i % 10 == 0 and num_pages > 20:
-                    logger.info(f"PDF processing: {i+1}/{num_pages} pages")
+        page_numbers = []
+        num_pages = 0
+        for page in iter_pdf_pages(file_path, pages, max_workers=max_workers, cache_dir=cache_dir):
+            text_content.append(page["text"])
+            page_numbers.append(page["page_number"])
+            num_pages = page["num_pages"]
             
         full_text = "\n\n".join(text_content)
         
@@ -57,6 +320,7 @@ def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
             "success": True,
             "text": full_text,
             "num_pages": num_pages,
+            "pages_extracted": page_numbers,
             "file_path": file_path,
             "chars": len(full_text)
         }
@@ -70,7 +334,8 @@ def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
         }
 
 @dependency_group_required("pdf_processing")
-def fetch_and_read_pdf(url: str, timeout: int = 30) -> Dict[str, Any]:
+def fetch_and_read_pdf(url: str, timeout: int = 30,
+                       pages: Union[str, Iterable[int], None] = None) -> Dict[str, Any]:
     """Fetch a PDF from a URL and extract its text content"""
     try:
         import requests
@@ -105,7 +370,7 @@ def fetch_and_read_pdf(url: str, timeout: int = 30) -> Dict[str, Any]:
                     f.write(chunk)
             
             # Extract text from the downloaded PDF
-            extract_result = extract_text_from_pdf(temp_path)
+            extract_result = extract_text_from_pdf(temp_path, pages)
             
             # Add URL info to the result
             extract_result["url"] = url
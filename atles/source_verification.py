@@ -11,14 +11,19 @@ the core issue of hallucinated links and unverifiable claims.
 
 import asyncio
 import aiohttp
+import codecs
 import logging
 import json
 import re
 import hashlib
+import sqlite3
+import threading
+from collections import deque
 from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
+from html.parser import HTMLParser
 import ssl
 import certifi
 from dataclasses import dataclass, asdict
@@ -46,6 +51,10 @@ class SourceVerificationResult:
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SourceVerificationResult':
+        return cls(**data)
 
 
 @dataclass
@@ -66,6 +75,171 @@ class FactCheckResult:
             'supporting_sources': [s.to_dict() for s in self.supporting_sources],
             'contradicting_sources': [s.to_dict() for s in self.contradicting_sources]
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FactCheckResult':
+        return cls(**{
+            **data,
+            'supporting_sources': [SourceVerificationResult.from_dict(s) for s in data['supporting_sources']],
+            'contradicting_sources': [SourceVerificationResult.from_dict(s) for s in data['contradicting_sources']]
+        })
+
+
+@dataclass
+class CachedVerification:
+    """A cache entry together with the HTTP validators needed to revalidate it"""
+    value: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+    
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+    
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class VerificationCache:
+    """
+    Persistent cache of verification and fact-check results in SQLite.
+    
+    Entries live in namespaces ('source' keyed by URL, 'claim' keyed by claim
+    and sources) and carry an expiry time plus the ETag/Last-Modified
+    validators of the response. Expired entries are kept so they can be
+    revalidated with a conditional request; the cache is bounded by entry
+    count and evicts least recently used entries first.
+    """
+    
+    def __init__(self, db_path: Union[str, Path] = "atles_memory/verification_cache.sqlite",
+                 max_entries: int = 10000):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+    
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Database connection, opened on first use."""
+        if self._db is None:
+            self._open()
+        return self._db
+    
+    def _open(self):
+        if str(self.db_path) != ':memory:':
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        self._db.commit()
+    
+    def get(self, namespace: str, key: str) -> Optional[CachedVerification]:
+        """Return the entry for a key, fresh or expired, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, last_modified, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key)
+            )
+            self._conn.commit()
+        
+        entry = CachedVerification(json.loads(row[0]), row[1], row[2], row[3])
+        if entry.is_fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+    
+    def put(self, namespace: str, key: str, value: Dict[str, Any], ttl: float,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store an entry that stays fresh for ``ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), etag, last_modified, now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def refresh(self, namespace: str, key: str, ttl: float, value: Optional[Dict[str, Any]] = None):
+        """Extend an entry's freshness (and optionally update its value) after
+        a successful revalidation (304), keeping its validators."""
+        now = time.time()
+        with self._lock:
+            if value is None:
+                self._conn.execute(
+                    "UPDATE entries SET expires_at = ?, last_access = ? WHERE namespace = ? AND key = ?",
+                    (now + ttl, now, namespace, key)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE entries SET value = ?, expires_at = ?, last_access = ? WHERE namespace = ? AND key = ?",
+                    (json.dumps(value), now + ttl, now, namespace, key)
+                )
+            self._conn.commit()
+    
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+    
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and hit statistics."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            "db_path": str(self.db_path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
 
 
 class DomainReputationManager:
@@ -156,13 +330,100 @@ class DomainReputationManager:
             return (0.3, 'error')
 
 
+class HTMLMetadataParser(HTMLParser):
+    """
+    Incremental extractor for a page's title, meta description and content
+    preview (the first paragraph with more than 50 characters of text).
+    
+    Feed it chunks as they arrive and stop reading once ``done`` is set:
+    that happens after the head has closed and a preview paragraph has been
+    found, so most of a large page is never downloaded.
+    """
+    
+    PREVIEW_MIN_LENGTH = 50
+    PREVIEW_MAX_LENGTH = 200
+    
+    def __init__(self, want_preview: bool = True):
+        super().__init__(convert_charrefs=True)
+        self.want_preview = want_preview
+        self.title: Optional[str] = None
+        self.description: Optional[str] = None
+        self.content_preview: Optional[str] = None
+        self.head_closed = False
+        self._title_parts: Optional[List[str]] = None
+        self._paragraph_parts: Optional[List[str]] = None
+        self._skip_depth = 0  # inside <script> or <style>
+    
+    @property
+    def done(self) -> bool:
+        if not self.head_closed:
+            return False
+        return not self.want_preview or self.content_preview is not None
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+        elif tag == 'title' and self.title is None:
+            self._title_parts = []
+        elif tag == 'meta' and self.description is None:
+            attributes = {name.lower(): value for name, value in attrs}
+            if (attributes.get('name') or '').lower() == 'description' and attributes.get('content') is not None:
+                self.description = attributes['content'].strip()
+        elif tag == 'body':
+            self.head_closed = True
+        elif tag == 'p' and self.content_preview is None:
+            self._paragraph_parts = []
+    
+    def handle_endtag(self, tag: str):
+        if tag in ('script', 'style'):
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'title' and self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip()
+            self._title_parts = None
+        elif tag == 'head':
+            self.head_closed = True
+        elif tag == 'p' and self._paragraph_parts is not None:
+            text = ''.join(self._paragraph_parts).strip()
+            self._paragraph_parts = None
+            if len(text) > self.PREVIEW_MIN_LENGTH:
+                limit = self.PREVIEW_MAX_LENGTH
+                self.content_preview = text[:limit] + '...' if len(text) > limit else text
+    
+    def handle_data(self, data: str):
+        if self._skip_depth:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._paragraph_parts is not None:
+            self._paragraph_parts.append(data)
+
+
 class SourceVerifier:
-    """Verifies the accessibility and authenticity of web sources"""
+    """Verifies the accessibility and authenticity of web sources
     
-    def __init__(self):
+    All requests go through one long-lived aiohttp session whose connector
+    keeps connections alive, caches DNS lookups and bounds connections in
+    total and per host. Call ``close()`` (or use ``async with``) when done.
+    
+    Results are cached on disk; expired entries are revalidated with a
+    conditional GET (ETag / Last-Modified), so an unchanged page costs at
+    most one 304 round trip, even after a restart.
+    """
+    
+    def __init__(self, max_connections: int = 64, max_connections_per_host: int = 8,
+                 dns_cache_ttl: int = 300, keepalive_timeout: float = 30.0,
+                 cache: Optional[VerificationCache] = None):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         self.domain_manager = DomainReputationManager()
-        self.verification_cache = {}
+        self.cache = cache or VerificationCache()
         self.cache_expiry = timedelta(hours=6)  # Cache verification results for 6 hours
+        self.error_cache_expiry = timedelta(minutes=10)  # Retry failed sources sooner
+        self.html_byte_budget = 64 * 1024  # Stop reading HTML pages after this many bytes
         
         # SSL context for secure connections
         self.ssl_context = ssl.create_default_context(cafile=certifi.where())
@@ -176,75 +437,121 @@ class SourceVerifier:
             'Connection': 'keep-alive',
         }
     
+    async def __aenter__(self) -> 'SourceVerifier':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """Close the shared session, its pooled connections and the cache database"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed and self._session_loop is asyncio.get_running_loop():
+            await session.close()
+        self._session_loop = None
+        self.cache.close()
+    
     async def verify_source(self, url: str, timeout: int = 10) -> SourceVerificationResult:
         """Verify a single source URL"""
         start_time = time.time()
         
         try:
             # Check cache first
-            cache_key = hashlib.md5(url.encode()).hexdigest()
-            if cache_key in self.verification_cache:
-                cached_result, timestamp = self.verification_cache[cache_key]
-                if datetime.now() - timestamp < self.cache_expiry:
-                    logger.info(f"Using cached verification for {url}")
-                    return cached_result
+            cached = self.cache.get('source', url)
+            if cached is not None and cached.is_fresh:
+                logger.info(f"Using cached verification for {url}")
+                return SourceVerificationResult.from_dict(cached.value)
             
-            # Get domain reputation
-            trust_score, domain_reputation = self.domain_manager.get_domain_reputation(url)
+            # Revalidate an expired entry instead of fetching it again
+            request_headers = {}
+            if cached is not None and cached.can_revalidate:
+                if cached.etag:
+                    request_headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    request_headers['If-Modified-Since'] = cached.last_modified
             
-            # Verify URL accessibility
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
+            # Verify URL accessibility with a single GET: the headers answer
+            # the accessibility question and the body is read only for HTML
+            session = self._get_session()
             timeout_config = aiohttp.ClientTimeout(total=timeout)
             
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout_config,
-                headers=self.headers
-            ) as session:
+            async with session.get(url, allow_redirects=True, timeout=timeout_config,
+                                   headers=request_headers) as response:
+                response_time_ms = (time.time() - start_time) * 1000
                 
-                async with session.head(url, allow_redirects=True) as response:
-                    response_time_ms = (time.time() - start_time) * 1000
-                    
-                    # Extract metadata
-                    content_type = response.headers.get('content-type', '').split(';')[0]
-                    last_modified = response.headers.get('last-modified')
-                    
-                    # For HTML content, get title and description
-                    title = None
-                    description = None
-                    content_preview = None
-                    
-                    if content_type.startswith('text/html'):
-                        try:
-                            async with session.get(url, allow_redirects=True) as full_response:
-                                if full_response.status == 200:
-                                    html_content = await full_response.text()
-                                    title, description, content_preview = self._extract_html_metadata(html_content)
-                        except Exception as e:
-                            logger.warning(f"Could not extract HTML metadata from {url}: {e}")
-                    
-                    # Create verification result
-                    result = SourceVerificationResult(
-                        url=url,
-                        is_valid=response.status < 400,
-                        status_code=response.status,
-                        response_time_ms=response_time_ms,
-                        content_type=content_type,
-                        title=title,
-                        description=description,
-                        last_modified=last_modified,
-                        verification_timestamp=datetime.now().isoformat(),
-                        error_message=None if response.status < 400 else f"HTTP {response.status}",
-                        trust_score=trust_score,
-                        domain_reputation=domain_reputation,
-                        content_preview=content_preview
-                    )
-                    
-                    # Cache the result
-                    self.verification_cache[cache_key] = (result, datetime.now())
-                    
-                    logger.info(f"Verified source {url}: status={response.status}, trust={trust_score:.2f}")
+                if response.status == 304 and request_headers:
+                    result = SourceVerificationResult.from_dict({
+                        **cached.value,
+                        'response_time_ms': response_time_ms,
+                        'verification_timestamp': datetime.now().isoformat()
+                    })
+                    self.cache.refresh('source', url, self.cache_expiry.total_seconds(), result.to_dict())
+                    logger.info(f"Source unchanged since last verification: {url}")
                     return result
+                
+                # Get domain reputation of where the URL actually leads
+                # (redirects, e.g. from URL shorteners, have been followed)
+                trust_score, domain_reputation = self.domain_manager.get_domain_reputation(str(response.url))
+                
+                # Extract metadata
+                content_type = response.headers.get('content-type', '').split(';')[0]
+                last_modified = response.headers.get('last-modified')
+                
+                # For HTML content, get title and description
+                title = None
+                description = None
+                content_preview = None
+                
+                if content_type.startswith('text/html') and response.status == 200:
+                    try:
+                        title, description, content_preview = await self._read_html_metadata(response)
+                    except Exception as e:
+                        logger.warning(f"Could not extract HTML metadata from {url}: {e}")
+                
+                if not response.content.at_eof():
+                    response.close()  # abort the rest of the transfer
+                
+                # Create verification result
+                result = SourceVerificationResult(
+                    url=url,
+                    is_valid=response.status < 400,
+                    status_code=response.status,
+                    response_time_ms=response_time_ms,
+                    content_type=content_type,
+                    title=title,
+                    description=description,
+                    last_modified=last_modified,
+                    verification_timestamp=datetime.now().isoformat(),
+                    error_message=None if response.status < 400 else f"HTTP {response.status}",
+                    trust_score=trust_score,
+                    domain_reputation=domain_reputation,
+                    content_preview=content_preview
+                )
+                
+                # Cache the result, with validators for later revalidation
+                if response.status < 400:
+                    self.cache.put('source', url, result.to_dict(), self.cache_expiry.total_seconds(),
+                                   etag=response.headers.get('etag'), last_modified=last_modified)
+                else:
+                    self.cache.put('source', url, result.to_dict(), self.error_cache_expiry.total_seconds())
+                
+                logger.info(f"Verified source {url}: status={response.status}, trust={trust_score:.2f}")
+                return result
         
         except asyncio.TimeoutError:
             result = SourceVerificationResult(
@@ -281,50 +588,45 @@ class SourceVerifier:
             )
         
         # Cache failed results too (but with shorter expiry)
-        cache_key = hashlib.md5(url.encode()).hexdigest()
-        self.verification_cache[cache_key] = (result, datetime.now())
+        try:
+            self.cache.put('source', url, result.to_dict(), self.error_cache_expiry.total_seconds())
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache verification of {url}: {e}")
         
         return result
     
+    async def _read_html_metadata(self, response: aiohttp.ClientResponse) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Stream an HTML body just far enough to extract its metadata"""
+        parser = HTMLMetadataParser()
+        decoder = codecs.getincrementaldecoder(response.get_encoding() if response.charset else 'utf-8')(errors='replace')
+        received = 0
+        
+        async for chunk in response.content.iter_chunked(8192):
+            received += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.done or received >= self.html_byte_budget:
+                break
+        
+        return parser.title, parser.description, parser.content_preview
+    
     def _extract_html_metadata(self, html_content: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Extract title, description, and content preview from HTML"""
         try:
-            # Extract title
-            title_match = re.search(r'<title[^>]*>(.*?)</title>', html_content, re.IGNORECASE | re.DOTALL)
-            title = title_match.group(1).strip() if title_match else None
-            
-            # Extract meta description
-            desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', html_content, re.IGNORECASE)
-            description = desc_match.group(1).strip() if desc_match else None
-            
-            # Extract content preview (first paragraph or meaningful text)
-            # Remove script and style tags
-            clean_html = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.IGNORECASE | re.DOTALL)
-            clean_html = re.sub(r'<style[^>]*>.*?</style>', '', clean_html, flags=re.IGNORECASE | re.DOTALL)
-            
-            # Extract text from paragraphs
-            p_matches = re.findall(r'<p[^>]*>(.*?)</p>', clean_html, re.IGNORECASE | re.DOTALL)
-            if p_matches:
-                # Clean HTML tags and get first meaningful paragraph
-                for p in p_matches:
-                    clean_p = re.sub(r'<[^>]+>', '', p).strip()
-                    if len(clean_p) > 50:  # Meaningful content
-                        content_preview = clean_p[:200] + '...' if len(clean_p) > 200 else clean_p
-                        break
-                else:
-                    content_preview = None
-            else:
-                content_preview = None
-            
-            return title, description, content_preview
+            parser = HTMLMetadataParser()
+            parser.feed(html_content)
+            return parser.title, parser.description, parser.content_preview
             
         except Exception as e:
             logger.error(f"Error extracting HTML metadata: {e}")
             return None, None, None
     
-    async def verify_multiple_sources(self, urls: List[str], max_concurrent: int = 5) -> List[SourceVerificationResult]:
-        """Verify multiple sources concurrently"""
-        semaphore = asyncio.Semaphore(max_concurrent)
+    async def verify_multiple_sources(self, urls: List[str], max_concurrent: Optional[int] = None) -> List[SourceVerificationResult]:
+        """Verify multiple sources concurrently
+        
+        Sockets are bounded by the session's connector limits; ``max_concurrent``
+        (default: ``max_connections``) bounds the number of in-flight checks.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_connections)
         
         async def verify_with_semaphore(url):
             async with semaphore:
@@ -362,21 +664,22 @@ class SourceVerifier:
 class FactChecker:
     """Advanced fact-checking system that cross-references claims with verified sources"""
     
-    def __init__(self):
-        self.source_verifier = SourceVerifier()
-        self.fact_check_cache = {}
+    def __init__(self, source_verifier: Optional[SourceVerifier] = None):
+        self.source_verifier = source_verifier or SourceVerifier()
+        self.cache = self.source_verifier.cache
         self.cache_expiry = timedelta(hours=12)
     
     async def check_claim(self, claim: str, provided_sources: List[str] = None) -> FactCheckResult:
         """Check a factual claim against available sources"""
         try:
-            # Check cache first
-            cache_key = hashlib.md5(claim.encode()).hexdigest()
-            if cache_key in self.fact_check_cache:
-                cached_result, timestamp = self.fact_check_cache[cache_key]
-                if datetime.now() - timestamp < self.cache_expiry:
-                    logger.info(f"Using cached fact-check for claim: {claim[:50]}...")
-                    return cached_result
+            # Check cache first (the verdict depends on the sources too)
+            cache_key = hashlib.sha256(
+                json.dumps([claim, sorted(provided_sources or [])]).encode()
+            ).hexdigest()
+            cached = self.cache.get('claim', cache_key)
+            if cached is not None and cached.is_fresh:
+                logger.info(f"Using cached fact-check for claim: {claim[:50]}...")
+                return FactCheckResult.from_dict(cached.value)
             
             # Verify provided sources
             supporting_sources = []
@@ -422,7 +725,7 @@ class FactChecker:
             )
             
             # Cache the result
-            self.fact_check_cache[cache_key] = (result, datetime.now())
+            self.cache.put('claim', cache_key, result.to_dict(), self.cache_expiry.total_seconds())
             
             logger.info(f"Fact-check completed: {verification_status} (confidence: {confidence_score:.2f})")
             return result
@@ -550,10 +853,17 @@ class FactChecker:
 class SourceVerificationAPI:
     """Main API for source verification and fact-checking"""
     
-    def __init__(self):
-        self.source_verifier = SourceVerifier()
-        self.fact_checker = FactChecker()
-        self.verification_log = []
+    def __init__(self, source_verifier: Optional[SourceVerifier] = None, log_size: int = 1000):
+        # The fact checker shares the verifier, and with it the HTTP session
+        self.source_verifier = source_verifier or SourceVerifier()
+        self.fact_checker = FactChecker(self.source_verifier)
+        # Long-lived APIs keep only the most recent log entries
+        self.verification_log = deque(maxlen=log_size)
+        self.total_verifications = 0
+    
+    async def close(self):
+        """Release pooled HTTP connections"""
+        await self.source_verifier.close()
     
     async def verify_and_check_sources(self, text_with_sources: str) -> Dict[str, Any]:
         """Extract sources from text and verify them comprehensively"""
@@ -597,6 +907,7 @@ class SourceVerificationAPI:
                 'overall_reliability': overall_reliability
             }
             self.verification_log.append(verification_entry)
+            self.total_verifications += 1
             
             return {
                 'status': 'verification_complete',
@@ -708,10 +1019,11 @@ class SourceVerificationAPI:
         if not self.verification_log:
             return {'message': 'No verifications performed yet'}
         
-        recent_verifications = self.verification_log[-10:]
+        recent_verifications = list(self.verification_log)[-10:]
         
         return {
-            'total_verifications': len(self.verification_log),
+            'verification_cache': self.source_verifier.cache.get_stats(),
+            'total_verifications': self.total_verifications,
             'recent_verifications': len(recent_verifications),
             'avg_sources_per_verification': sum(v['urls_found'] for v in recent_verifications) / len(recent_verifications),
             'reliability_distribution': {
@@ -721,6 +1033,11 @@ class SourceVerificationAPI:
         }
 
 
+# Shared by verify_sources_before_response so connections, DNS lookups and the
+# verification cache are reused across responses
+_default_verification_api: Optional[SourceVerificationAPI] = None
+
+
 # Integration function for ATLES
 async def verify_sources_before_response(response_text: str) -> Dict[str, Any]:
     """
@@ -730,8 +1047,18 @@ async def verify_sources_before_response(response_text: str) -> Dict[str, Any]:
     Returns verification results that can be used to modify the response
     or warn about unreliable sources.
     """
-    api = SourceVerificationAPI()
-    return await api.verify_and_check_sources(response_text)
+    global _default_verification_api
+    if _default_verification_api is None:
+        _default_verification_api = SourceVerificationAPI()
+    return await _default_verification_api.verify_and_check_sources(response_text)
+
+
+async def shutdown_source_verification():
+    """Close the shared verification API; the next verification starts a new one."""
+    global _default_verification_api
+    api, _default_verification_api = _default_verification_api, None
+    if api is not None:
+        await api.close()
 
 
 # Test function
@@ -771,6 +1098,8 @@ async def test_source_verification():
         print(f"❌ Test failed: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await api.close()
 
 
 if __name__ == "__main__":
@@ -13,6 +13,10 @@ import logging
 import json
 import inspect
 import hashlib
+import functools
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Callable, Type, get_type_hints
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -87,15 +91,19 @@ class ToolValidator:
     def __init__(self):
         self.safety_rules: Dict[str, Callable] = {}
         self.parameter_validators: Dict[str, Callable] = {}
+        # Incremented whenever rules change, invalidating cached tool results
+        self.revision = 0
     
     def add_safety_rule(self, rule_name: str, rule_function: Callable):
         """Add a custom safety rule."""
         self.safety_rules[rule_name] = rule_function
+        self.revision += 1
         logger.info(f"Added safety rule: {rule_name}")
     
     def add_parameter_validator(self, type_name: str, validator: Callable):
         """Add a custom parameter validator."""
         self.parameter_validators[type_name] = validator
+        self.revision += 1
         logger.info(f"Added parameter validator for: {type_name}")
     
     def validate_parameters(self, tool_name: str, parameters: Dict[str, Any], parameter_defs: List[ToolParameter]) -> Dict[str, Any]:
@@ -224,6 +232,79 @@ class ToolValidator:
         return safety_result
 
 
+# Validator used by tools that are not attached to a registry
+DEFAULT_VALIDATOR = ToolValidator()
+
+
+class ToolResultCache:
+    """
+    Bounded LRU cache with time-to-live for results of pure tools.
+    
+    Cached results are shared between callers and must not be mutated.
+    """
+    
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = 300.0):
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    @staticmethod
+    def make_key(parameters: Dict[str, Any], revision: int = 0) -> str:
+        """Build a cache key from canonicalized parameters."""
+        canonical = json.dumps(parameters, sort_keys=True, default=repr, separators=(",", ":"))
+        return hashlib.sha256(f"{revision}:{canonical}".encode()).hexdigest()
+    
+    def get(self, key: str) -> tuple:
+        """Return ``(found, value)`` for a key, expiring stale entries."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        
+        value, stored_at = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+    
+    def put(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Remove all cached results."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, configuration and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
 class AdvancedTool:
     """Advanced tool with comprehensive capabilities."""
     
@@ -237,7 +318,11 @@ class AdvancedTool:
         parameters: Optional[List[ToolParameter]] = None,
         examples: List[Dict[str, Any]] = None,
         tags: List[str] = None,
-        version: str = "1.0.0"
+        version: str = "1.0.0",
+        validator: Optional[ToolValidator] = None,
+        cacheable: bool = False,
+        cache_size: int = 256,
+        cache_ttl: Optional[float] = 300.0
     ):
         self.name = name
         self.description = description
@@ -248,6 +333,10 @@ class AdvancedTool:
         self.examples = examples or []
         self.tags = tags or []
         self.version = version
+        self.validator = validator
+        # Pure tools may memoize results keyed on their parameters
+        self.cacheable = cacheable
+        self.result_cache = ToolResultCache(cache_size, cache_ttl) if cacheable else None
         self.usage_count = 0
         self.success_count = 0
         self.last_used: Optional[datetime] = None
@@ -299,9 +388,17 @@ class AdvancedTool:
         parameters: Dict[str, Any], 
         user_id: str, 
         session_id: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None
     ) -> ToolResult:
-        """Execute the tool with given parameters."""
+        """
+        Execute the tool with given parameters.
+        
+        Synchronous tool functions run on ``executor`` when one is given,
+        keeping the event loop free for concurrently executing tools.
+        Cacheable tools return a memoized result for parameters they have
+        already processed successfully.
+        """
         start_time = datetime.now()
         
         try:
@@ -309,8 +406,24 @@ class AdvancedTool:
             self.usage_count += 1
             self.last_used = datetime.now()
             
+            validator = self.validator or DEFAULT_VALIDATOR
+            
+            # Serve repeated calls of pure tools from the cache
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = self.result_cache.make_key(parameters, validator.revision)
+                found, cached = self.result_cache.get(cache_key)
+                if found:
+                    self.success_count += 1
+                    return ToolResult(
+                        success=True,
+                        result=cached["result"],
+                        execution_time=(datetime.now() - start_time).total_seconds(),
+                        metadata={**cached["metadata"], "cache_hit": True},
+                        tool_name=self.name
+                    )
+            
             # Validate parameters
-            validator = ToolValidator()
             validation = validator.validate_parameters(self.name, parameters, self.parameters)
             
             if not validation["valid"]:
@@ -336,6 +449,10 @@ class AdvancedTool:
             # Execute function
             if asyncio.iscoroutinefunction(self.function):
                 result = await self.function(**validation["validated_parameters"])
+            elif executor is not None:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    executor, functools.partial(self.function, **validation["validated_parameters"])
+                )
             else:
                 result = self.function(**validation["validated_parameters"])
             
@@ -345,17 +462,22 @@ class AdvancedTool:
             # Update success statistics
             self.success_count += 1
             
+            metadata = {
+                "tool_id": self.tool_id,
+                "category": self.category.value,
+                "safety_level": self.safety_level.value,
+                "parameters_used": validation["validated_parameters"],
+                "warnings": safety_check["warnings"]
+            }
+            if cache_key is not None:
+                self.result_cache.put(cache_key, {"result": result, "metadata": metadata})
+                metadata = {**metadata, "cache_hit": False}
+            
             return ToolResult(
                 success=True,
                 result=result,
                 execution_time=execution_time,
-                metadata={
-                    "tool_id": self.tool_id,
-                    "category": self.category.value,
-                    "safety_level": self.safety_level.value,
-                    "parameters_used": validation["validated_parameters"],
-                    "warnings": safety_check["warnings"]
-                },
+                metadata=metadata,
                 tool_name=self.name
             )
             
@@ -404,10 +526,16 @@ class AdvancedTool:
                 "successful_executions": self.success_count,
                 "success_rate": self.success_count / max(self.usage_count, 1),
                 "last_used": self.last_used.isoformat() if self.last_used else None
-            }
+            },
+            "cacheable": self.cacheable,
+            "cache_stats": self.result_cache.get_stats() if self.result_cache else None
         }
 
 
+# Context keys written by a chain step, e.g. "step_<step_id>_result"
+STEP_REFERENCE_PATTERN = re.compile(r"step_([\w-]+?)_(?:result|metadata)\b")
+
+
 class ToolChain:
     """Chain multiple tools together for complex operations."""
     
@@ -419,8 +547,15 @@ class ToolChain:
         self.conditional_logic: Dict[str, Any] = {}
         self.error_handling: Dict[str, Any] = {}
         
-    def add_step(self, tool_name: str, parameters: Dict[str, Any], step_name: str = None) -> str:
-        """Add a step to the tool chain."""
+    def add_step(self, tool_name: str, parameters: Dict[str, Any], step_name: str = None,
+                 depends_on: Optional[List[str]] = None) -> str:
+        """
+        Add a step to the tool chain.
+        
+        ``depends_on`` declares step IDs that must finish before this step in
+        parallel execution, in addition to dependencies inferred from
+        ``step_<id>_result`` references.
+        """
         step_id = str(uuid.uuid4())
         step = {
             "step_id": step_id,
@@ -429,15 +564,17 @@ class ToolChain:
             "parameters": parameters,
             "order": len(self.steps),
             "conditional": None,
-            "error_handling": None
+            "error_handling": None,
+            "depends_on": list(depends_on or [])
         }
         
         self.steps.append(step)
         return step_id
     
-    def add_conditional_step(self, tool_name: str, parameters: Dict[str, Any], condition: str, step_name: str = None) -> str:
+    def add_conditional_step(self, tool_name: str, parameters: Dict[str, Any], condition: str, step_name: str = None,
+                             depends_on: Optional[List[str]] = None) -> str:
         """Add a conditional step to the tool chain."""
-        step_id = self.add_step(tool_name, parameters, step_name)
+        step_id = self.add_step(tool_name, parameters, step_name, depends_on)
         
         # Find the step and add conditional logic
         for step in self.steps:
@@ -458,111 +595,263 @@ class ToolChain:
                 }
                 break
     
+    def get_dependencies(self) -> Dict[str, List[str]]:
+        """
+        Get the step IDs each step must wait for.
+        
+        Dependencies are declared with ``depends_on`` or inferred from
+        ``step_<id>_result``/``step_<id>_metadata`` references in conditions
+        and parameters. Fallbacks may merge arbitrary keys into the context,
+        so a condition that reads any other context key also waits for every
+        earlier step with error handling. Only earlier steps can be
+        dependencies, which keeps the graph acyclic.
+        """
+        dependencies = {}
+        earlier: List[Dict[str, Any]] = []
+        
+        for step in self.steps:
+            earlier_ids = {s["step_id"] for s in earlier}
+            depends = {dep for dep in step.get("depends_on", []) if dep in earlier_ids}
+            
+            references = self._find_step_references(step["parameters"])
+            if step["conditional"]:
+                condition_refs = self._find_step_references(step["conditional"])
+                references |= condition_refs
+                if not condition_refs:
+                    depends |= {s["step_id"] for s in earlier if s["error_handling"]}
+            depends |= references & earlier_ids
+            
+            dependencies[step["step_id"]] = [s["step_id"] for s in earlier if s["step_id"] in depends]
+            earlier.append(step)
+        
+        return dependencies
+    
+    def _find_step_references(self, value: Any) -> set:
+        """Collect step IDs referenced by context keys inside a value."""
+        if isinstance(value, str):
+            return set(STEP_REFERENCE_PATTERN.findall(value))
+        if isinstance(value, dict):
+            found = set()
+            for key, item in value.items():
+                found |= self._find_step_references(key) | self._find_step_references(item)
+            return found
+        if isinstance(value, (list, tuple, set)):
+            found = set()
+            for item in value:
+                found |= self._find_step_references(item)
+            return found
+        return set()
+    
     async def execute(
         self, 
         tool_registry: 'AdvancedToolRegistry',
         initial_context: Dict[str, Any],
         user_id: str,
-        session_id: str
+        session_id: str,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Execute the tool chain."""
+        """
+        Execute the tool chain.
+        
+        With ``parallel=True`` steps run as a dependency graph: independent
+        steps execute concurrently and synchronous tools run on a thread
+        pool of ``max_workers`` threads, so the chain finishes in
+        critical-path time. Step records, errors and the final context are
+        reported in step order, matching sequential execution.
+        """
         chain_result = {
             "chain_id": self.chain_id,
             "success": True,
             "steps_executed": [],
             "final_result": None,
             "execution_time": 0.0,
-            "errors": []
+            "errors": [],
+            "execution_mode": "parallel" if parallel else "sequential"
         }
         
         start_time = datetime.now()
-        current_context = initial_context.copy()
         
+        if parallel:
+            current_context = await self._execute_parallel(
+                chain_result, tool_registry, initial_context, user_id, session_id, max_workers
+            )
+        else:
+            current_context = initial_context.copy()
+            for step in self.steps:
+                outcome = await self._execute_step(step, tool_registry, current_context, user_id, session_id)
+                chain_result["steps_executed"].extend(outcome["records"])
+                chain_result["errors"].extend(outcome["errors"])
+                current_context.update(outcome["updates"])
+                if outcome["fatal"]:
+                    chain_result["success"] = False
+                    break
+        
+        # Calculate total execution time
+        chain_result["execution_time"] = (datetime.now() - start_time).total_seconds()
+        chain_result["final_result"] = current_context
+        
+        return chain_result
+    
+    async def _execute_parallel(
+        self,
+        chain_result: Dict[str, Any],
+        tool_registry: 'AdvancedToolRegistry',
+        initial_context: Dict[str, Any],
+        user_id: str,
+        session_id: str,
+        max_workers: Optional[int]
+    ) -> Dict[str, Any]:
+        """Execute steps as a dependency graph and merge outcomes in step order."""
+        dependencies = self.get_dependencies()
+        ancestors: Dict[str, set] = {}
         for step in self.steps:
-            try:
-                # Check conditional execution
-                if step["conditional"] and not self._evaluate_condition(step["conditional"], current_context):
-                    chain_result["steps_executed"].append({
-                        "step_id": step["step_id"],
-                        "step_name": step["step_name"],
-                        "status": "skipped",
-                        "reason": "Condition not met"
-                    })
-                    continue
+            step_ancestors = set(dependencies[step["step_id"]])
+            for dep in dependencies[step["step_id"]]:
+                step_ancestors |= ancestors[dep]
+            ancestors[step["step_id"]] = step_ancestors
+        
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        pending = list(self.steps)
+        running: Dict[asyncio.Future, Dict[str, Any]] = {}
+        cancelled: List[asyncio.Future] = []
+        failed_order: Optional[int] = None
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"toolchain-{self.chain_id}")
+        
+        try:
+            while pending or running:
+                # Steps after a fatal failure never run, as in sequential execution
+                if failed_order is not None:
+                    pending = [step for step in pending if step["order"] < failed_order]
+                    for task, step in list(running.items()):
+                        if step["order"] > failed_order:
+                            task.cancel()
+                            cancelled.append(task)
+                            del running[task]
                 
-                # Execute the step
-                tool = tool_registry.get_tool(step["tool_name"])
-                if not tool:
-                    error_msg = f"Tool '{step['tool_name']}' not found"
-                    chain_result["errors"].append(error_msg)
+                for step in list(pending):
+                    if not all(dep in outcomes for dep in dependencies[step["step_id"]]):
+                        continue
+                    pending.remove(step)
                     
-                    # Try error handling
-                    if step["error_handling"]:
-                        fallback_result = await self._execute_fallback(
-                            step["error_handling"], tool_registry, current_context, user_id, session_id
-                        )
-                        if fallback_result["success"]:
-                            current_context.update(fallback_result["result"])
-                            chain_result["steps_executed"].append({
-                                "step_id": step["step_id"],
-                                "step_name": step["step_name"],
-                                "status": "fallback_executed",
-                                "fallback_result": fallback_result
-                            })
-                            continue
+                    # Each step sees the initial context plus its ancestors' updates
+                    step_context = initial_context.copy()
+                    for ancestor in self.steps:
+                        if ancestor["step_id"] in ancestors[step["step_id"]]:
+                            step_context.update(outcomes[ancestor["step_id"]]["updates"])
                     
-                    chain_result["success"] = False
+                    task = asyncio.ensure_future(self._execute_step(
+                        step, tool_registry, step_context, user_id, session_id, executor
+                    ))
+                    running[task] = step
+                
+                if not running:
                     break
                 
-                # Execute tool
-                tool_result = await tool.execute(step["parameters"], user_id, session_id, current_context)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    outcome = task.result()
+                    outcomes[step["step_id"]] = outcome
+                    if outcome["fatal"] and (failed_order is None or step["order"] < failed_order):
+                        failed_order = step["order"]
+        finally:
+            for task in running:
+                task.cancel()
+            cancelled.extend(running)
+            if cancelled:
+                await asyncio.gather(*cancelled, return_exceptions=True)
+            executor.shutdown(wait=False)
+        
+        current_context = initial_context.copy()
+        for step in self.steps:
+            outcome = outcomes.get(step["step_id"])
+            if outcome is None or (failed_order is not None and step["order"] > failed_order):
+                continue
+            chain_result["steps_executed"].extend(outcome["records"])
+            chain_result["errors"].extend(outcome["errors"])
+            current_context.update(outcome["updates"])
+        
+        if failed_order is not None:
+            chain_result["success"] = False
+        
+        return current_context
+    
+    async def _execute_step(
+        self,
+        step: Dict[str, Any],
+        tool_registry: 'AdvancedToolRegistry',
+        context: Dict[str, Any],
+        user_id: str,
+        session_id: str,
+        executor: Optional[Executor] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a single step, including its condition and fallback.
+        
+        Returns the step records, errors, context updates and whether the
+        failure is fatal for the chain.
+        """
+        outcome = {"records": [], "errors": [], "updates": {}, "fatal": False}
+        
+        try:
+            # Check conditional execution
+            if step["conditional"] and not self._evaluate_condition(step["conditional"], context):
+                outcome["records"].append({
+                    "step_id": step["step_id"],
+                    "step_name": step["step_name"],
+                    "status": "skipped",
+                    "reason": "Condition not met"
+                })
+                return outcome
+            
+            # Execute the step
+            tool = tool_registry.get_tool(step["tool_name"])
+            if not tool:
+                outcome["errors"].append(f"Tool '{step['tool_name']}' not found")
+            else:
+                tool_result = await tool.execute(step["parameters"], user_id, session_id, context, executor)
                 
                 if tool_result.success:
                     # Update context with result
-                    current_context[f"step_{step['step_id']}_result"] = tool_result.result
-                    current_context[f"step_{step['step_id']}_metadata"] = tool_result.metadata
+                    outcome["updates"][f"step_{step['step_id']}_result"] = tool_result.result
+                    outcome["updates"][f"step_{step['step_id']}_metadata"] = tool_result.metadata
                     
-                    chain_result["steps_executed"].append({
+                    outcome["records"].append({
                         "step_id": step["step_id"],
                         "step_name": step["step_name"],
                         "status": "success",
                         "result": tool_result.result,
                         "execution_time": tool_result.execution_time
                     })
-                else:
-                    # Handle tool execution failure
-                    error_msg = f"Step '{step['step_name']}' failed: {tool_result.error_message}"
-                    chain_result["errors"].append(error_msg)
-                    
-                    # Try error handling
-                    if step["error_handling"]:
-                        fallback_result = await self._execute_fallback(
-                            step["error_handling"], tool_registry, current_context, user_id, session_id
-                        )
-                        if fallback_result["success"]:
-                            current_context.update(fallback_result["result"])
-                            chain_result["steps_executed"].append({
-                                "step_id": step["step_id"],
-                                "step_name": step["step_name"],
-                                "status": "fallback_executed",
-                                "fallback_result": fallback_result
-                            })
-                            continue
-                    
-                    chain_result["success"] = False
-                    break
+                    return outcome
                 
-            except Exception as e:
-                error_msg = f"Unexpected error in step '{step['step_name']}': {e}"
-                chain_result["errors"].append(error_msg)
-                chain_result["success"] = False
-                break
-        
-        # Calculate total execution time
-        chain_result["execution_time"] = (datetime.now() - start_time).total_seconds()
-        chain_result["final_result"] = current_context
+                # Handle tool execution failure
+                outcome["errors"].append(f"Step '{step['step_name']}' failed: {tool_result.error_message}")
+            
+            # Try error handling
+            if step["error_handling"]:
+                fallback_result = await self._execute_fallback(
+                    step["error_handling"], tool_registry, context, user_id, session_id, executor
+                )
+                if fallback_result["success"]:
+                    outcome["updates"] = dict(fallback_result["result"])
+                    outcome["records"].append({
+                        "step_id": step["step_id"],
+                        "step_name": step["step_name"],
+                        "status": "fallback_executed",
+                        "fallback_result": fallback_result
+                    })
+                    return outcome
+            
+            outcome["fatal"] = True
+            
+        except Exception as e:
+            outcome["errors"].append(f"Unexpected error in step '{step['step_name']}': {e}")
+            outcome["updates"] = {}
+            outcome["fatal"] = True
         
-        return chain_result
+        return outcome
     
     def _evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
         """Evaluate a conditional expression."""
@@ -590,7 +879,8 @@ class ToolChain:
         tool_registry: 'AdvancedToolRegistry',
         context: Dict[str, Any],
         user_id: str,
-        session_id: str
+        session_id: str,
+        executor: Optional[Executor] = None
     ) -> Dict[str, Any]:
         """Execute fallback tool for error handling."""
         try:
@@ -600,7 +890,8 @@ class ToolChain:
                     error_handling["fallback_parameters"], 
                     user_id, 
                     session_id, 
-                    context
+                    context,
+                    executor
                 )
                 return {
                     "success": result.success,
@@ -636,6 +927,7 @@ class AdvancedToolRegistry:
                 function=self._text_analyzer,
                 category=ToolCategory.DATA_PROCESSING,
                 safety_level=SafetyLevel.SAFE,
+                cacheable=True,
                 examples=[
                     {"text": "I love this product!", "analysis_type": "sentiment"},
                     {"text": "Python programming language", "analysis_type": "topics"}
@@ -647,6 +939,7 @@ class AdvancedToolRegistry:
                 function=self._text_summarizer,
                 category=ToolCategory.DATA_PROCESSING,
                 safety_level=SafetyLevel.SAFE,
+                cacheable=True,
                 parameters=[
                     ToolParameter("text", str, "Text to summarize", True),
                     ToolParameter("max_length", int, "Maximum summary length", False, 100),
@@ -660,6 +953,8 @@ class AdvancedToolRegistry:
     
     def register_tool(self, tool: AdvancedTool):
         """Register a new tool."""
+        if tool.validator is None:
+            tool.validator = self.validator
         self.tools[tool.name] = tool
         
         # Add to categories
@@ -1206,7 +1501,8 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Generate code using predefined templates",
         function=code_gen_tools.generate_code_template,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(generate_code_tool)
     
@@ -1217,7 +1513,8 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Analyze code complexity metrics",
         function=code_analysis_tools.analyze_code_complexity,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(analyze_complexity_tool)
     
@@ -1226,7 +1523,8 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Detect common code smells and anti-patterns",
         function=code_analysis_tools.detect_code_smells,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(detect_smells_tool)
     
@@ -1237,7 +1535,8 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Analyze error messages and provide debugging guidance",
         function=debugging_tools.analyze_error_message,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(analyze_error_tool)
     
@@ -1248,7 +1547,8 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Analyze code for performance optimization opportunities",
         function=optimization_tools.analyze_performance_patterns,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(analyze_performance_tool)
     
@@ -1257,6 +1557,7 @@ def register_ai_tools(tool_registry: AdvancedToolRegistry):
         description="Generate specific optimization suggestions",
         function=optimization_tools.suggest_optimizations,
         category=ToolCategory.AI_MODELS,
-        safety_level=SafetyLevel.SAFE
+        safety_level=SafetyLevel.SAFE,
+        cacheable=True
     )
     tool_registry.register_tool(suggest_optimizations_tool)
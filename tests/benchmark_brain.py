@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ATLESBrain construction and modification cost
+
+Measures construction time and allocated memory for ATLESBrain in default
+and shared-component mode, and for the full R-Zero system (main, challenger
+and solver brains). Also measures sequential self-modifications, where each
+modification creates a rollback point.
+
+Usage:
+    python tests/benchmark_brain.py [iterations] [modifications]
+"""
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.brain.atles_brain import ATLESBrain, ModificationType
+from atles.brain.r_zero_integration import MetacognitiveATLES_RZero
+
+
+def measure(label, factory, iterations):
+    """Construct ``iterations`` objects and report time and memory per object."""
+    instances = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(iterations):
+        instances.append(factory(i))
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"{label:<32} {elapsed / iterations * 1000:8.3f} ms/obj  {current / iterations / 1024:8.1f} KiB/obj")
+    return elapsed, current
+
+
+def benchmark_brain_construction(iterations: int = 200):
+    print(f"ATLESBrain construction ({iterations} iterations)")
+    print("-" * 64)
+    measure("ATLESBrain (default)", lambda i: ATLESBrain(user_id=f"bench_{i}"), iterations)
+    measure("ATLESBrain (shared_components)",
+            lambda i: ATLESBrain(user_id=f"bench_{i}", shared_components=True), iterations)
+    measure("MetacognitiveATLES_RZero",
+            lambda i: MetacognitiveATLES_RZero(user_id=f"bench_{i}"), max(1, iterations // 10))
+
+
+
+def benchmark_modifications(modifications: int = 10000):
+    print(f"\nSequential modifications ({modifications} requests)")
+    print("-" * 64)
+    brain = ATLESBrain(user_id="bench_modifications")
+    
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    for i in range(modifications):
+        brain.request_modification(
+            ModificationType.BEHAVIOR_PREFERENCE,
+            {"preference_name": f"pref_{i % 100}", "preference_value": i},
+            "benchmark"
+        )
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    rollback_memory = sum(
+        sys.getsizeof(point["previous_state"]) for point in brain.rollback_points
+    )
+    print(f"{'request_modification':<32} {elapsed / modifications * 1000:8.3f} ms/op")
+    print(f"{'retained memory (all state)':<32} {(current - baseline) / 1024:8.1f} KiB")
+    print(f"{'rollback points retained':<32} {len(brain.rollback_points):8d}  "
+          f"({rollback_memory / 1024:.1f} KiB of state dicts)")
+    return elapsed, current - baseline
+
+
+if __name__ == "__main__":
+    # Construction logs at INFO; keep them out of the measurement
+    logging.disable(logging.INFO)
+    
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    modifications = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    benchmark_brain_construction(iterations)
+    benchmark_modifications(modifications)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CodeValidationAPI backends
+
+Validates a generated multi-thousand-line module with the 'thread' and
+'process' backends, once on its own and as a batch of concurrent requests,
+and reports wall-clock time and the worst event loop stall observed while
+validation was running. The result cache is disabled for these runs; a
+final run re-validates unchanged code with the cache enabled.
+
+Usage:
+    python tests/benchmark_code_validation.py [functions] [concurrent]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.code_security import CodeValidationAPI, shutdown_analysis_pools
+
+
+def generate_module(functions: int) -> str:
+    """A module of small, independent functions (about 12 lines each)."""
+    parts = ['"""Generated benchmark module."""\n']
+    for i in range(functions):
+        parts.append(f'''
+def compute_{i}(values, threshold={i % 7}):
+    """Sum values above a threshold."""
+    total = 0
+    for value in values:
+        if value > threshold and value % 2 == 0:
+            total += value
+        elif value < 0:
+            total -= value
+    return total
+
+''')
+    return ''.join(parts)
+
+
+async def measure(api: CodeValidationAPI, code: str, concurrent: int):
+    """Validate ``concurrent`` copies at once; return elapsed time and worst loop stall."""
+    stall = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal stall
+        while running:
+            before = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - before - 0.01)
+
+    tick_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        api.validate_code(code, f"bench_{i}.py") for i in range(concurrent)
+    ])
+    elapsed = time.perf_counter() - start
+    running = False
+    await tick_task
+
+    assert all(result.validation_timestamp for result in results)
+    return elapsed, stall
+
+
+async def benchmark_backends(functions: int = 250, concurrent: int = 4):
+    code = generate_module(functions)
+    print(f"Validating {code.count(chr(10))} lines ({functions} functions)")
+    print("-" * 64)
+
+    for backend in CodeValidationAPI.BACKENDS:
+        api = CodeValidationAPI(backend=backend, cache_size=0)
+        await api.validate_code(generate_module(1), "warmup.py")  # start workers
+
+        for label, count in (("single", 1), (f"{concurrent} concurrent", concurrent)):
+            elapsed, stall = await measure(api, code, count)
+            print(f"{backend + ' / ' + label:<28} {elapsed:8.2f} s  worst loop stall {stall * 1000:8.1f} ms")
+
+    api = CodeValidationAPI()
+    await api.validate_code(code, "bench_0.py")
+    elapsed, stall = await measure(api, code, 1)
+    print(f"{'cached re-validation':<28} {elapsed:8.2f} s  worst loop stall {stall * 1000:8.1f} ms")
+
+    shutdown_analysis_pools()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    concurrent = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    asyncio.run(benchmark_backends(functions, concurrent))
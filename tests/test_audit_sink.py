@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test Audit Sink: Persistent Audit Trail for ATLES Brain
+
+This test suite validates the rotating JSONL audit sink, the bounded
+in-memory audit tail and time-range paging through the persisted trail.
+"""
+
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.brain.atles_brain import ATLESBrain, ModificationType
+from atles.brain.audit_sink import AuditLogBuffer, AuditLogSink
+
+
+class TestAuditLogSink(unittest.TestCase):
+    """Test the rotating JSONL sink."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.start = datetime(2025, 1, 1, 12, 0, 0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _entries(self, count):
+        return [
+            {"timestamp": self.start + timedelta(seconds=i), "operation": "test", "index": i}
+            for i in range(count)
+        ]
+
+    def test_rotation_compression_and_time_range_paging(self):
+        """Segments rotate and compress, and time ranges page across them."""
+        sink = AuditLogSink(self.directory, max_segment_bytes=4096, compress=True, batch_size=16)
+        for entry in self._entries(600):
+            sink.write(entry)
+        sink.close()
+
+        files = sorted(os.listdir(self.directory))
+        segments = [name for name in files if name.endswith(".jsonl.gz")]
+        self.assertGreater(len(segments), 1)
+        self.assertNotIn(".jsonl", [os.path.splitext(name)[1] for name in files])
+        with gzip.open(os.path.join(self.directory, segments[0]), "rt") as f:
+            self.assertIn('"index": 0', f.readline())
+
+        start = self.start + timedelta(seconds=300)
+        end = self.start + timedelta(seconds=349)
+        first_page = sink.read(start, end, limit=30)
+        second_page = sink.read(start, end, limit=30, offset=30)
+
+        self.assertEqual([e["index"] for e in first_page], list(range(300, 330)))
+        self.assertEqual([e["index"] for e in second_page], list(range(330, 350)))
+
+    def test_index_survives_restart_and_prunes_segments(self):
+        """A reopened sink reads the earlier trail and keeps at most max_segments."""
+        sink = AuditLogSink(self.directory, max_segment_bytes=2048, max_segments=3)
+        for entry in self._entries(200):
+            sink.write(entry)
+        sink.close()
+
+        reopened = AuditLogSink(self.directory, max_segment_bytes=2048, max_segments=3)
+        reopened.write({"timestamp": self.start + timedelta(seconds=500), "operation": "restart", "index": 500})
+        reopened.flush()
+
+        status = reopened.get_status()
+        stored = reopened.read(limit=None)
+        reopened.close()
+
+        self.assertLessEqual(status["segments"], 3)
+        self.assertEqual(stored[-1]["operation"], "restart")
+        self.assertEqual([e["index"] for e in stored[:-1]], sorted(e["index"] for e in stored[:-1]))
+
+    def test_buffer_keeps_bounded_tail(self):
+        """The in-memory buffer keeps only the most recent records."""
+        buffer = AuditLogBuffer(maxlen=10)
+        buffer.extend(self._entries(25))
+
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(buffer.total_entries, 25)
+        self.assertEqual([e["index"] for e in buffer.tail(3)], [22, 23, 24])
+        self.assertEqual(
+            [e["index"] for e in buffer.between(self.start + timedelta(seconds=20), limit=2, offset=1)],
+            [21, 22]
+        )
+
+    def test_entries_are_snapshotted_and_writes_after_close_dropped(self):
+        """Mutating an entry after write() does not change what is stored."""
+        sink = AuditLogSink(self.directory, flush_interval=0.05)
+        entry = {"timestamp": self.start, "operation": "test", "data": {"value": 1}}
+        sink.write(entry)
+        entry["data"]["value"] = 2
+        sink.close()
+
+        sink.write({"timestamp": self.start, "operation": "late"})
+
+        self.assertEqual([e["data"]["value"] for e in sink.read(limit=None)], [1])
+        self.assertEqual(sink.get_status()["dropped_records"], 1)
+
+
+class TestBrainAuditTrail(unittest.TestCase):
+    """Test the ATLESBrain audit trail integration."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_audit_log_streams_to_disk_with_bounded_tail(self):
+        """Audit entries beyond the in-memory tail stay available on disk."""
+        brain = ATLESBrain(user_id="audit_user", audit_log_dir=self.directory, audit_tail_size=5)
+        started = datetime.now()
+
+        for i in range(20):
+            brain.request_modification(
+                ModificationType.BEHAVIOR_PREFERENCE,
+                {"preference_name": f"pref_{i}", "preference_value": i},
+                "audit test"
+            )
+
+        self.assertEqual(len(brain.audit_log), 5)
+        self.assertEqual(len(brain.modification_history), 5)
+        self.assertEqual(len(brain.get_audit_log(limit=3)), 3)
+
+        persisted = brain.get_audit_log(limit=0, start=started)
+        self.assertEqual(len(persisted), brain.audit_log.total_entries)
+        self.assertEqual(persisted[0]["operation"], "modification_attempt")
+        self.assertEqual(brain.get_safety_status()["modification_history_count"], 20)
+
+        brain.close_audit_log()
+
+    def test_brain_keeps_working_after_audit_log_is_closed(self):
+        """Closing the trail detaches it; later entries stay in the tail."""
+        brain = ATLESBrain(user_id="audit_user", audit_log_dir=self.directory)
+        brain.close_audit_log()
+
+        result = brain.emergency_shutdown("test")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(brain.audit_log[-1]["operation"], "emergency_shutdown")
+        self.assertEqual(brain.audit_sink.get_status()["dropped_records"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test Code Sandbox: Warm Execution Workers
+
+This test suite validates that snippets run in sandbox worker processes,
+that timeouts and crashes are contained and the workers replaced, and that
+import checks never import modules into the host interpreter.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.code_sandbox import SandboxPool, shutdown_sandbox_pools
+from atles.code_security import FunctionalityTester
+
+
+class TestSandboxPool(unittest.TestCase):
+    """Test the sandbox worker pool."""
+
+    def setUp(self):
+        self.pool = SandboxPool(size=1, timeout=1.0, memory_bytes=50 * 1024 * 1024)
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_snippets_run_with_restricted_builtins(self):
+        """Safe builtins work, anything else is a runtime error."""
+        result = self.pool.run("total = sum(range(10))\nassert len([total]) == 1")
+        self.assertTrue(result["execution_safe"])
+        self.assertTrue(result["imports_valid"])
+
+        result = self.pool.run("open('/etc/passwd')")
+        self.assertFalse(result["execution_safe"])
+        self.assertIn("open", result["runtime_errors"][0])
+
+    def test_timeout_recycles_worker(self):
+        """A looping snippet times out and the next snippet gets a fresh worker."""
+        start = time.perf_counter()
+        result = self.pool.run("while True:\n    pass")
+        self.assertLess(time.perf_counter() - start, 3.0)
+        self.assertFalse(result["execution_safe"])
+        self.assertIn("timed out", result["runtime_errors"][0])
+
+        self.assertTrue(self.pool.run("x = 1")["execution_safe"])
+        stats = self.pool.get_stats()
+        self.assertEqual((stats["timeouts"], stats["recycled"], stats["workers_started"]), (1, 1, 2))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "address space limits need /proc")
+    def test_memory_limit(self):
+        """Allocations beyond the memory budget fail inside the worker."""
+        result = self.pool.run("data = [0] * (100 * 1024 * 1024)")
+        self.assertFalse(result["execution_safe"])
+        self.assertIn("memory limit", result["runtime_errors"][0])
+        self.assertTrue(self.pool.run("data = [0] * 1000")["execution_safe"])
+
+    def test_imports_are_checked_out_of_process(self):
+        """Import checks load modules in the worker, not the host."""
+        self.assertNotIn("xml.dom.minidom", sys.modules)
+        self.assertTrue(self.pool.run("import xml.dom.minidom", execute=False)["imports_valid"])
+        self.assertFalse(self.pool.run("import not_a_real_module_xyz", execute=False)["imports_valid"])
+        self.assertFalse(self.pool.run("from json import not_a_name", execute=False)["imports_valid"])
+        self.assertNotIn("xml.dom.minidom", sys.modules)
+
+
+class TestFunctionalityTesterSandbox(unittest.TestCase):
+    """Test FunctionalityTester on top of the shared sandbox pool."""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_sandbox_pools()
+
+    def test_functionality_results(self):
+        """Results keep their shape; a hanging snippet is bounded by the timeout."""
+        tester = FunctionalityTester(sandbox_workers=1)
+        tester.timeout = 1
+
+        ok = tester.test_functionality_sync("values = sorted([3, 1, 2])")
+        self.assertTrue(ok["syntax_valid"] and ok["imports_valid"] and ok["execution_safe"])
+        self.assertIn("execution_time_seconds", ok["performance_metrics"])
+
+        hanging = tester.test_functionality_sync("while True:\n    pass")
+        self.assertFalse(hanging["execution_safe"])
+        self.assertIn("timed out", hanging["runtime_errors"][0])
+
+        broken = tester.test_functionality_sync("def f(:\n")
+        self.assertFalse(broken["syntax_valid"])
+        self.assertFalse(broken["execution_safe"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test Code Validation: Analyzer Backends, Shared Parsing and Warm Linters
+
+This test suite validates that CodeValidationAPI produces the same findings
+whether the analyzers run in worker processes or in threads, that the
+analyzers share one parse of the source, and that bandit and pylint are
+reused in memory without temporary files.
+"""
+
+import ast
+import os
+import pickle
+import re
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pylint.lint
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.code_sandbox import shutdown_sandbox_pools
+from atles.code_security import (
+    CodeQualityAnalyzer, CodeValidationAPI, FunctionalityTester, ParsedSource,
+    SecurityAnalyzer, shutdown_analysis_pools
+)
+
+
+INSECURE_CODE = '''
+import os
+user_input = input("Enter command: ")
+os.system(user_input)
+
+password = "hardcoded_secret_123"
+eval(user_input)
+'''
+
+
+class TestValidationBackends(unittest.IsolatedAsyncioTestCase):
+    """Test the process and thread analyzer backends."""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_analysis_pools()
+
+    async def test_backends_agree(self):
+        """Both backends report the same issues and scores."""
+        results = {}
+        for backend in CodeValidationAPI.BACKENDS:
+            api = CodeValidationAPI(backend=backend, max_workers=2)
+            results[backend] = await api.validate_code(INSECURE_CODE, "insecure.py")
+
+        process, thread = results["process"], results["thread"]
+        self.assertFalse(process.is_secure)
+        self.assertEqual(
+            [issue.description for issue in process.security_issues],
+            [issue.description for issue in thread.security_issues]
+        )
+        self.assertEqual(process.quality_score, thread.quality_score)
+        self.assertEqual(process.runtime_test_results["syntax_valid"], thread.runtime_test_results["syntax_valid"])
+
+    def test_unknown_backend_rejected(self):
+        """Backends other than 'process' and 'thread' are rejected."""
+        with self.assertRaises(ValueError):
+            CodeValidationAPI(backend="gpu")
+
+
+class TestParsedSource(unittest.TestCase):
+    """Test the shared parse artifact and the combined pattern scan."""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_sandbox_pools()
+
+    def test_scan_matches_per_line_search(self):
+        """The single-pass scan finds exactly what per-line searching finds."""
+        analyzer = SecurityAnalyzer()
+        code = INSECURE_CODE + 'sql = "SELECT %s" %\\\nq = "{}".format(sql)\nEVAL (x)\n\nexec(\n'
+        expected = [
+            (line_num, line, description)
+            for line_num, line in enumerate(code.split('\n'), 1)
+            for pattern, description in analyzer.dangerous_patterns
+            if re.search(pattern, line, re.IGNORECASE)
+        ]
+
+        self.assertEqual(analyzer.pattern_scanner.scan(ParsedSource(code)), expected)
+        self.assertEqual(analyzer.pattern_scanner.scan(ParsedSource("x = 1")), [])
+
+    def test_analyzers_share_one_parse(self):
+        """Security, quality and functionality checks parse the source once."""
+        source = ParsedSource("def f(x):\n    return x + 1\n")
+
+        with patch("atles.code_security.ast.parse", wraps=ast.parse) as parse:
+            SecurityAnalyzer()._analyze_ast(source)
+            quality = CodeQualityAnalyzer()
+            quality._check_syntax(source)
+            quality._check_complexity(source)
+            tester = FunctionalityTester()
+            self.assertTrue(tester._test_syntax(source))
+            self.assertTrue(tester._test_imports(source))
+
+        self.assertEqual(parse.call_count, 1)
+
+    def test_syntax_errors_and_pickling(self):
+        """Syntax errors are recorded and pickling ships only the source."""
+        source = ParsedSource("def broken(:\n    pass\n")
+        self.assertIsNone(source.tree)
+        self.assertEqual(source.syntax_error.lineno, 1)
+        self.assertFalse(FunctionalityTester()._test_syntax(source))
+
+        copy = pickle.loads(pickle.dumps(source))
+        self.assertEqual(copy.code, source.code)
+        self.assertFalse(copy._parsed)
+        self.assertEqual(copy.line_number(copy.line_offsets[1]), 2)
+        self.assertEqual(ParsedSource("x = 1\n").tokens[0].string, "x")
+
+
+class TestWarmLinters(unittest.TestCase):
+    """Test in-memory bandit and pylint runs."""
+
+    def test_linters_reuse_state_without_tempfiles(self):
+        """Pylint is built once; neither tool writes a temporary file."""
+        first = "import os\ndef run(cmd):\n    return os.system(cmd)\n"
+        second = "x = undefined_name\n"
+
+        with patch.object(tempfile, "NamedTemporaryFile", side_effect=AssertionError("tempfile used")), \
+                patch("atles.code_security.pylint.lint.Run", wraps=pylint.lint.Run) as run:
+            quality = CodeQualityAnalyzer()
+            quality._run_pylint_analysis(first, "first.py")
+            undefined = quality._run_pylint_analysis(second, "second.py")
+            again = quality._run_pylint_analysis(second, "second.py")
+            bandit_issues = SecurityAnalyzer()._run_bandit_analysis(first, "first.py")
+
+        self.assertLessEqual(run.call_count, 1)
+        self.assertEqual([issue.message for issue in undefined], [issue.message for issue in again])
+        self.assertTrue(any("undefined-variable" in issue.message for issue in undefined))
+        self.assertEqual([issue.line_number for issue in undefined], [1] * len(undefined))
+        self.assertTrue(bandit_issues)
+        self.assertIn("os.system", bandit_issues[-1].code_snippet)
+
+
+class TestValidationResultCache(unittest.IsolatedAsyncioTestCase):
+    """Test content-addressed reuse of validation results."""
+
+    async def test_unchanged_code_is_not_reanalyzed(self):
+        """A repeated request skips the analyzers; edits and config changes do not."""
+        api = CodeValidationAPI(backend="thread", history_size=3)
+        with patch.object(api, "_run_analyses", wraps=api._run_analyses) as analyses:
+            first = await api.validate_code(INSECURE_CODE, "insecure.py")
+            first.security_issues.clear()  # callers may mutate their results
+            second = await api.validate_code(INSECURE_CODE, "insecure.py")
+            await api.validate_code(INSECURE_CODE + "\nx = 1\n", "insecure.py")
+            api.quality_analyzer.line_length_threshold = 20
+            await api.validate_code(INSECURE_CODE, "insecure.py")
+
+        self.assertEqual(analyses.call_count, 3)
+        self.assertTrue(second.security_issues)
+        self.assertFalse(second.is_secure)
+        self.assertEqual([v["cache_hit"] for v in api.validation_history], [True, False, False])
+
+        summary = api.get_validation_summary()
+        self.assertEqual(summary["total_validations"], 4)
+        self.assertEqual(summary["result_cache"]["hits"], 1)
+
+    async def test_transient_failures_are_not_cached(self):
+        """Sandbox timeouts and analyzer failures are re-run on the next request."""
+        api = CodeValidationAPI(backend="thread")
+        timed_out = {"syntax_valid": True, "imports_valid": False, "execution_safe": False,
+                     "runtime_errors": ["Execution timed out after 5s"]}
+        with patch.object(api, "_run_analyses", wraps=api._run_analyses) as analyses:
+            with patch.object(api.functionality_tester, "test_functionality_sync", return_value=timed_out):
+                first = await api.validate_code("x = 1\n", "simple.py")
+            with patch("atles.code_security._lint_with_pylint", side_effect=RuntimeError("busy")):
+                linted = await api.validate_code("x = 1\n", "simple.py")
+            second = await api.validate_code("x = 1\n", "simple.py")
+            await api.validate_code("x = 1\n", "simple.py")
+
+        self.assertFalse(first.is_functional)
+        self.assertIn("Pylint analysis failed: busy", [issue.message for issue in linted.quality_issues])
+        self.assertTrue(second.is_functional)
+        self.assertEqual(analyses.call_count, 3)
+        self.assertEqual([v["cache_hit"] for v in api.validation_history], [False, False, False, True])
+
+    async def test_cache_can_be_disabled(self):
+        """cache_size=0 always runs the analyzers."""
+        api = CodeValidationAPI(backend="thread", cache_size=0)
+        with patch.object(api, "_run_analyses", wraps=api._run_analyses) as analyses:
+            for _ in range(2):
+                await api.validate_code("x = 1\n", "simple.py")
+        self.assertEqual(analyses.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -16,7 +16,11 @@ from atles.computer_vision import (
     ImageProcessor,
     ObjectDetector,
     ImageAnalyzer,
-    ComputerVisionAPI
+    ComputerVisionAPI,
+    CVResultCache,
+    ModelRegistry,
+    OCRProcessor,
+    OCRResultCache
 )
 
 
@@ -110,6 +114,19 @@ class TestImageProcessor:
         assert features["shape"] == sample_image.shape
         assert features["channels"] == 3
         assert features["size_bytes"] == sample_image.nbytes
+        assert features["brightness"] == pytest.approx(sample_image.mean())
+        assert features["contrast"] == pytest.approx(sample_image.std())
+        assert features["color_std"]["G"] == pytest.approx(sample_image[:, :, 1].std())
+    
+    def test_batch_features_match_single_images(self, processor, sample_image):
+        """Batched extraction gives the same statistics as single images, for any mix of shapes."""
+        gray = np.random.randint(0, 255, (40, 60), dtype=np.uint8)
+        batch = processor.extract_features_batch([sample_image, gray, sample_image[::2, ::2]])
+        
+        assert batch[1]["grayscale_mean"] == pytest.approx(gray.mean())
+        assert batch[1]["grayscale_std"] == pytest.approx(gray.std())
+        assert batch[2]["brightness"] == pytest.approx(sample_image[::2, ::2].mean())
+        assert batch[0]["color_mean"] == processor.extract_features_batch([sample_image])[0]["color_mean"]
 
 
 class TestObjectDetector:
@@ -165,6 +182,49 @@ class TestObjectDetector:
         assert annotated_image.dtype == sample_image.dtype
 
 
+class TestModelRegistry:
+    """Test the process-wide model registry."""
+    
+    def test_model_loaded_once(self):
+        """Repeated lookups reuse the resident model."""
+        registry = ModelRegistry()
+        loads = []
+        loader = lambda: loads.append(1) or ("processor", "model")
+        
+        for _ in range(5):
+            assert registry.get("resnet", loader) == ("processor", "model")
+        
+        assert len(loads) == 1
+        stats = registry.get_stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] == 4
+    
+    def test_lru_and_idle_eviction(self):
+        """Least recently used and idle models are evicted."""
+        registry = ModelRegistry(max_models=2, idle_timeout=None)
+        for model_id in ["a", "b", "a", "c"]:
+            registry.get(model_id, lambda: model_id)
+        assert registry.get_stats()["resident_models"] == ["a", "c"]
+        
+        registry.idle_timeout = 0.0
+        assert registry.evict_idle() == 2
+        assert registry.peek("a") is None
+        assert registry.get_stats()["evictions"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_detectors_share_resident_model(self):
+        """Detectors resolve their model through the registry."""
+        registry = ModelRegistry()
+        registry.get(ObjectDetector.DEFAULT_MODEL_ID, lambda: ("processor", "model"))
+        first = ObjectDetector(registry=registry)
+        second = ObjectDetector(registry=registry)
+        
+        assert await first.load_model()
+        assert await second.load_model()
+        assert first.model is second.model == "model"
+        assert registry.get_stats()["loads"] == 1
+
+
 class TestImageAnalyzer:
     """Test the ImageAnalyzer class."""
     
@@ -200,6 +260,46 @@ class TestImageAnalyzer:
         assert "edge_density" in edge_analysis
         assert "edge_distribution" in edge_analysis
     
+    def test_composition_matches_reference_at_full_resolution(self, sample_image):
+        """Summed-area statistics match direct computation on the full image."""
+        import cv2
+        analyzer = ImageAnalyzer(analysis_max_side=None)
+        composition = analyzer.compute_composition(sample_image)
+        
+        third = 100 // 3
+        center = sample_image[third:2 * third, third:2 * third]
+        edges = sample_image.copy()
+        edges[third:2 * third, third:2 * third] = 0
+        hsv = cv2.cvtColor(sample_image, cv2.COLOR_RGB2HSV)
+        canny = cv2.Canny(cv2.cvtColor(sample_image, cv2.COLOR_RGB2GRAY), 50, 150)
+        
+        assert composition["rule_of_thirds"]["center_region_variance"] == pytest.approx(np.var(center))
+        assert composition["rule_of_thirds"]["edge_regions_variance"] == pytest.approx(np.var(edges))
+        assert composition["color_harmony"]["hue_variance"] == pytest.approx(np.var(hsv[:, :, 0]))
+        assert composition["edge_analysis"]["edge_distribution"] == pytest.approx(np.std(canny))
+    
+    def test_large_images_use_downscaled_working_copy(self):
+        """Large images are analyzed on a copy bounded by analysis_max_side."""
+        analyzer = ImageAnalyzer(analysis_max_side=256)
+        image = np.random.randint(0, 255, (2160, 3840, 3), dtype=np.uint8)
+        
+        assert max(analyzer._working_copy(image).shape[:2]) == 256
+        assert set(analyzer.compute_composition(image)) == {"rule_of_thirds", "color_harmony", "edge_analysis"}
+    
+    @pytest.mark.asyncio
+    async def test_analyze_reuses_precomputed_results(self, analyzer, sample_image):
+        """Decoded images and detections passed in are not recomputed."""
+        async def fail(*args, **kwargs):
+            raise AssertionError("should not be called")
+        analyzer.processor.load_image = fail
+        analyzer.detector.detect_objects = fail
+        detections = {"total_objects": 0, "detections": []}
+        
+        result = await analyzer.analyze_image("sample.png", image=sample_image, detections=detections)
+        
+        assert "error" not in result
+        assert result["object_detection"] is detections
+    
     @pytest.mark.asyncio
     async def test_generate_summary(self, analyzer):
         """Test summary generation."""
@@ -217,13 +317,148 @@ class TestImageAnalyzer:
         assert "2 objects" in summary  # Should mention object count
 
 
+class TestOCRProcessor:
+    """Test OCR text reconstruction and result caching."""
+    
+    @pytest.fixture
+    def tesseract_data(self):
+        """Word-level output in the shape returned by image_to_data."""
+        return {
+            'text': ['', 'Hello', 'world', 'again', '', 'Next'],
+            'conf': ['-1', '95', '91.5', '88', '-1', '90'],
+            'block_num': [1, 1, 1, 1, 2, 2],
+            'par_num': [1, 1, 1, 1, 1, 1],
+            'line_num': [1, 1, 1, 2, 1, 1],
+            'left': [0, 1, 2, 3, 4, 5],
+            'top': [0, 1, 2, 3, 4, 5],
+            'width': [9, 9, 9, 9, 9, 9],
+            'height': [9, 9, 9, 9, 9, 9]
+        }
+    
+    def test_text_from_tesseract_data(self, tesseract_data):
+        """Lines and blocks are rebuilt from word data."""
+        text = OCRProcessor._text_from_tesseract_data(tesseract_data)
+        assert text == "Hello world\nagain\n\nNext"
+    
+    def test_cache_keys_follow_content(self, tmp_path):
+        """Identical pixels share a key; engine settings change it."""
+        image = np.random.randint(0, 255, (20, 20, 3), dtype=np.uint8)
+        cache = OCRResultCache(tmp_path)
+        
+        key = cache.make_key(cache.content_hash(image), 'easyocr', ['en'])
+        assert key == cache.make_key(cache.content_hash(image.copy()), 'easyocr', ['en'])
+        assert key != cache.make_key(cache.content_hash(image), 'easyocr', ['fr'])
+        
+        assert cache.get(key) is None
+        cache.put(key, {'extracted_text': 'cached'})
+        assert cache.get(key) == {'extracted_text': 'cached'}
+        assert cache.get_stats()["entries"] == 1
+    
+    def test_cache_is_pruned(self, tmp_path):
+        """Entries beyond max_entries are removed."""
+        cache = OCRResultCache(tmp_path, max_entries=5)
+        for i in range(12):
+            cache.put(cache.make_key(str(i), 'tesseract', ['eng']), {'i': i})
+        
+        assert cache.get_stats()["entries"] <= 5
+    
+    @pytest.mark.asyncio
+    async def test_tesseract_single_pass_and_cache(self, tmp_path, tesseract_data, monkeypatch):
+        """Tesseract runs one OCR pass, and repeated images are served from cache."""
+        pytesseract = pytest.importorskip("pytesseract")
+        calls = []
+        monkeypatch.setattr(pytesseract, "image_to_data", lambda *a, **k: calls.append(1) or tesseract_data)
+        monkeypatch.setattr(pytesseract, "image_to_string", lambda *a, **k: pytest.fail("second OCR pass"))
+        
+        ocr = OCRProcessor(cache_dir=tmp_path)
+        ocr.ocr_available = True
+        image = np.zeros((20, 20, 3), dtype=np.uint8)
+        
+        first = await ocr.extract_text_tesseract(image)
+        second = await ocr.extract_text_tesseract(image.copy())
+        
+        assert first.success and second.success
+        assert len(calls) == 1
+        assert second.metadata["cache_hit"]
+        assert second.results == first.results
+        assert first.results["total_blocks"] == 4
+
+
+class TestCVResultCache:
+    """Test the persistent result cache."""
+    
+    def test_results_persist_across_instances(self, tmp_path):
+        """Results are keyed by content hash, operation and model id."""
+        cache = CVResultCache(tmp_path / "cache.sqlite")
+        cache.put("abc", "detect", "model-a", {"total_objects": 2, "shape": (10, 10, 3)})
+        cache.close()
+        
+        reopened = CVResultCache(tmp_path / "cache.sqlite")
+        assert reopened.get("abc", "detect", "model-a") == {"total_objects": 2, "shape": [10, 10, 3]}
+        assert reopened.get("abc", "detect", "model-b") is None
+        assert reopened.get("abc", "features") is None
+    
+    def test_size_bounded_lru_eviction(self, tmp_path):
+        """The least recently used entries are evicted once the size bound is exceeded."""
+        cache = CVResultCache(tmp_path / "cache.sqlite", max_bytes=250)
+        for key in ["a", "b", "c"]:
+            cache.put(key, "features", "", {"payload": "x" * 60})
+        cache.get("a", "features")
+        cache.put("d", "features", "", {"payload": "x" * 60})
+        
+        assert cache.get("b", "features") is None
+        assert cache.get("a", "features") is not None
+        stats = cache.get_stats()
+        assert stats["total_bytes"] <= 250
+        assert stats["evictions"] == 1
+    
+    def test_hits_do_not_write(self, tmp_path):
+        """Access times of hits are buffered and only written with the next put or close."""
+        cache = CVResultCache(tmp_path / "cache.sqlite")
+        cache.put("abc", "features", "", {"brightness": 1.0})
+        writes = cache._conn.total_changes
+        
+        for _ in range(10):
+            assert cache.get("abc", "features") == {"brightness": 1.0}
+        
+        assert cache._conn.total_changes == writes
+        cache.close()
+    
+    def test_results_of_older_versions_are_not_served(self, tmp_path, monkeypatch):
+        """Bumping an operation's result version invalidates its cached results."""
+        cache = CVResultCache(tmp_path / "cache.sqlite")
+        cache.put("abc", "analyze", "model-a", {"summary": "old"})
+        
+        monkeypatch.setitem(CVResultCache.RESULT_VERSIONS, "analyze", 99)
+        
+        assert cache.get("abc", "analyze", "model-a") is None
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_image_served_from_cache(self, tmp_path):
+        """Re-processing an unchanged image skips decoding entirely."""
+        cv_api = ComputerVisionAPI(cache_path=tmp_path / "cache.sqlite")
+        image_path = tmp_path / "image.png"
+        await cv_api.processor.save_image(np.random.randint(0, 255, (40, 40, 3), dtype=np.uint8), image_path)
+        
+        first = await cv_api.process_image(image_path, ["features"])
+        
+        async def fail(*args, **kwargs):
+            raise AssertionError("image decoded again")
+        cv_api.processor.load_image = fail
+        second = await cv_api.process_image(image_path, ["features"])
+        
+        assert second["cache_hit"]
+        assert second["results"]["features"]["brightness"] == first["results"]["features"]["brightness"]
+        assert second["results"]["features"]["shape"] == first["results"]["features"]["shape"] == (40, 40, 3)
+
+
 class TestComputerVisionAPI:
     """Test the main ComputerVisionAPI class."""
     
     @pytest.fixture
-    def cv_api(self):
+    def cv_api(self, tmp_path):
         """Create a ComputerVisionAPI instance for testing."""
-        return ComputerVisionAPI()
+        return ComputerVisionAPI(cache_path=tmp_path / "cv_cache.sqlite")
     
     @pytest.fixture
     def sample_image(self):
@@ -278,6 +513,26 @@ class TestComputerVisionAPI:
         assert len(results) == 2
         for result in results:
             assert "error" in result
+    
+    @pytest.mark.asyncio
+    async def test_batch_process_streams_in_order(self, cv_api, tmp_path):
+        """Batched results stream in input order and match single-image features."""
+        image_paths = []
+        for i in range(10):
+            image = np.random.randint(0, 255, (40 + i % 3, 50, 3), dtype=np.uint8)
+            image_path = tmp_path / f"image_{i}.png"
+            await cv_api.processor.save_image(image, image_path)
+            image_paths.append(str(image_path))
+        image_paths.insert(3, "nonexistent.jpg")
+        
+        streamed = [item async for item in cv_api.iter_batch_process(image_paths, ["features"], batch_size=4)]
+        
+        assert [item["image_path"] for item in streamed] == image_paths
+        assert "error" in streamed[3]
+        single = await cv_api.process_image(image_paths[0], ["features"])
+        batched = streamed[0]["result"]["results"]["features"]
+        assert batched["color_mean"] == pytest.approx(single["results"]["features"]["color_mean"])
+        assert batched["histogram"] == single["results"]["features"]["histogram"]
 
 
 class TestIntegration:
@@ -296,7 +551,7 @@ class TestIntegration:
         assert success
         
         # Process it through the full pipeline
-        cv_api = ComputerVisionAPI()
+        cv_api = ComputerVisionAPI(cache_path=tmp_path / "cv_cache.sqlite")
         result = await cv_api.process_image(str(image_path), ["features", "detect"])
         
         # Check that processing was successful
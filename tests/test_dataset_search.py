@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test Dataset Search: Resident BM25 Index
+
+This test suite validates ranking, filter postings and on-disk change
+detection of the dataset search index, that the code datasets serve
+queries from it without re-reading their JSON files, and the concurrent
+federated search of CodeDatasetManager.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.datasets import CodeChallengesDataset, CodeDatasetManager, FrameworkDocsDataset, GitHubCodeDataset
+from atles.datasets.github_code import GitHubCodeExample
+from atles.datasets.search_index import DatasetSearchIndex
+
+
+DOCUMENTS = [
+    {"id": "a", "title": "Binary search", "description": "Search a sorted array",
+     "language": "python", "difficulty": "easy", "tags": ["array", "search"]},
+    {"id": "b", "title": "Merge intervals", "description": "Merge overlapping intervals after sorting",
+     "language": "python", "difficulty": "medium", "tags": ["array", "sorting"]},
+    {"id": "c", "title": "Binary tree search", "description": "Search a binary search tree",
+     "language": "java", "difficulty": "easy", "tags": ["tree", "search"]},
+]
+
+
+class TestDatasetSearchIndex(unittest.TestCase):
+    """Test the index on its own."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.data_file = Path(self.directory) / "sample_data.json"
+        self._write(DOCUMENTS)
+        self.index = DatasetSearchIndex(
+            self.data_file,
+            field_weights={"title": 0.5, "description": 0.3, "tags": 0.2},
+            filter_fields=("language", "difficulty", "tags")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, documents):
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            json.dump(documents, f)
+
+    def test_results_are_ranked_by_relevance(self):
+        """Documents matching more query terms, more often, rank first."""
+        results = self.index.search("binary search")
+
+        self.assertEqual([r["id"] for r in results], ["c", "a"])
+        self.assertGreater(results[0]["relevance_score"], results[1]["relevance_score"])
+        self.assertLessEqual(results[0]["relevance_score"], 1.0)
+        self.assertEqual([r["id"] for r in self.index.search("sort")], ["b", "a"])
+        self.assertEqual(self.index.search("quaternion"), [])
+
+    def test_filters_use_postings(self):
+        """Exact-match and tag filters narrow the candidates."""
+        self.assertEqual([r["id"] for r in self.index.search("search", {"language": "JAVA"})], ["c"])
+        self.assertEqual([r["id"] for r in self.index.search("", {"difficulty": "easy"}, tags=["array"])], ["a"])
+        self.assertEqual(len(self.index.search("", tags=["tree", "sorting"])), 2)
+        self.assertEqual(self.index.search("search", {"language": "rust"}), [])
+        with self.assertRaises(ValueError):
+            self.index.search("search", {"category": "x"})
+
+    def test_rebuilds_only_when_file_changes(self):
+        """Repeated queries reuse the index; rewriting the file rebuilds it."""
+        self.index.search("search")
+        with patch("atles.datasets.search_index.json.load", side_effect=AssertionError("reloaded")):
+            for _ in range(5):
+                self.index.search("binary", {"language": "python"})
+        self.assertEqual(self.index.builds, 1)
+
+        self._write(DOCUMENTS + [{"id": "d", "title": "Quaternion rotation", "language": "python", "tags": []}])
+        self.assertEqual([r["id"] for r in self.index.search("quaternion")], ["d"])
+        self.assertEqual(self.index.builds, 2)
+
+    def test_results_do_not_alias_indexed_documents(self):
+        """Callers get copies; mutating a result leaves the index intact."""
+        result = self.index.search("binary")[0]
+        result["title"] = "changed"
+        self.assertNotIn("relevance_score", self.index.documents[2])
+        self.assertEqual(self.index.search("binary")[0]["title"], "Binary tree search")
+
+
+class TestCodeDatasetSearch(unittest.TestCase):
+    """Test the datasets' search through the index."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_dataset_search_keeps_filters(self):
+        """Dataset filters map onto the index postings."""
+        github = GitHubCodeDataset(Path(self.directory) / "github")
+        flask = github.search("flask")
+        self.assertEqual(flask[0]["id"], "python_flask_rest_api")
+        self.assertEqual(github.search("flask", language="javascript"), [])
+
+        challenges = CodeChallengesDataset(Path(self.directory) / "challenges")
+        self.assertEqual(challenges.search("array", difficulty="easy")[0]["id"], "two_sum")
+        self.assertEqual(challenges.search("array", difficulty="hard"), [])
+
+        frameworks = FrameworkDocsDataset(Path(self.directory) / "frameworks")
+        self.assertTrue(frameworks.search("", framework="fastapi"))
+
+    def test_added_example_is_searchable(self):
+        """add_example invalidates the index."""
+        github = GitHubCodeDataset(Path(self.directory) / "github")
+        github.search("allocator")
+        github.add_example(GitHubCodeExample(
+            id="zig_allocator", repository="ziglang/zig", file_path="lib/std/heap.zig",
+            language="zig", code="const arena = std.heap.ArenaAllocator;",
+            description="Arena allocator in zig", tags=["memory"], stars=1000, forks=10,
+            last_updated=datetime(2024, 1, 1), url="https://github.com/ziglang/zig"
+        ))
+
+        self.assertEqual([r["id"] for r in github.search("allocator", language="zig")], ["zig_allocator"])
+
+
+class TestFederatedSearch(unittest.TestCase):
+    """Test concurrent fan-out, deadlines and early return."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.manager = CodeDatasetManager(self.directory, source_timeout=0.3)
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _slow(self, dataset, delay, hits=None):
+        def search(query, **filters):
+            time.sleep(delay)
+            return hits if hits is not None else []
+        dataset.search = search
+
+    def test_merged_results_match_sequential_search(self):
+        """All sources are merged by relevance, with filters passed by name."""
+        expected = []
+        for name in CodeDatasetManager.DATASET_TYPES:
+            expected.extend(self.manager.search_code("python", dataset_type=name))
+        expected.sort(key=lambda x: x["relevance_score"], reverse=True)
+
+        self.assertEqual([r["id"] for r in self.manager.search_code("python")], [r["id"] for r in expected])
+        self.assertEqual(
+            [r["id"] for r in self.manager.search_code("api", language="javascript")],
+            ["javascript_react_hooks", "react_hooks_state_management"]
+        )
+
+        top = self.manager.federated_search("python", k=3, min_score=1.0)
+        self.assertEqual([r["id"] for r in top.results], [r["id"] for r in expected[:3]])
+        self.assertEqual(len(top.completed_sources), 4)
+
+    def test_slow_and_failing_sources_are_dropped(self):
+        """Sources run concurrently; a late source is abandoned at its deadline."""
+        self._slow(self.manager.programming_books, 0.2, [{"id": "book", "relevance_score": 0.4}])
+        self._slow(self.manager.code_challenges, 0.2, [{"id": "challenge", "relevance_score": 0.3}])
+        self._slow(self.manager.framework_docs, 2.0)
+        self.manager.github_code.search = lambda query, **filters: 1 / 0
+
+        start = time.perf_counter()
+        outcome = self.manager.federated_search("python", k=None)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual([r["id"] for r in outcome.results], ["book", "challenge"])
+        self.assertEqual(outcome.timed_out_sources, ["framework_docs"])
+        self.assertEqual(outcome.failed_sources, ["github_code"])
+
+    def test_search_code_waits_for_slow_sources_by_default(self):
+        """search_code keeps a source slower than source_timeout unless given a timeout."""
+        self._slow(self.manager.framework_docs, 0.5, [{"id": "late", "relevance_score": 0.9}])
+
+        self.assertIn("late", [r["id"] for r in self.manager.search_code("python")])
+
+        with self.assertLogs("atles.datasets.dataset_manager", level="WARNING") as logs:
+            partial = self.manager.search_code("python", timeout=0.1)
+        self.assertNotIn("late", [r["id"] for r in partial])
+        self.assertTrue(any("framework_docs" in message for message in logs.output))
+
+    def test_returns_early_once_k_good_hits_exist(self):
+        """Slow sources are skipped when the fast ones already fill k."""
+        self._slow(self.manager.code_challenges, 1.0)
+        self._slow(self.manager.framework_docs, 1.0)
+        self.manager.programming_books.search = lambda query, **filters: [{"id": "weak", "relevance_score": 0.1}]
+
+        outcome = self.manager.federated_search("flask", k=1, min_score=0.5, timeout=5)
+
+        self.assertLess(outcome.elapsed, 0.5)
+        self.assertEqual([r["id"] for r in outcome.results], ["python_flask_rest_api"])
+        self.assertEqual(outcome.skipped_sources, ["code_challenges", "framework_docs"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -22,6 +22,7 @@ from atles.brain.metacognitive_observer import (
     PerformanceSnapshot,
     ConsciousnessMetrics
 )
+from atles.brain.telemetry_store import TelemetryStore
 
 class TestMetacognitiveWorkflows(unittest.TestCase):
     """Test the self-analysis workflow capabilities."""
@@ -322,6 +323,146 @@ class TestMetacognitiveWorkflows(unittest.TestCase):
         self.assertIn("executed_at", latest_entry)
         self.assertIn("confidence_score", latest_entry)
 
+class TestTelemetryStore(unittest.TestCase):
+    """Test the bounded telemetry store behind the observer."""
+    
+    def test_ring_buffer_is_bounded(self):
+        """Raw samples are capped at capacity while lifetime aggregates keep counting."""
+        store = TelemetryStore(capacity=8)
+        for i in range(100):
+            store.record("safety_score", float(i), timestamp=1_000_000 + i)
+        
+        self.assertEqual(store.recent("safety_score"), [float(i) for i in range(92, 100)])
+        self.assertEqual(store.latest("safety_score"), 99.0)
+        summary = store.summary("safety_score")
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["min"], 0.0)
+        self.assertEqual(summary["max"], 99.0)
+    
+    def test_minute_and_hour_rollups(self):
+        """Samples are pre-aggregated into per-minute and per-hour buckets."""
+        store = TelemetryStore(capacity=16, rollup_buckets={"1m": 3})
+        base = 3600 * 1000
+        for minute in range(5):
+            store.record("response_time", 1.0, timestamp=base + minute * 60)
+            store.record("response_time", 3.0, timestamp=base + minute * 60 + 30)
+        
+        minutes = store.rollups("response_time", "1m")
+        self.assertEqual(len(minutes), 3)
+        self.assertEqual([b["start"] for b in minutes], [base + 120, base + 180, base + 240])
+        self.assertTrue(all(b["count"] == 2 and b["mean"] == 2.0 for b in minutes))
+        
+        hours = store.rollups("response_time", "1h")
+        self.assertEqual(len(hours), 1)
+        self.assertEqual(hours[0]["count"], 10)
+        self.assertEqual(hours[0]["max"], 3.0)
+    
+    def test_observer_memory_stays_bounded(self):
+        """Long-running tracking keeps a fixed number of performance records."""
+        brain = ATLESBrain(user_id="telemetry_user", safety_enabled=True)
+        observer = MetacognitiveObserver(atles_brain=brain, max_performance_logs=20, telemetry_capacity=32)
+        observer.connect_to_brain(brain)
+        observer.start_observation()
+        
+        for _ in range(200):
+            observer.track_performance_metrics({"type": "chat", "success_rate": 1.0, "response_time": 0.2})
+        
+        self.assertEqual(len(observer.performance_logs), 20)
+        self.assertEqual(observer.telemetry.total_records, 400)
+        self.assertEqual(len(observer.telemetry.recent("response_time")), 32)
+        self.assertEqual(observer.get_integration_status()["total_snapshots"], 400)
+        
+        result = observer.execute_self_analysis_workflow("performance_audit")
+        self.assertIn("Performance is highly stable", result.insights)
+
+
+class TestSharedBrainComponents(unittest.TestCase):
+    """Test lightweight ATLESBrain construction."""
+    
+    def test_safety_rule_tables_are_shared_and_read_only(self):
+        """Core safety rule tables are shared between brains and cannot be mutated."""
+        first = ATLESBrain(user_id="shared_a")
+        second = ATLESBrain(user_id="shared_b", shared_components=True)
+        
+        self.assertIsNot(first.safety_rules, second.safety_rules)
+        self.assertIs(first.safety_rules["no_harm"], second.safety_rules["no_harm"])
+        with self.assertRaises(TypeError):
+            first.safety_rules["no_harm"]["modifiable"] = True
+        self.assertTrue(second._validate_safety_system_integrity())
+    
+    def test_observer_created_lazily(self):
+        """Shared-component brains create their observer on first use."""
+        brain = ATLESBrain(user_id="lazy_user", shared_components=True)
+        
+        self.assertIsNone(brain._metacognitive_observer)
+        self.assertTrue(brain.metacognition_enabled)
+        
+        brain.track_operation_performance("analysis", True, 0.5)
+        
+        self.assertIsInstance(brain._metacognitive_observer, MetacognitiveObserver)
+        self.assertTrue(brain.get_metacognitive_status()["observer_connected"])
+    
+    def test_lazy_observer_skipped_without_safety(self):
+        """No observer is created when the safety system is disabled."""
+        brain = ATLESBrain(user_id="unsafe_user", safety_enabled=False, shared_components=True)
+        
+        self.assertFalse(brain.metacognition_enabled)
+        self.assertIsNone(brain.metacognitive_observer)
+
+
+class TestRollbackPoints(unittest.TestCase):
+    """Test delta-based rollback points."""
+    
+    def setUp(self):
+        self.brain = ATLESBrain(user_id="rollback_user")
+    
+    def _set_preference(self, name, value):
+        return self.brain.request_modification(
+            ModificationType.BEHAVIOR_PREFERENCE,
+            {"preference_name": name, "preference_value": value},
+            "rollback test"
+        )
+    
+    def test_rollback_points_are_bounded_and_share_tables(self):
+        """Retention is capped and unchanged rule tables are shared between points."""
+        for i in range(25):
+            self.assertTrue(self._set_preference(f"pref_{i}", i)["success"])
+        
+        points = list(self.brain.rollback_points)
+        self.assertEqual(len(points), self.brain.rollback_system["max_rollback_points"])
+        self.assertIs(points[0]["previous_state"]["safety_rules"],
+                      points[-1]["previous_state"]["safety_rules"])
+        self.assertEqual([change[:2] for change in points[-1]["previous_state"]["changes"]],
+                         [("behavior_preferences", "pref_24")])
+    
+    def test_automatic_rollback_restores_modified_key(self):
+        """Automatic rollback undoes the modification the point was created for."""
+        self._set_preference("tone", "formal")
+        point = self.brain._create_rollback_point(
+            ModificationType.BEHAVIOR_PREFERENCE,
+            {"preference_name": "tone", "preference_value": "casual"}
+        )
+        self.brain.behavior_preferences["tone"] = "casual"
+        
+        self.brain._trigger_automatic_rollback(point, "test")
+        
+        self.assertEqual(self.brain.behavior_preferences["tone"], "formal")
+    
+    def test_rollback_to_point_undoes_later_modifications(self):
+        """Rolling back to a point undoes it and every later modification."""
+        self._set_preference("tone", "formal")
+        target = self._set_preference("tone", "casual")
+        self._set_preference("verbosity", "high")
+        
+        result = self.brain.rollback_to_point(target["rollback_point_id"])
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(self.brain.behavior_preferences["tone"], "formal")
+        self.assertNotIn("verbosity", self.brain.behavior_preferences)
+        self.assertEqual(len(self.brain.rollback_points), 1)
+        self.assertFalse(self.brain.rollback_to_point("missing")["success"])
+
+
 class TestMetacognitiveWorkflowsIntegration(unittest.TestCase):
     """Test integration between workflows and ATLES brain."""
     
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Test Orchestrator: Plan Execution and Plan Caching
+
+This test suite validates dependency inference, concurrent execution of
+independent actions, per-action timeouts and deterministic working memory
+for the Orchestrator, and the reuse of cached plan templates.
+"""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.orchestrator import Action, ActionType, Orchestrator, PlanCache, TaskPlan, TaskStatus
+
+
+class TestParallelPlanExecution(unittest.TestCase):
+    """Test DAG execution of task plans."""
+
+    def setUp(self):
+        self.orchestrator = Orchestrator(max_workers=4)
+        self.delays = {}
+
+        def read_file(parameters):
+            time.sleep(self.delays.get(parameters["file_path"], 0.2))
+            return {"success": True, "result": f"contents of {parameters['file_path']}"}
+
+        self.orchestrator._execute_read_file = read_file
+
+    def _multi_file_plan(self):
+        reads = [
+            Action(ActionType.READ_FILE, f"Read {name}", {"file_path": name})
+            for name in ["a.py", "b.py", "c.py"]
+        ]
+        analyze = Action(ActionType.ANALYZE, "Count words", {"data": "{{previous_result}}", "analysis_type": "word_count"})
+        summary = Action(ActionType.WRITE_FILE, "Write summary", {"file_path": "out.txt", "content": "{{word_count}}"})
+        return TaskPlan("Analyze files", reads + [analyze, summary])
+
+    def test_dependency_inference(self):
+        """Placeholders and side-effecting actions become explicit dependencies."""
+        plan = self._multi_file_plan()
+        plan.infer_dependencies()
+        reads, analyze, summary = plan.actions[:3], plan.actions[3], plan.actions[4]
+
+        self.assertTrue(all(action.dependencies == [] for action in reads))
+        self.assertEqual(analyze.dependencies, [reads[2].action_id])
+        self.assertEqual(summary.dependencies, [a.action_id for a in plan.actions[:4]])
+
+    def test_independent_reads_run_concurrently(self):
+        """Independent reads overlap and memory matches sequential execution."""
+        self.orchestrator._execute_write_file = lambda parameters: {"success": True, "result": "written"}
+
+        sequential_plan = self._multi_file_plan()
+        start = time.perf_counter()
+        sequential = self.orchestrator._execute_plan(sequential_plan, max_steps=10)
+        sequential_time = time.perf_counter() - start
+
+        parallel_plan = self._multi_file_plan()
+        start = time.perf_counter()
+        parallel = self.orchestrator._execute_plan_parallel(parallel_plan, max_steps=10)
+        parallel_time = time.perf_counter() - start
+
+        self.assertTrue(sequential["success"])
+        self.assertTrue(parallel["success"])
+        self.assertLess(parallel_time, sequential_time * 0.6)
+        self.assertEqual(
+            [a.result for a in parallel_plan.actions],
+            [a.result for a in sequential_plan.actions]
+        )
+        self.assertEqual(parallel_plan.working_memory["last_result"], "written")
+        self.assertEqual(
+            list(parallel_plan.working_memory.values()),
+            list(sequential_plan.working_memory.values())
+        )
+
+    def test_working_memory_is_merged_in_plan_order(self):
+        """Completion order does not change the merged working memory."""
+        self.delays = {"a.py": 0.3, "b.py": 0.1, "c.py": 0.0}
+        plan = TaskPlan("Read files", [
+            Action(ActionType.READ_FILE, f"Read {name}", {"file_path": name})
+            for name in ["a.py", "b.py", "c.py"]
+        ])
+
+        self.orchestrator._execute_plan_parallel(plan, max_steps=10)
+
+        keys = list(plan.working_memory)
+        self.assertEqual(keys[0], f"action_{plan.actions[0].action_id}")
+        self.assertEqual(plan.working_memory["last_result"], "contents of c.py")
+
+    def test_timeout_cancels_plan_on_fatal_failure(self):
+        """A timed-out critical action fails and in-flight actions are cancelled."""
+        self.delays = {"slow.py": 1.0, "other.py": 1.0}
+        slow = Action(ActionType.READ_FILE, "Read slow", {"file_path": "slow.py"}, timeout=0.1)
+        other = Action(ActionType.READ_FILE, "Read other", {"file_path": "other.py"})
+        later = Action(ActionType.ANALYZE, "Analyze", {"data": "{{previous_result}}"})
+        plan = TaskPlan("Timeout", [slow, other, later])
+
+        start = time.perf_counter()
+        result = self.orchestrator._execute_plan_parallel(plan, max_steps=10)
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertFalse(result["success"])
+        self.assertEqual(slow.status, TaskStatus.FAILED)
+        self.assertIn("timed out", slow.error)
+        self.assertEqual(other.status, TaskStatus.CANCELLED)
+        self.assertEqual(later.status, TaskStatus.PENDING)
+        self.assertEqual(result["cancelled_actions"], 1)
+
+    def test_non_fatal_failure_does_not_block_later_actions(self):
+        """Actions after a non-fatal failure still run, as they do sequentially."""
+        self.orchestrator._execute_write_file = lambda parameters: {"success": False, "error": "disk full"}
+
+        def plan():
+            return TaskPlan("Write then analyze", [
+                Action(ActionType.READ_FILE, "Read a.py", {"file_path": "a.py"}),
+                Action(ActionType.WRITE_FILE, "Write copy", {"file_path": "b.py", "content": "{{previous_result}}"}),
+                Action(ActionType.ANALYZE, "Count words", {"data": "{{previous_result}}", "analysis_type": "word_count"}),
+                Action(ActionType.READ_FILE, "Read c.py", {"file_path": "c.py"})
+            ])
+
+        sequential_plan, parallel_plan = plan(), plan()
+        sequential = self.orchestrator._execute_plan(sequential_plan, max_steps=10)
+        parallel = self.orchestrator._execute_plan_parallel(parallel_plan, max_steps=10)
+
+        self.assertEqual(
+            [a.status for a in parallel_plan.actions],
+            [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.COMPLETED, TaskStatus.COMPLETED]
+        )
+        self.assertEqual([a.status for a in parallel_plan.actions], [a.status for a in sequential_plan.actions])
+        self.assertEqual(parallel_plan.actions[2].result, sequential_plan.actions[2].result)
+        self.assertEqual(parallel["executed_steps"], sequential["executed_steps"])
+        self.assertEqual(parallel["failed_actions"], 1)
+
+
+
+class TestPlanCache(unittest.TestCase):
+    """Test plan template caching."""
+
+    def setUp(self):
+        self.orchestrator = Orchestrator()
+        self.read_paths = []
+        self.read_succeeds = True
+
+        def read_file(parameters):
+            self.read_paths.append(parameters["file_path"])
+            if not self.read_succeeds:
+                return {"success": False, "error": "missing"}
+            return {"success": True, "result": "one two three"}
+
+        self.orchestrator._execute_read_file = read_file
+        self.orchestrator._execute_write_file = lambda parameters: {"success": True, "result": parameters["content"]}
+
+    def test_goal_normalization(self):
+        """Goals differing only in file names, text and numbers share a signature."""
+        cache = PlanCache()
+        first, first_slots = cache.normalize_goal('Read the file named a.txt and find "alpha" 3 times')
+        second, second_slots = cache.normalize_goal('Read the file named docs/b.md and find "beta" 10 times')
+
+        self.assertEqual(first, second)
+        self.assertEqual(first_slots, {"slot_text_0": "alpha", "slot_file_0": "a.txt", "slot_number_0": "3"})
+        self.assertEqual(second_slots["slot_file_0"], "docs/b.md")
+
+    def test_repeated_goal_reuses_plan_with_new_slots(self):
+        """A repeated goal skips planning and reads the new file."""
+        with patch.object(self.orchestrator, "_create_fallback_actions",
+                          wraps=self.orchestrator._create_fallback_actions) as planner:
+            first = self.orchestrator.execute_goal("Read the file named a.txt and count words")
+            second = self.orchestrator.execute_goal("Read the file named b.txt and count words")
+
+        self.assertEqual(planner.call_count, 1)
+        self.assertFalse(first["plan_cache_hit"])
+        self.assertTrue(second["plan_cache_hit"])
+        self.assertTrue(second["success"])
+        self.assertEqual(self.read_paths, ["a.txt", "b.txt"])
+        self.assertEqual(second["working_memory"]["last_result"], "The total word count is 3.")
+        self.assertEqual(len(second["working_memory"]), len(first["working_memory"]))
+        self.assertFalse(any(key.startswith("slot_") for key in second["working_memory"]))
+
+    def test_only_request_values_are_templatized(self):
+        """Literals that merely equal a slot value are not rewritten on reuse."""
+        cache = PlanCache()
+        signature, slots = cache.normalize_goal("Copy 3 lines of a.txt")
+        action = Action(ActionType.WRITE_FILE, "Copy a.txt", {
+            "file_path": "a.txt", "lines": "3", "content": "header 3 of a.txt", "mode": "w"
+        })
+        action.goal_parameters = ["file_path", "lines"]
+        cache.store(signature, slots, [action])
+
+        new_signature, new_slots = cache.normalize_goal("Copy 7 lines of b.txt")
+        plan = cache.get(new_signature, "Copy 7 lines of b.txt", new_slots)
+
+        self.assertEqual(plan.actions[0].parameters, {
+            "file_path": "b.txt", "lines": "7", "content": "header 3 of a.txt", "mode": "w"
+        })
+        self.assertEqual(plan.actions[0].description, "Copy b.txt")
+        self.assertEqual(plan.working_memory, {})
+
+    def test_literal_equal_to_goal_value_is_not_rebound(self):
+        """The fixed output file stays put when the goal names the same file."""
+        self.orchestrator.execute_goal("Read the file named output.txt and count words")
+        second = self.orchestrator.execute_goal("Read the file named notes.txt and count words")
+
+        self.assertTrue(second["plan_cache_hit"])
+        paths = [action["parameters"]["file_path"] for action in second["plan"]["actions"]
+                 if "file_path" in action["parameters"]]
+        self.assertEqual(paths, ["notes.txt", "output.txt"])
+
+    def test_plan_not_using_every_slot_is_not_cached(self):
+        """A goal the planner could not extract a file from does not seed the cache."""
+        self.orchestrator.execute_goal("Read the file named dir/a.txt and count words")
+        second = self.orchestrator.execute_goal("Read the file named b.txt and count words")
+
+        self.assertFalse(second["plan_cache_hit"])
+        self.assertEqual(self.read_paths, ["input.txt", "b.txt"])
+
+    def test_failing_template_is_invalidated(self):
+        """Templates whose plans keep failing are dropped from the cache."""
+        self.read_succeeds = False
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            self.orchestrator.execute_goal(f"Read the file named {name} and count words")
+
+        stats = self.orchestrator.plan_cache.get_stats()
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["invalidations"], 1)
+        self.assertEqual(stats["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test PDF Streaming: Page-Parallel Extraction and Text Caching
+
+This test suite validates page selection, in-order page streaming across
+the process pool and the per-page text cache of the PDF processor.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles import pdf_processor
+from atles.pdf_processor import (
+    PDFTextCache, configure_pdf_cache, extract_text_from_pdf, iter_pdf_pages, parse_page_spec
+)
+
+try:
+    import pdfplumber  # noqa: F401
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+
+def write_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    count = len(page_texts)
+    font_id = 3 + 2 * count
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            " ".join(f"{3 + 2 * i} 0 R" for i in range(count)), count
+        )
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class TestPageSelection(unittest.TestCase):
+    """Test page range parsing."""
+
+    def test_parse_page_spec(self):
+        """Ranges, open ends and out-of-range pages are resolved."""
+        self.assertEqual(parse_page_spec("1-3,7,10-", 12), [1, 2, 3, 7, 10, 11, 12])
+        self.assertEqual(parse_page_spec([5, 2, 2, 40], 10), [2, 5])
+        self.assertEqual(parse_page_spec(None, 3), [1, 2, 3])
+
+
+class TestPDFTextCache(unittest.TestCase):
+    """Test the bounds of the page text cache."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        configure_pdf_cache()
+
+    def _save_aged(self, cache, names):
+        """Save one entry per name, each older than the next."""
+        now = time.time()
+        for age, name in enumerate(reversed(names)):
+            cache.save(name, {1: name * 100}, 1)
+            path = cache._entry_path(name)
+            os.utime(path, (now - 100 * (age + 1), now - 100 * (age + 1)))
+
+    def test_prunes_least_recently_used_entries(self):
+        """Entries beyond max_entries are pruned, oldest use first."""
+        cache = PDFTextCache(self.directory, max_entries=3)
+        self._save_aged(cache, ["a", "b", "c"])
+        cache.load("a")  # a is now the most recently used
+        cache.save("d", {1: "d"}, 1)
+
+        self.assertEqual(cache.load("b"), {})
+        self.assertEqual(cache.load("a"), {1: "a" * 100})
+        self.assertEqual(cache.get_stats()["entries"], 3)
+
+    def test_byte_bound_and_automatic_pruning(self):
+        """Writes trigger pruning once the cache grows past its byte bound."""
+        cache = PDFTextCache(self.directory, max_entries=100, max_bytes=400)
+        for name in ["a", "b", "c", "d", "e"]:
+            cache.save(name, {1: name * 150}, 1)
+
+        self.assertLessEqual(cache.get_stats()["total_bytes"], 400)
+        self.assertEqual(cache.load("e"), {1: "e" * 150})
+
+    def test_default_cache_can_be_disabled(self):
+        """A disabled default cache is bypassed."""
+        configure_pdf_cache(enabled=False)
+        self.assertIsNone(pdf_processor._get_cache(pdf_processor.DEFAULT_CACHE_DIR))
+
+        configure_pdf_cache(max_entries=5)
+        self.assertEqual(pdf_processor._get_cache(pdf_processor.DEFAULT_CACHE_DIR).max_entries, 5)
+
+
+@unittest.skipUnless(PDFPLUMBER_AVAILABLE, "pdfplumber is not installed")
+class TestPDFStreaming(unittest.TestCase):
+    """Test streaming extraction and caching."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+        self.pdf_path = os.path.join(self.directory, "document.pdf")
+        write_pdf(self.pdf_path, [f"Page number {i}" for i in range(1, 41)])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_parallel_pages_stream_in_order(self):
+        """Large documents are extracted in a process pool and yielded in page order."""
+        pages = list(iter_pdf_pages(self.pdf_path, max_workers=2, cache_dir=None))
+
+        self.assertEqual([page["page_number"] for page in pages], list(range(1, 41)))
+        self.assertEqual(pages[0]["num_pages"], 40)
+        self.assertIn("Page number 17", pages[16]["text"])
+
+    def test_page_selection_and_cache(self):
+        """Selected pages are extracted once and later served from the cache."""
+        result = extract_text_from_pdf(self.pdf_path, pages="2-3", cache_dir=self.cache_dir)
+        self.assertEqual(result["pages_extracted"], [2, 3])
+        self.assertIn("Page number 3", result["text"])
+        self.assertNotIn("Page number 4", result["text"])
+
+        with patch("pdfplumber.page.Page.extract_text", side_effect=AssertionError("not cached")):
+            cached = list(iter_pdf_pages(self.pdf_path, pages=[3, 2], cache_dir=self.cache_dir))
+        self.assertEqual([page["text"] for page in cached][1], "Page number 3")
+
+        cache = PDFTextCache(self.cache_dir)
+        self.assertEqual(sorted(cache.load(cache.file_hash(self.pdf_path))), [2, 3])
+
+    def test_changed_file_is_not_served_from_cache(self):
+        """Rewriting the file changes its hash."""
+        list(iter_pdf_pages(self.pdf_path, pages="1", cache_dir=self.cache_dir))
+        write_pdf(self.pdf_path, ["Rewritten"])
+
+        result = extract_text_from_pdf(self.pdf_path, cache_dir=self.cache_dir)
+
+        self.assertEqual(result["text"], "Rewritten")
+        self.assertEqual(result["num_pages"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -598,6 +598,71 @@ class TestQualityFilteringIntegration(unittest.IsolatedAsyncioTestCase):
             self.assertTrue(all(a.confidence_score >= 0.5 for a in cycle.solution_attempts))
 
 
+class TestPipelinedLearningCycles(unittest.IsolatedAsyncioTestCase):
+    """Test pipelined multi-challenge learning cycles"""
+    
+    async def asyncSetUp(self):
+        with patch('atles.brain.r_zero_integration.ATLESBrain') as mock_brain_cls, \
+                patch('atles.brain.r_zero_integration.MetacognitiveObserver') as mock_obs:
+            mock_brain_cls.return_value = AsyncMock()
+            mock_obs.return_value = AsyncMock()
+            self.r_zero = MetacognitiveATLES_RZero("pipeline_user")
+        
+        # Phase 4 analytics are covered by their own tests
+        self.r_zero.metacognitive_temporal_agent = Mock()
+        self.r_zero.self_directed_curriculum = Mock()
+        self.r_zero.consciousness_level_learning = Mock()
+        self.r_zero.temporal_goal_manager = Mock()
+        
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.solve_calls = 0
+        
+        async def challenger_request(prompt, agent_type=None):
+            return "Implement a small caching layer"
+        
+        async def solver_request(prompt, agent_type=None):
+            if not prompt.startswith("Solve this challenge"):
+                return {"content": "ok", "confidence": 0.5}
+            self.solve_calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # Later calls finish first so completion order differs from generation order
+            await asyncio.sleep(0.02 / self.solve_calls)
+            self.in_flight -= 1
+            return {"content": "solution", "confidence": 0.5}
+        
+        self.r_zero.challenger_brain = AsyncMock()
+        self.r_zero.challenger_brain.process_request = AsyncMock(side_effect=challenger_request)
+        self.r_zero.solver_brain = AsyncMock()
+        self.r_zero.solver_brain.process_request = AsyncMock(side_effect=solver_request)
+    
+    async def test_cycles_are_returned_in_generation_order(self):
+        """Cycles finalize in generation order even when solvers finish out of order"""
+        cycles = await self.r_zero.run_pipelined_learning_cycles(5, pipeline_depth=2, solver_workers=3)
+        
+        self.assertEqual([c.challenge.id for c in cycles], [f"challenge_{i}" for i in range(1, 6)])
+        self.assertEqual(self.r_zero.learning_cycles, cycles)
+        self.assertGreater(self.max_in_flight, 1)
+    
+    async def test_domain_rotation_matches_sequential_mode(self):
+        """Pipelined challenges follow the same domain rotation as sequential cycles"""
+        cycles = await self.r_zero.run_pipelined_learning_cycles(4)
+        
+        expected = [ChallengeType.PROGRAMMING]
+        for _ in range(3):
+            expected.append(self.r_zero.cross_domain_generator.get_domain_rotation(expected[-1]))
+        self.assertEqual([c.challenge.type for c in cycles], expected)
+        self.assertEqual(
+            self.r_zero.current_domain,
+            self.r_zero.cross_domain_generator.get_domain_rotation(expected[-1])
+        )
+    
+    async def test_zero_cycles(self):
+        """Requesting no cycles returns immediately"""
+        self.assertEqual(await self.r_zero.run_pipelined_learning_cycles(0), [])
+
+
 class TestRZeroPhase2Components(unittest.TestCase):
     """Test Phase 2 components: Pseudo-Label Quality Control and GRPO Advantage"""
     
@@ -869,6 +934,7 @@ def run_r_zero_tests():
         TestPhase2Helpers,
         TestCurriculumEnhancements,
         TestQualityFilteringIntegration,
+        TestPipelinedLearningCycles,
         TestRZeroPhase2Components,
         TestRZeroPhase2AdvancedComponents
     ]
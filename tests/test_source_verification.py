@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Test Source Verification: Pooled HTTP Session and Verification Cache
+
+This test suite validates SourceVerifier against a local aiohttp stub
+server: one GET per URL, connection reuse through the shared session,
+per-host connection limits under high concurrency, the persistent
+verification cache with conditional revalidation, and streaming metadata
+extraction that stops reading large pages early.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles import source_verification
+from atles.source_verification import (
+    FactChecker, HTMLMetadataParser, SourceVerificationAPI, SourceVerifier, VerificationCache,
+    shutdown_source_verification, verify_sources_before_response
+)
+
+PAGE = """<html><head><title>Stub Page</title>
+<meta name="description" content="A page served by the stub server"></head>
+<body><p>This paragraph is long enough to be used as the content preview of the page.</p></body></html>"""
+
+
+class StubServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs a local stub server that records requests and connections."""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.connections = set()
+        self.open_requests = 0
+        self.max_open_requests = 0
+
+        async def page(request):
+            self.requests.append((request.method, request.path))
+            self.connections.add(request.transport.get_extra_info("peername"))
+            self.open_requests += 1
+            self.max_open_requests = max(self.max_open_requests, self.open_requests)
+            try:
+                await asyncio.sleep(0.01)
+                if request.path.startswith("/missing"):
+                    return web.Response(status=404, text="missing")
+                if request.path.startswith("/etag"):
+                    if request.headers.get("If-None-Match") == '"v1"':
+                        return web.Response(status=304, headers={"ETag": '"v1"'})
+                    return web.Response(text=PAGE, content_type="text/html", headers={"ETag": '"v1"'})
+                if request.path.startswith("/data"):
+                    return web.Response(body=b"\0" * 1024, content_type="application/octet-stream")
+                return web.Response(text=PAGE, content_type="text/html")
+            finally:
+                self.open_requests -= 1
+
+        async def endless_page(request):
+            """A huge page that trickles out; reading it all would take over 10 s."""
+            self.requests.append((request.method, request.path))
+            response = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+            await response.prepare(request)
+            await response.write(PAGE.split("<p>")[0].encode())
+            await response.write(b"<p>" + b"This streamed paragraph is long enough to become the preview. " * 2 + b"</p>")
+            filler = b"<div>" + b"x" * 8192 + b"</div>"
+            for _ in range(2000):
+                await response.write(filler)
+                await asyncio.sleep(0.005)
+                self.bytes_streamed += len(filler)
+            return response
+
+        self.bytes_streamed = 0
+        app = web.Application()
+        app.router.add_get("/huge", endless_page)
+        app.router.add_route("*", "/{tail:.*}", page)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def url(self, path):
+        return str(self.server.make_url(path))
+
+    def verifier(self, **kwargs):
+        return SourceVerifier(cache=VerificationCache(":memory:"), **kwargs)
+
+
+class TestPooledSession(StubServerTestCase):
+    """Test the shared session of SourceVerifier."""
+
+    async def test_single_get_per_url(self):
+        """HTML pages are checked and parsed with one GET; no HEAD requests."""
+        async with self.verifier() as verifier:
+            page = await verifier.verify_source(self.url("/article"))
+            missing = await verifier.verify_source(self.url("/missing"))
+            data = await verifier.verify_source(self.url("/data.bin"))
+
+        self.assertTrue(page.is_valid)
+        self.assertEqual(page.title, "Stub Page")
+        self.assertEqual(page.description, "A page served by the stub server")
+        self.assertTrue(page.content_preview.startswith("This paragraph"))
+        self.assertEqual((missing.is_valid, missing.status_code), (False, 404))
+        self.assertEqual(data.content_type, "application/octet-stream")
+        self.assertEqual([method for method, _ in self.requests], ["GET"] * 3)
+
+    async def test_connections_are_reused_and_bounded(self):
+        """Many concurrent checks share a few keep-alive connections."""
+        verifier = self.verifier(max_connections_per_host=4)
+        try:
+            urls = [self.url(f"/page/{i}") for i in range(60)]
+            results = await verifier.verify_multiple_sources(urls)
+            await verifier.verify_source(self.url("/again"))
+        finally:
+            await verifier.close()
+
+        self.assertTrue(all(result.is_valid for result in results))
+        self.assertLessEqual(self.max_open_requests, 4)
+        self.assertLessEqual(len(self.connections), 4)
+        self.assertEqual(len(self.requests), 61)
+
+    async def test_api_shares_one_verifier(self):
+        """The fact checker reuses the API's verifier and its session."""
+        api = SourceVerificationAPI(self.verifier())
+        try:
+            self.assertIs(api.fact_checker.source_verifier, api.source_verifier)
+            await api.fact_checker.check_claim("Stub pages are served locally", [self.url("/claim")])
+            await api.source_verifier.verify_source(self.url("/other"))
+        finally:
+            await api.close()
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertIsInstance(FactChecker().source_verifier, SourceVerifier)
+
+    async def test_responses_share_the_module_api(self):
+        """verify_sources_before_response reuses one API and its connections until shutdown."""
+        api = SourceVerificationAPI(self.verifier())
+        source_verification._default_verification_api = api
+        try:
+            for i in range(3):
+                result = await verify_sources_before_response(f"See {self.url(f'/response/{i}')} for details.")
+                self.assertEqual(result["status"], "verification_complete")
+            session = api.source_verifier._session
+            self.assertIs(source_verification._default_verification_api, api)
+        finally:
+            await shutdown_source_verification()
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(len(self.connections), 1)
+        self.assertTrue(session.closed)
+        self.assertIsNone(source_verification._default_verification_api)
+        self.assertEqual(api.total_verifications, 3)
+
+
+class TestVerificationCache(StubServerTestCase):
+    """Test persistent caching and conditional revalidation."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "verification.sqlite")
+
+    async def asyncTearDown(self):
+        await super().asyncTearDown()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def test_cache_survives_restart(self):
+        """A new verifier on the same database serves fresh entries without requests."""
+        async with SourceVerifier(cache=VerificationCache(self.db_path)) as verifier:
+            first = await verifier.verify_source(self.url("/article"))
+
+        async with SourceVerifier(cache=VerificationCache(self.db_path)) as verifier:
+            second = await verifier.verify_source(self.url("/article"))
+            stats = verifier.cache.get_stats()
+
+        self.assertEqual(second.to_dict(), first.to_dict())
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(stats["hits"], 1)
+
+    async def test_expired_entries_are_revalidated(self):
+        """Stale entries with an ETag cost one conditional request answered by 304."""
+        async with SourceVerifier(cache=VerificationCache(self.db_path)) as verifier:
+            verifier.cache_expiry = timedelta(seconds=0)
+            first = await verifier.verify_source(self.url("/etag"))
+            second = await verifier.verify_source(self.url("/etag"))
+            verifier.cache_expiry = timedelta(hours=1)
+            third = await verifier.verify_source(self.url("/etag"))
+            fourth = await verifier.verify_source(self.url("/etag"))
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual((second.status_code, second.title), (200, "Stub Page"))
+        self.assertEqual(third.title, first.title)
+        self.assertEqual(fourth.verification_timestamp, third.verification_timestamp)
+
+    async def test_claims_are_cached_per_source_set(self):
+        """Fact-checks are keyed by claim and sources."""
+        verifier = SourceVerifier(cache=VerificationCache(self.db_path))
+        checker = FactChecker(verifier)
+        try:
+            claim = "Stub pages are served by the local test server"
+            first = await checker.check_claim(claim, [self.url("/a")])
+            again = await checker.check_claim(claim, [self.url("/a")])
+            other = await checker.check_claim(claim, [self.url("/b")])
+        finally:
+            await verifier.close()
+
+        self.assertEqual(again.to_dict(), first.to_dict())
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(other.supporting_sources[0].url if other.supporting_sources
+                         else other.contradicting_sources[0].url, self.url("/b"))
+
+    def test_cache_is_bounded(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = VerificationCache(":memory:", max_entries=3)
+        for i in range(3):
+            cache.put("source", f"url{i}", {"i": i}, ttl=60)
+        cache.get("source", "url0")
+        cache.put("source", "url3", {"i": 3}, ttl=60)
+
+        self.assertIsNone(cache.get("source", "url1"))
+        self.assertEqual(cache.get("source", "url0").value, {"i": 0})
+        self.assertEqual(cache.get_stats()["entries"], 3)
+
+
+class TestStreamingMetadata(StubServerTestCase):
+    """Test incremental HTML metadata extraction."""
+
+    async def test_large_page_transfer_is_cut_short(self):
+        """Metadata of a huge page is read from its first chunks only."""
+        start = time.perf_counter()
+        async with SourceVerifier(cache=VerificationCache(":memory:")) as verifier:
+            result = await verifier.verify_source(self.url("/huge"))
+
+        self.assertLess(time.perf_counter() - start, 3.0)
+        self.assertEqual(result.title, "Stub Page")
+        self.assertEqual(result.description, "A page served by the stub server")
+        self.assertTrue(result.content_preview.startswith("This streamed paragraph"))
+        self.assertLess(self.bytes_streamed, 2 * 1024 * 1024)
+
+    def test_parser_handles_real_world_markup(self):
+        """Attribute order, entities, scripts and budgets are handled."""
+        parser = HTMLMetadataParser()
+        parser.feed('<html><head><meta content="Tom &amp; Jerry" NAME="Description">'
+                    '<title> Cats &amp; Mice </title><script>var p = "<p>not text</p>";</script>')
+        self.assertFalse(parser.done)
+        parser.feed('</head><body><p>short</p><p>' + 'A paragraph with <b>markup</b> inside. ' * 8)
+        self.assertFalse(parser.done)
+        parser.feed('</p>')
+
+        self.assertTrue(parser.done)
+        self.assertEqual((parser.title, parser.description), ("Cats & Mice", "Tom & Jerry"))
+        self.assertTrue(parser.content_preview.startswith("A paragraph with markup inside."))
+        self.assertTrue(parser.content_preview.endswith("..."))
+
+        head_only = HTMLMetadataParser(want_preview=False)
+        head_only.feed("<head><title>T</title></head>")
+        self.assertTrue(head_only.done)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test Advanced Tools: Tool Chains and Result Caching
+
+This test suite validates that parallel tool chain execution runs
+independent steps concurrently while keeping the sequential semantics of
+conditions, fallbacks and failures, and that pure tools memoize results.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add the atles package to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from atles.tools import AdvancedTool, AdvancedToolRegistry, ToolChain, ToolResultCache
+
+
+class TestToolChainExecution(unittest.IsolatedAsyncioTestCase):
+    """Test ToolChain execution modes."""
+
+    def setUp(self):
+        self.registry = AdvancedToolRegistry()
+        self.calls = []
+
+        def slow_echo(value: str) -> str:
+            time.sleep(0.2)
+            self.calls.append(value)
+            return value
+
+        def failing_tool(value: str) -> str:
+            raise RuntimeError(f"cannot process {value}")
+
+        def recover(value: str) -> dict:
+            return {"recovered": value}
+
+        for name, function in [("slow_echo", slow_echo), ("failing_tool", failing_tool), ("recover", recover)]:
+            self.registry.register_tool(AdvancedTool(name=name, description=name, function=function))
+
+    async def _run_both(self, chain):
+        sequential = await chain.execute(self.registry, {"mode": "test"}, "user", "session")
+        parallel = await chain.execute(self.registry, {"mode": "test"}, "user", "session", parallel=True)
+        return sequential, parallel
+
+    async def test_independent_steps_run_concurrently(self):
+        """Independent steps finish in critical-path time with step-ordered results."""
+        chain = ToolChain("independent", "Independent", "Three unrelated steps")
+        for value in ["a", "b", "c"]:
+            chain.add_step("slow_echo", {"value": value})
+
+        sequential, parallel = await self._run_both(chain)
+
+        self.assertTrue(parallel["success"])
+        self.assertGreaterEqual(sequential["execution_time"], 0.6)
+        self.assertLess(parallel["execution_time"], 0.45)
+        self.assertEqual(
+            [record["result"] for record in parallel["steps_executed"]],
+            [record["result"] for record in sequential["steps_executed"]]
+        )
+        self.assertEqual(parallel["final_result"], sequential["final_result"])
+
+    async def test_dependencies_inferred_from_step_references(self):
+        """A condition on an earlier step's result orders the steps."""
+        chain = ToolChain("dependent", "Dependent", "Second step waits for the first")
+        first = chain.add_step("slow_echo", {"value": "first"})
+        second = chain.add_conditional_step("slow_echo", {"value": "second"}, f"step_{first}_result == first")
+        skipped = chain.add_conditional_step("slow_echo", {"value": "never"}, f"step_{first}_result == other")
+        independent = chain.add_step("slow_echo", {"value": "independent"})
+
+        dependencies = chain.get_dependencies()
+        self.assertEqual(dependencies[second], [first])
+        self.assertEqual(dependencies[skipped], [first])
+        self.assertEqual(dependencies[independent], [])
+
+        result = await chain.execute(self.registry, {}, "user", "session", parallel=True)
+
+        self.assertEqual([r["status"] for r in result["steps_executed"]], ["success", "success", "skipped", "success"])
+        self.assertLess(self.calls.index("first"), self.calls.index("second"))
+        self.assertLess(result["execution_time"], 0.6)
+
+    async def test_fallbacks_and_failures_match_sequential(self):
+        """Fallback updates and fatal failures behave as in sequential execution."""
+        chain = ToolChain("failures", "Failures", "Fallback then fatal failure")
+        recovered = chain.add_step("failing_tool", {"value": "x"})
+        chain.add_error_handling(recovered, "error", "recover", {"value": "fallback"})
+        chain.add_conditional_step("slow_echo", {"value": "after_fallback"}, "recovered == fallback")
+        chain.add_step("failing_tool", {"value": "fatal"})
+        chain.add_step("slow_echo", {"value": "never"})
+
+        sequential, parallel = await self._run_both(chain)
+
+        for result in (sequential, parallel):
+            self.assertFalse(result["success"])
+            self.assertEqual([r["status"] for r in result["steps_executed"]], ["fallback_executed", "success"])
+            self.assertEqual(result["final_result"]["recovered"], "fallback")
+            self.assertEqual(len(result["errors"]), 2)
+        self.assertEqual(parallel["errors"], sequential["errors"])
+        self.assertEqual(parallel["final_result"], sequential["final_result"])
+
+    async def test_registered_tools_use_registry_validator(self):
+        """Safety rules added to the registry apply to its tools."""
+        self.registry.validator.add_safety_rule(
+            "no_secrets", lambda tool_name, params: {"safe": params.get("value") != "secret", "reason": "secret"}
+        )
+        tool = self.registry.get_tool("slow_echo")
+
+        result = await tool.execute({"value": "secret"}, "user", "session")
+
+        self.assertIs(tool.validator, self.registry.validator)
+        self.assertFalse(result.success)
+
+
+class TestToolResultCache(unittest.IsolatedAsyncioTestCase):
+    """Test result memoization for cacheable tools."""
+
+    def setUp(self):
+        self.calls = 0
+
+        def word_count(text: str, unit: str = "words") -> int:
+            self.calls += 1
+            return len(text.split())
+
+        self.registry = AdvancedToolRegistry()
+        self.tool = AdvancedTool(name="word_count", description="Count words", function=word_count,
+                                 cacheable=True, cache_size=2)
+        self.registry.register_tool(self.tool)
+
+    async def test_repeated_calls_are_served_from_cache(self):
+        """Equal parameters hit the cache regardless of key order."""
+        first = await self.tool.execute({"text": "a b c", "unit": "words"}, "user", "session")
+        second = await self.tool.execute({"unit": "words", "text": "a b c"}, "user", "session")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second.result, 3)
+        self.assertFalse(first.metadata["cache_hit"])
+        self.assertTrue(second.metadata["cache_hit"])
+
+        stats = self.tool.get_info()["cache_stats"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(self.tool.get_info()["usage_stats"]["successful_executions"], 2)
+
+    async def test_cache_is_bounded_and_invalidated_by_rule_changes(self):
+        """The LRU entry is evicted and new safety rules bypass cached results."""
+        for text in ["one", "two", "three"]:
+            await self.tool.execute({"text": text}, "user", "session")
+        await self.tool.execute({"text": "one"}, "user", "session")
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(self.tool.get_info()["cache_stats"]["evictions"], 2)
+
+        self.registry.validator.add_safety_rule(
+            "no_three", lambda tool_name, params: {"safe": params.get("text") != "three"}
+        )
+        blocked = await self.tool.execute({"text": "three"}, "user", "session")
+        self.assertFalse(blocked.success)
+
+    def test_entries_expire_after_ttl(self):
+        """Expired entries count as misses."""
+        cache = ToolResultCache(max_size=4, ttl=0.0)
+        key = cache.make_key({"text": "x"})
+        cache.put(key, 1)
+        time.sleep(0.01)
+
+        self.assertEqual(cache.get(key), (False, None))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+    def test_builtin_pure_tools_are_cacheable(self):
+        """Built-in text tools opt in to caching."""
+        self.assertTrue(self.registry.get_tool("text_analyzer").get_info()["cacheable"])
+        self.assertIsNone(AdvancedTool("plain", "plain", len).get_info()["cache_stats"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)